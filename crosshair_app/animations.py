@@ -7,6 +7,8 @@ import time
 import math
 import colorsys
 
+from .config import AnimationSnapshot, snapshot_of
+
 
 class AnimationEngine:
     """Produces per-frame animation state for the crosshair renderer."""
@@ -25,12 +27,12 @@ class AnimationEngine:
         self._recoil_active = True
         self._recoil_start = time.time()
 
-    def get_state(self, anim_config: dict) -> dict:
+    def get_state(self, anim_config) -> dict:
         """
         Calculate the current animation state.
 
         Args:
-            anim_config: Animation config dict with keys: enabled, type, speed, intensity
+            anim_config: AnimationSnapshot, or a dict with keys: enabled, type, speed, intensity
 
         Returns:
             Dict with keys: size_mult, rotation, gap_offset, opacity, color_override
@@ -43,12 +45,15 @@ class AnimationEngine:
             "color_override": None,
         }
 
-        if not anim_config.get("enabled", True):
+        if isinstance(anim_config, dict):
+            # A bare dict without "type" has always meant no animation
+            anim_config = snapshot_of(AnimationSnapshot, {"type": "none", **anim_config})
+        if not anim_config.enabled:
             return state
 
-        anim_type = anim_config.get("type", "none")
-        speed = anim_config.get("speed", 1.0)
-        intensity = anim_config.get("intensity", 0.3)
+        anim_type = anim_config.type
+        speed = anim_config.speed
+        intensity = anim_config.intensity
 
         if anim_type == "none":
             return state
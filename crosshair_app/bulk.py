@@ -0,0 +1,211 @@
+"""
+Bulk profile import/export for CrosshairX.
+Moves whole profile libraries in and out as zip archives or plain
+directories. Entries are streamed one at a time, so an archive is never
+read into memory as a whole; imported entries are validated, normalized
+and written on a small thread pool, and the profile index learns about
+the new files in one batch at the end.
+"""
+
+import json
+import os
+import posixpath
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, NamedTuple
+
+from .packs import valid_profile_name
+from .profiles import ProfileIndex
+from .schema import normalize_profile
+
+
+CONFLICT_POLICIES = ("skip", "overwrite", "rename")
+MAX_ENTRY_BYTES = 256 * 1024   # A profile is a few hundred bytes; bigger is not a profile
+WORKERS = min(4, os.cpu_count() or 1)
+_IN_FLIGHT = WORKERS * 16      # Entries read but not yet written (bounds memory)
+
+
+class BulkResult(NamedTuple):
+    """Outcome of a bulk import/export."""
+    written: list          # Profile names
+    skipped: int           # Conflicts left alone by the policy
+    failed: list           # [(entry, reason)]
+    cancelled: bool
+
+
+def _source_entries(source: Path) -> tuple:
+    """(total, iterator of (entry, profile name, read())) for a zip or a directory."""
+    if source.is_dir():
+        files = sorted(e.name for e in os.scandir(source)
+                       if e.name.endswith(".json") and e.is_file())
+
+        def read_file(file_name):
+            with open(source / file_name, "rb") as f:
+                return f.read(MAX_ENTRY_BYTES + 1)
+
+        return len(files), ((f, f[:-5], lambda f=f: read_file(f)) for f in files)
+
+    archive = zipfile.ZipFile(source)
+    infos = [i for i in archive.infolist() if not i.is_dir() and i.filename.endswith(".json")]
+
+    def read_entry(info):
+        with archive.open(info) as f:
+            return f.read(MAX_ENTRY_BYTES + 1)  # Never trust the header's size
+
+    def entries():
+        with archive:
+            for info in infos:
+                name = posixpath.basename(info.filename)[:-5]
+                yield info.filename, name, lambda info=info: read_entry(info)
+
+    return len(infos), entries()
+
+
+def _write_profile(path: Path, data: bytes):
+    """Validate + normalize one entry and write it atomically."""
+    if len(data) > MAX_ENTRY_BYTES:
+        raise ValueError("entry too large")
+    profile = normalize_profile(json.loads(data))
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(profile, f, indent=2)
+    os.replace(tmp, path)
+
+
+def _progress_step(total: int) -> int:
+    return max(1, total // 200)
+
+
+def import_profiles(source, index: ProfileIndex, policy: str = "skip",
+                    progress: Callable[[int, int], None] = None,
+                    cancel: threading.Event = None) -> BulkResult:
+    """
+    Import every ``*.json`` profile from a zip archive or directory into
+    the index's directory. ``policy`` decides what happens when a name is
+    taken: "skip" it, "overwrite" it, or "rename" the newcomer to name-2.
+    """
+    if policy not in CONFLICT_POLICIES:
+        raise ValueError(f"Unknown conflict policy: {policy}")
+    total, entries = _source_entries(Path(source))
+    taken = set(index.names())
+    claimed = set()                 # Names this import writes
+    written, failed = [], []
+    skipped = done = 0
+    step = _progress_step(total)
+    lock = threading.Lock()
+    slots = threading.BoundedSemaphore(_IN_FLIGHT)
+
+    def finished(future, entry, name):
+        nonlocal done
+        error = future.exception()
+        with lock:
+            if error is None:
+                written.append(name)
+            else:
+                failed.append((entry, str(error)))
+            done += 1
+            report = progress is not None and done % step == 0
+        slots.release()
+        if report:
+            progress(done, total)
+
+    def resolve(name):
+        """Target name for an entry under the conflict policy; None to skip it."""
+        if name not in taken:
+            return name
+        if policy == "skip" or (policy == "overwrite" and name in claimed):
+            return None  # Duplicates inside the source: first one wins
+        if policy == "overwrite":
+            return name
+        n = 2
+        while f"{name}-{n}" in taken:
+            n += 1
+        return f"{name}-{n}"
+
+    with index.hold():
+        pool = ThreadPoolExecutor(WORKERS, thread_name_prefix="cx-import")
+        try:
+            for entry, name, read in entries:
+                if cancel is not None and cancel.is_set():
+                    break
+                error = None if valid_profile_name(name) else "invalid profile name"
+                target = resolve(name) if error is None else None
+                data = None
+                if target is not None:
+                    taken.add(target)
+                    claimed.add(target)
+                    try:
+                        data = read()
+                    except (OSError, zipfile.BadZipFile) as e:
+                        error = str(e)
+                if data is None:
+                    with lock:
+                        if error is None:
+                            skipped += 1
+                        else:
+                            failed.append((entry, error))
+                        done += 1
+                    continue
+                slots.acquire()
+                future = pool.submit(_write_profile, index.directory / f"{target}.json", data)
+                future.add_done_callback(lambda f, e=entry, t=target: finished(f, e, t))
+        finally:
+            entries.close()
+            pool.shutdown(wait=True)
+        index.add_many(written)
+
+    if progress is not None:
+        progress(done, total)
+    written.sort()
+    return BulkResult(written, skipped, failed, cancel is not None and cancel.is_set())
+
+
+def export_profiles(index: ProfileIndex, target, names=None,
+                    progress: Callable[[int, int], None] = None,
+                    cancel: threading.Event = None) -> BulkResult:
+    """
+    Export profiles (all, or ``names``) to a zip archive (``*.zip``) or a
+    directory. Entries are copied as stored, one at a time.
+    """
+    target = Path(target)
+    names = index.names() if names is None else list(names)
+    written, failed = [], []
+    step = _progress_step(len(names))
+    as_zip = target.suffix.lower() == ".zip"
+    tmp = target.with_name(target.name + ".tmp")
+
+    if as_zip:
+        archive = zipfile.ZipFile(tmp, "w", zipfile.ZIP_DEFLATED)
+    else:
+        target.mkdir(parents=True, exist_ok=True)
+    try:
+        for i, name in enumerate(names, 1):
+            if cancel is not None and cancel.is_set():
+                break
+            data = index.raw(name)
+            if data is None:
+                failed.append((name, "profile not found"))
+            elif as_zip:
+                archive.writestr(f"{name}.json", data)
+                written.append(name)
+            else:
+                path = target / f"{name}.json"
+                path.with_name(path.name + ".tmp").write_bytes(data)
+                os.replace(path.with_name(path.name + ".tmp"), path)
+                written.append(name)
+            if progress is not None and i % step == 0:
+                progress(i, len(names))
+    finally:
+        if as_zip:
+            archive.close()
+    cancelled = cancel is not None and cancel.is_set()
+    if as_zip:
+        if cancelled:
+            os.remove(tmp)
+        else:
+            os.replace(tmp, target)
+    if progress is not None:
+        progress(len(names), len(names))
+    return BulkResult(written, 0, failed, cancelled)
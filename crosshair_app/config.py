@@ -3,16 +3,24 @@ Configuration management for CrosshairX.
 Handles loading, saving, and managing crosshair profiles.
 """
 
+import copy
 import json
 import os
+import threading
+import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, NamedTuple
+
+from .profiles import ProfileIndex
+from .schema import normalize, normalize_config, normalize_tags
 
 
 # Default directories
 APP_DIR = Path(os.environ.get("APPDATA", Path.home())) / "CrosshairX"
 CONFIG_FILE = APP_DIR / "config.json"
 PROFILES_DIR = APP_DIR / "profiles"
+LIBRARY_CACHE_FILE = APP_DIR / "library.json"
 
 
 # === Default Configuration ===
@@ -37,7 +45,9 @@ DEFAULT_CONFIG = {
         "intensity": 0.3,            # Animation intensity (0.0 - 1.0)
     },
     "display": {
-        "monitor": 0,                # Primary monitor
+        "monitor": 0,                # Primary monitor (used when "monitors" is empty)
+        "monitors": [],              # Screen names to draw on (multi-monitor)
+        "screen_offsets": {},        # Extra per-screen offset: {screen name: [x, y]}
         "offset_x": 0,               # Offset from center X
         "offset_y": 0,               # Offset from center Y
         "opacity": 1.0,              # Global opacity
@@ -49,6 +59,8 @@ DEFAULT_CONFIG = {
         "prev_profile": "F8",        # Switch to previous profile
         "toggle_animation": "F9",    # Enable/disable animation
         "open_settings": "F10",      # Open settings panel
+        "undo": "Ctrl+Z",            # Undo a settings change (settings window)
+        "redo": "Ctrl+Y",            # Redo it
     },
     "general": {
         "start_minimized": False,
@@ -56,6 +68,8 @@ DEFAULT_CONFIG = {
         "current_profile": "default",
         "language": "ru",
         "gpu_acceleration": True,
+        "live_apply": False,         # Push panel edits to the overlay without Apply
+        "trim_after": 60,            # Seconds hidden in the tray before the panel is freed (0 = never)
     }
 }
 
@@ -107,13 +121,138 @@ PRESET_PROFILES = {
 }
 
 
+# === Immutable snapshots (render hot path) ===
+
+def _freeze(value: Any) -> Any:
+    """Lists -> tuples, dicts -> sorted item tuples, so snapshots are hashable."""
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    return value
+
+
+def snapshot_of(cls, section: dict, previous=None):
+    """
+    Build a snapshot section ``cls`` from a config dict, ignoring unknown keys.
+    Values equal to ``previous``'s are reused (and ``previous`` itself if
+    nothing changed), so consecutive snapshots share memory.
+    """
+    snap = cls(**{k: _freeze(section[k]) for k in cls._fields if k in section})
+    if previous is None:
+        return snap
+    if snap == previous:
+        return previous
+    return cls(*(old if old == new else new for old, new in zip(previous, snap)))
+
+
+class CrosshairSnapshot(NamedTuple):
+    style: str = "cross"
+    size: float = 20
+    thickness: float = 2
+    gap: float = 4
+    color: tuple = (0, 255, 0, 255)
+    outline: bool = True
+    outline_color: tuple = (0, 0, 0, 180)
+    outline_thickness: float = 1
+    dot: bool = True
+    dot_size: float = 2
+    t_style: bool = False
+
+
+class AnimationSnapshot(NamedTuple):
+    enabled: bool = True
+    type: str = "pulse"
+    speed: float = 1.0
+    intensity: float = 0.3
+
+
+class DisplaySnapshot(NamedTuple):
+    monitor: int = 0
+    monitors: tuple = ()
+    screen_offsets: tuple = ()   # ((screen name, (x, y)), ...)
+    offset_x: int = 0
+    offset_y: int = 0
+    opacity: float = 1.0
+    fps: int = 60
+
+
+class ConfigSnapshot(NamedTuple):
+    """
+    Immutable, hashable view of the sections the overlay reads every frame.
+    Unchanged sections are shared between consecutive snapshots.
+    """
+    crosshair: CrosshairSnapshot = CrosshairSnapshot()
+    animation: AnimationSnapshot = AnimationSnapshot()
+    display: DisplaySnapshot = DisplaySnapshot()
+
+
+class ConfigChange(NamedTuple):
+    """
+    One change notification: the dotted key paths that changed together
+    (a single set(), or everything inside one batch()).
+    """
+    keys: frozenset
+    started_at: float = 0.0  # perf_counter() when the change began (latency tracking)
+
+    def touches(self, *prefixes: str) -> bool:
+        """True if any changed key is, contains, or lies under one of ``prefixes``."""
+        return any(_related(key, prefix) for key in self.keys for prefix in prefixes)
+
+
+def _related(key: str, prefix: str) -> bool:
+    return (key == prefix or key.startswith(prefix + ".")
+            or prefix.startswith(key + "."))
+
+
+_MISSING = object()
+
+
+SNAPSHOT_SECTIONS = {
+    "crosshair": CrosshairSnapshot,
+    "animation": AnimationSnapshot,
+    "display": DisplaySnapshot,
+}
+
+
+def _atomic_write(path: Path, text: str):
+    """Write via a temp file + rename, so a crash never leaves a truncated file."""
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
 class Config:
-    """Manages application configuration with profile support."""
+    """
+    Manages application configuration with profile support.
+
+    save() is debounced: writes landing within SAVE_DELAY are coalesced and
+    performed on a background thread, so callers never block on disk.
+    Call flush() before exiting to write synchronously.
+    """
+
+    SAVE_DELAY = 0.5  # Seconds
 
     def __init__(self):
         self._config: dict = {}
+        self._snapshot = ConfigSnapshot()
+        self._stale: set = set(SNAPSHOT_SECTIONS)
+        self._subscribers: list = []    # [(callback, prefixes)]
+        self._batch_depth = 0
+        self._batch_keys: set = set()
+        self._batch_started = 0.0
+        self._lock = threading.RLock()            # Guards _config vs. the writer thread
+        self._write_lock = threading.Lock()       # One writer of config.json at a time
+        self._save_cond = threading.Condition()
+        self._save_due = None                     # monotonic() deadline of a pending save
+        self._writer = None
         self._ensure_dirs()
         self.load()
+        self.profiles = ProfileIndex(PROFILES_DIR)
+        self._library = None
 
     def _ensure_dirs(self):
         """Create config directories if they don't exist."""
@@ -122,26 +261,73 @@ class Config:
 
     def load(self):
         """Load configuration from file, or create default."""
+        self._stale.update(SNAPSHOT_SECTIONS)
         if CONFIG_FILE.exists():
             try:
                 with open(CONFIG_FILE, "r", encoding="utf-8") as f:
                     self._config = json.load(f)
-                # Merge with defaults for any missing keys
-                self._config = self._deep_merge(DEFAULT_CONFIG, self._config)
-            except (json.JSONDecodeError, IOError):
-                self._config = DEFAULT_CONFIG.copy()
+                # Merge with defaults for any missing keys, then coerce types/ranges
+                self._config = normalize_config(
+                    self._deep_merge(copy.deepcopy(DEFAULT_CONFIG), self._config)
+                )
+            except json.JSONDecodeError as e:
+                # Keep the broken file for inspection instead of silently losing it
+                backup = CONFIG_FILE.with_name(f"config.corrupt-{int(time.time())}.json")
+                try:
+                    os.replace(CONFIG_FILE, backup)
+                    print(f"[Config] config.json is corrupt ({e}); moved to {backup.name}, "
+                          f"using defaults")
+                except OSError:
+                    print(f"[Config] config.json is corrupt ({e}); using defaults")
+                self._config = copy.deepcopy(DEFAULT_CONFIG)
+                self.save()
+            except IOError as e:
+                print(f"[Config] Error loading config: {e}; using defaults")
+                self._config = copy.deepcopy(DEFAULT_CONFIG)
         else:
-            self._config = DEFAULT_CONFIG.copy()
+            self._config = copy.deepcopy(DEFAULT_CONFIG)
             self._install_preset_profiles()
             self.save()
 
     def save(self):
-        """Save configuration to file."""
-        try:
-            with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-                json.dump(self._config, f, indent=2, ensure_ascii=False)
-        except IOError as e:
-            print(f"[Config] Error saving config: {e}")
+        """Schedule a write of config.json (debounced, off the calling thread)."""
+        with self._save_cond:
+            self._save_due = time.monotonic() + self.SAVE_DELAY
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._writer_loop, name="ConfigWriter", daemon=True
+                )
+                self._writer.start()
+            self._save_cond.notify()
+
+    def flush(self):
+        """Write config.json now, on the calling thread. Use before quitting."""
+        with self._save_cond:
+            self._save_due = None
+        self._write()
+        if self._library is not None:
+            self._library.flush()
+
+    def _writer_loop(self):
+        while True:
+            with self._save_cond:
+                while self._save_due is None:
+                    self._save_cond.wait()
+                delay = self._save_due - time.monotonic()
+                if delay > 0:
+                    self._save_cond.wait(delay)  # More saves may push the deadline back
+                    continue
+                self._save_due = None
+            self._write()
+
+    def _write(self):
+        with self._write_lock:
+            with self._lock:
+                text = json.dumps(self._config, indent=2, ensure_ascii=False)
+            try:
+                _atomic_write(CONFIG_FILE, text)
+            except OSError as e:
+                print(f"[Config] Error saving config: {e}")
 
     def get(self, key_path: str, default: Any = None) -> Any:
         """Get a config value using dot notation. e.g. 'crosshair.color'"""
@@ -155,19 +341,86 @@ class Config:
         return val
 
     def set(self, key_path: str, value: Any):
-        """Set a config value using dot notation."""
+        """
+        Set a config value using dot notation (normalized by the schema).
+        Notifies subscribers if it changed.
+        """
+        value = normalize(key_path, value)
         keys = key_path.split(".")
-        d = self._config
-        for k in keys[:-1]:
-            if k not in d or not isinstance(d[k], dict):
-                d[k] = {}
-            d = d[k]
-        d[keys[-1]] = value
+        with self._lock:
+            d = self._config
+            for k in keys[:-1]:
+                if k not in d or not isinstance(d[k], dict):
+                    d[k] = {}
+                d = d[k]
+            if d.get(keys[-1], _MISSING) == value:
+                return
+            d[keys[-1]] = value
+        if keys[0] in SNAPSHOT_SECTIONS:
+            self._stale.add(keys[0])
+        with self.batch():
+            self._batch_keys.add(key_path)
+
+    # --- Change notifications ---
+
+    def subscribe(self, callback: Callable[[ConfigChange], None], *prefixes: str):
+        """
+        Call ``callback(ConfigChange)`` after keys under any of ``prefixes``
+        change (every key if no prefix is given). The change only lists the
+        keys the subscriber asked for. Returns ``callback`` for unsubscribe().
+        """
+        self._subscribers.append((callback, prefixes))
+        return callback
+
+    def unsubscribe(self, callback):
+        self._subscribers = [(cb, p) for cb, p in self._subscribers if cb != callback]
+
+    @contextmanager
+    def batch(self):
+        """Group several set() calls into one notification, sent on exit."""
+        if self._batch_depth == 0:
+            self._batch_started = time.perf_counter()
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._batch_keys:
+                keys, self._batch_keys = frozenset(self._batch_keys), set()
+                self._notify(keys, self._batch_started)
+
+    def _notify(self, keys: frozenset, started_at: float):
+        for callback, prefixes in list(self._subscribers):
+            if prefixes:
+                wanted = frozenset(k for k in keys if any(_related(k, p) for p in prefixes))
+            else:
+                wanted = keys
+            if not wanted:
+                continue
+            try:
+                callback(ConfigChange(wanted, started_at))
+            except Exception as e:
+                print(f"[Config] Subscriber {getattr(callback, '__qualname__', callback)} failed: {e}")
 
     @property
     def data(self) -> dict:
         return self._config
 
+    @property
+    def snapshot(self) -> ConfigSnapshot:
+        """
+        Immutable snapshot of crosshair/animation/display. Rebuilt lazily,
+        and only for the sections touched by set()/load() since the last read.
+        """
+        if self._stale:
+            self._snapshot = self._snapshot._replace(**{
+                name: snapshot_of(SNAPSHOT_SECTIONS[name], self._config.get(name, {}),
+                                  getattr(self._snapshot, name))
+                for name in self._stale
+            })
+            self._stale.clear()
+        return self._snapshot
+
     # --- Profile Management ---
 
     def _install_preset_profiles(self):
@@ -180,31 +433,33 @@ class Config:
 
     def list_profiles(self) -> list[str]:
         """List available profile names."""
-        profiles = []
-        for p in PROFILES_DIR.glob("*.json"):
-            profiles.append(p.stem)
-        return sorted(profiles)
+        return self.profiles.names()
+
+    @property
+    def library(self):
+        """Searchable profile library, built on first use."""
+        if self._library is None:
+            from .library import ProfileLibrary
+            self._library = ProfileLibrary(self.profiles, LIBRARY_CACHE_FILE)
+        return self._library
 
     def load_profile(self, name: str) -> bool:
-        """Load and apply a profile."""
-        path = PROFILES_DIR / f"{name}.json"
-        if not path.exists():
+        """Load and apply a profile (parsed copy from the in-memory index)."""
+        profile = self.profiles.get(name)
+        if profile is None and (PROFILES_DIR / f"{name}.json").exists():
+            self.profiles.rescan()  # Created behind the watcher's back
+            profile = self.profiles.get(name)
+        if profile is None:
             return False
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                profile = json.load(f)
-            # Apply profile settings on top of current config
-            if "crosshair" in profile:
-                for k, v in profile["crosshair"].items():
-                    self.set(f"crosshair.{k}", v)
-            if "animation" in profile:
-                for k, v in profile["animation"].items():
-                    self.set(f"animation.{k}", v)
+        with self.batch():
+            # Apply profile settings on top of current config (one notification)
+            for section in ("crosshair", "animation"):
+                for k, v in profile.get(section, {}).items():
+                    # Own copy of list values (colors): the parsed profile is shared
+                    self.set(f"{section}.{k}", list(v) if isinstance(v, list) else v)
             self.set("general.current_profile", name)
-            self.save()
-            return True
-        except (json.JSONDecodeError, IOError):
-            return False
+        self.save()
+        return True
 
     def save_profile(self, name: str):
         """Save current crosshair+animation settings as a profile."""
@@ -213,45 +468,44 @@ class Config:
             "crosshair": self._config.get("crosshair", {}),
             "animation": self._config.get("animation", {}),
         }
-        path = PROFILES_DIR / f"{name}.json"
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(profile, f, indent=2)
+        old = self.profiles.get(name)
+        if old and old.get("tags"):
+            profile["tags"] = list(old["tags"])  # Overwriting keeps the tags
+        _atomic_write(PROFILES_DIR / f"{name}.json", json.dumps(profile, indent=2))
+        self.profiles.put(name, profile)
+
+    def set_profile_tags(self, name: str, tags) -> bool:
+        """Replace a profile's tags (list or "a, b c" string). Writes it as a file."""
+        profile = self.profiles.get(name)
+        if profile is None:
+            return False
+        profile = dict(profile, tags=normalize_tags(tags))
+        _atomic_write(PROFILES_DIR / f"{name}.json", json.dumps(profile, indent=2))
+        self.profiles.put(name, profile)
+        return True
 
     def delete_profile(self, name: str) -> bool:
         """Delete a profile."""
         path = PROFILES_DIR / f"{name}.json"
         if path.exists():
             path.unlink()
+            self.profiles.discard(name)
             return True
         return False
 
     def next_profile(self) -> str:
         """Switch to the next profile and return its name."""
-        profiles = self.list_profiles()
-        if not profiles:
-            return ""
-        current = self.get("general.current_profile", "default")
-        try:
-            idx = profiles.index(current)
-            idx = (idx + 1) % len(profiles)
-        except ValueError:
-            idx = 0
-        self.load_profile(profiles[idx])
-        return profiles[idx]
+        return self._step_profile(1)
 
     def prev_profile(self) -> str:
         """Switch to the previous profile and return its name."""
-        profiles = self.list_profiles()
-        if not profiles:
-            return ""
-        current = self.get("general.current_profile", "default")
-        try:
-            idx = profiles.index(current)
-            idx = (idx - 1) % len(profiles)
-        except ValueError:
-            idx = 0
-        self.load_profile(profiles[idx])
-        return profiles[idx]
+        return self._step_profile(-1)
+
+    def _step_profile(self, step: int) -> str:
+        name = self.profiles.neighbor(self.get("general.current_profile", "default"), step)
+        if name:
+            self.load_profile(name)
+        return name
 
     @staticmethod
     def _deep_merge(base: dict, override: dict) -> dict:
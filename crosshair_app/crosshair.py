@@ -1,33 +1,141 @@
 """
 Crosshair rendering engine.
 Draws different crosshair styles using QPainter with GPU acceleration via OpenGL.
+Each style is built once per geometry as a filled QPainterPath (plus a
+dilated outline path) and cached, so an outlined crosshair costs two fills.
 """
 
 import math
-from PyQt5.QtCore import QPointF, QRectF
-from PyQt5.QtGui import QPainter, QPen, QColor, QBrush, QPolygonF
+import threading
+from collections import OrderedDict
+from PyQt5.QtCore import Qt, QPointF, QRect, QRectF
+from PyQt5.QtGui import (
+    QPainter, QColor, QImage, QTransform, QPainterPath, QPainterPathStroker, QRegion,
+)
 
+from .config import CrosshairSnapshot, snapshot_of
+
+
+# Styles drawn as integer rects on the pixel-snapped path. plus_thin is left out:
+# its 0.6x pen is cheaper to fill antialiased than as rects
+SNAP_STYLES = ("cross",)
+# Smallest size (logical px) snapped: below it the cached antialiased path is as
+# cheap as the rects (Python call overhead dominates), so snapping would cost more
+SNAP_MIN_SIZE = 48
+
+
+def _is_integral(value: float) -> bool:
+    return abs(value - round(value)) < 1e-6
+
+
+def _snap_rects(h: int, g: int, th: int, t_style: bool) -> tuple:
+    """
+    Device-pixel rects (x, y, w, h) of a cross, relative to the center
+    pixel. Square caps: arms extend half the thickness past both ends.
+    """
+    lo = th // 2
+    flip = 1 - th % 2          # Even thickness: center line sits between pixels
+    far = h + th - lo - 1      # Last pixel of an arm, counted from the center
+    near = g - lo
+    if far < near:
+        return ()
+    arms = [(near, far), (-far - flip, -near - flip)]
+    rects = [(a, -lo, b - a + 1, th) for a, b in arms]        # Right, left
+    rects.append((-lo, near, th, far - near + 1))             # Bottom
+    if not t_style:
+        rects.append((-lo, -far - flip, th, far - near + 1))  # Top
+    return tuple(rects)
+
+
+def _lines(*segments) -> QPainterPath:
+    """Open path made of separate (x1, y1, x2, y2) segments."""
+    path = QPainterPath()
+    for x1, y1, x2, y2 in segments:
+        path.moveTo(x1, y1)
+        path.lineTo(x2, y2)
+    return path
+
+
+def _polyline(*points) -> QPainterPath:
+    path = QPainterPath()
+    path.moveTo(*points[0])
+    for point in points[1:]:
+        path.lineTo(*point)
+    return path
+
+
+def _disc(radius: float) -> QPainterPath:
+    path = QPainterPath()
+    path.addEllipse(QPointF(0, 0), radius, radius)
+    return path
+
+
+def _stroke(path: QPainterPath, width: float, cap=Qt.SquareCap, join=Qt.BevelJoin) -> QPainterPath:
+    """Fillable outline of ``path`` drawn with a pen of ``width``."""
+    stroker = QPainterPathStroker()
+    stroker.setWidth(width)
+    stroker.setCapStyle(cap)
+    stroker.setJoinStyle(join)
+    return stroker.createStroke(path)
+
+
+def _quantize(value: float) -> float:
+    """Round animated geometry to 1/4 px so animation frames share cache entries."""
+    return round(value * 4) / 4
 
-class CrosshairRenderer:
-    """Renders various crosshair styles onto a QPainter."""
 
-    def __init__(self):
+class CrosshairRenderer:
+    """
+    Renders various crosshair styles onto a QPainter.
+
+    With ``pixel_snap`` enabled, unrotated cross crosshairs of at least
+    SNAP_MIN_SIZE whose half size, gap and thickness land on whole device
+    pixels are built from integer rects, so every edge lands on a pixel
+    boundary (no AA fringe). Anything smaller, rotated or fractional uses
+    the antialiased shape.
+    """
+
+    MAX_SHAPES = 64
+
+    def __init__(self, pixel_snap: bool = True):
+        self.pixel_snap = pixel_snap
+        self._shapes: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()  # Sprites may be prefetched off the GUI thread
         self._style_map = {
-            "cross": self._draw_cross,
-            "dot": self._draw_dot,
-            "circle": self._draw_circle,
-            "chevron": self._draw_chevron,
-            "diamond": self._draw_diamond,
-            "crossdot": self._draw_crossdot,
-            "triangle": self._draw_triangle,
-            "crosshair_classic": self._draw_classic,
-            "square": self._draw_square,
-            "plus_thin": self._draw_plus_thin,
-            "crosscircle": self._draw_crosscircle,
-            "arrows": self._draw_arrows,
+            "cross": self._shape_cross,
+            "dot": self._shape_dot,
+            "circle": self._shape_circle,
+            "chevron": self._shape_chevron,
+            "diamond": self._shape_diamond,
+            "crossdot": self._shape_crossdot,
+            "triangle": self._shape_triangle,
+            "crosshair_classic": self._shape_classic,
+            "square": self._shape_square,
+            "plus_thin": self._shape_plus_thin,
+            "crosscircle": self._shape_crosscircle,
+            "arrows": self._shape_arrows,
         }
 
-    def draw(self, painter: QPainter, center_x: float, center_y: float, config: dict,
+    @staticmethod
+    def snapshot(config) -> CrosshairSnapshot:
+        """Accept a CrosshairSnapshot as-is, or build one from a crosshair dict."""
+        if isinstance(config, CrosshairSnapshot):
+            return config
+        return snapshot_of(CrosshairSnapshot, config)
+
+    @staticmethod
+    def extent(config) -> float:
+        """
+        Conservative distance from the center to the farthest painted pixel,
+        including headroom for animations (pulse/recoil growth, rotation).
+        """
+        c = CrosshairRenderer.snapshot(config)
+        extent = (c.size * 0.75 + abs(c.gap)) * 1.6
+        extent += c.thickness + 2 * c.outline_thickness
+        extent += c.dot_size + 20  # Recoil gap kick + AA fringe
+        return extent
+
+    def draw(self, painter: QPainter, center_x: float, center_y: float, config,
              anim_state: dict | None = None):
         """
         Draw the crosshair at the given center point.
@@ -35,23 +143,13 @@ class CrosshairRenderer:
         Args:
             painter: QPainter to draw on
             center_x, center_y: Center coordinates
-            config: Crosshair config dict
+            config: CrosshairSnapshot (or a crosshair config dict)
             anim_state: Animation state dict (color_override, size_mult, rotation, gap_offset, opacity)
         """
         if anim_state is None:
             anim_state = {}
 
-        style = config.get("style", "cross")
-        base_size = config.get("size", 20)
-        thickness = config.get("thickness", 2)
-        gap = config.get("gap", 4)
-        color = list(config.get("color", [0, 255, 0, 255]))
-        outline = config.get("outline", True)
-        outline_color = config.get("outline_color", [0, 0, 0, 180])
-        outline_thickness = config.get("outline_thickness", 1)
-        show_dot = config.get("dot", True)
-        dot_size = config.get("dot_size", 2)
-        t_style = config.get("t_style", False)
+        c = self.snapshot(config)
 
         # Apply animation modifiers
         size_mult = anim_state.get("size_mult", 1.0)
@@ -60,276 +158,366 @@ class CrosshairRenderer:
         opacity_mult = anim_state.get("opacity", 1.0)
         color_override = anim_state.get("color_override", None)
 
-        size = base_size * size_mult
-        gap = gap + gap_offset
-
-        if color_override:
-            color = list(color_override)
+        size = _quantize(c.size * size_mult)
+        gap = _quantize(c.gap + gap_offset)
+        color = color_override or c.color
+        qcolor = QColor(color[0], color[1], color[2], int(color[3] * opacity_mult))
+        qoutline = QColor(*c.outline_color[:4])
+        outline_thickness = c.outline_thickness if c.outline else 0
 
-        color[3] = int(color[3] * opacity_mult)
+        geometry = (c.style, size, c.thickness, gap, c.dot, c.dot_size, c.t_style,
+                    outline_thickness)
+        if (self.pixel_snap and rotation == 0 and c.style in SNAP_STYLES and size >= SNAP_MIN_SIZE
+                and self._draw_snapped(painter, center_x, center_y, geometry, qcolor, qoutline)):
+            return
+        shape, outline_shape = self.shapes(*geometry)
 
-        qcolor = QColor(color[0], color[1], color[2], color[3])
-        qoutline = QColor(outline_color[0], outline_color[1], outline_color[2], outline_color[3])
-
-        # Save painter state
         painter.save()
         painter.setRenderHint(QPainter.Antialiasing, True)
-
-        # Apply rotation
+        painter.translate(center_x, center_y)
         if rotation != 0:
-            painter.translate(center_x, center_y)
             painter.rotate(rotation)
-            painter.translate(-center_x, -center_y)
+        if outline_shape is not None:
+            painter.fillPath(outline_shape, qoutline)
+        painter.fillPath(shape, qcolor)
+        painter.restore()
+
+    def _cached(self, key, build) -> tuple:
+        with self._lock:
+            entry = self._shapes.get(key)
+            if entry is not None:
+                self._shapes.move_to_end(key)
+                return entry
+        entry = build()
+        with self._lock:
+            self._shapes[key] = entry
+            while len(self._shapes) > self.MAX_SHAPES:
+                self._shapes.popitem(last=False)
+        return entry
+
+    def shapes(self, style, size, thickness, gap, dot, dot_size, t_style,
+               outline_thickness) -> tuple:
+        """
+        Cached (shape, outline) paths centered at the origin. The outline is
+        the shape dilated by ``outline_thickness`` (None when it is 0).
+        """
+        def build():
+            shape = self._style_map.get(style, self._shape_cross)(
+                size, thickness, gap, dot, dot_size, t_style).simplified()
+            if outline_thickness <= 0:
+                return shape, None
+            return shape, _stroke(shape, 2 * outline_thickness, join=Qt.MiterJoin).united(shape)
 
-        draw_fn = self._style_map.get(style, self._draw_cross)
+        return self._cached((style, size, thickness, gap, dot, dot_size, t_style,
+                             outline_thickness), build)
 
-        # Draw outline first (if enabled)
-        if outline:
-            outline_pen = QPen(qoutline, thickness + outline_thickness * 2)
-            outline_pen.setCapStyle(2)  # Qt.RoundCap = 0x20, FlatCap = 0x00, SquareCap = 0x10
-            draw_fn(painter, center_x, center_y, size, thickness + outline_thickness * 2,
-                     gap, qoutline, show_dot, dot_size + outline_thickness, t_style)
+    # ===================== PIXEL-SNAPPED FAST PATH =====================
 
-        # Draw main crosshair
-        draw_fn(painter, center_x, center_y, size, thickness, gap,
-                qcolor, show_dot, dot_size, t_style)
+    def _draw_snapped(self, painter, cx, cy, geometry, color, outline_color) -> bool:
+        """
+        Fill a pixel-aligned cross as integer device-pixel rects, antialiasing
+        off; only the center dot is antialiased. Returns False (nothing
+        drawn) if the geometry is not pixel-aligned.
+        """
+        device = painter.deviceTransform()
+        if device.type() > QTransform.TxScale or device.m11() != device.m22():
+            return False
+        scale, dx, dy = device.m11(), device.dx(), device.dy()
+        layout = self._cached(("snap", *geometry, scale),
+                              lambda: self._build_snapped(*geometry, scale))
+        if not layout:
+            return False
+        rects, outline_rects, dot, outline_dot = layout
 
+        painter.save()
+        # Move to the center pixel in device units, so the integer rects land on pixels
+        painter.translate((math.floor(cx * scale + dx) - dx) / scale,
+                          (math.floor(cy * scale + dy) - dy) / scale)
+        if scale != 1:
+            painter.scale(1 / scale, 1 / scale)
+        painter.setPen(Qt.NoPen)
+        painter.setRenderHint(QPainter.Antialiasing, False)
+        if outline_rects:
+            painter.setBrush(outline_color)
+            painter.drawRects(outline_rects)
+            if outline_dot is not None:
+                painter.setRenderHint(QPainter.Antialiasing, True)
+                painter.drawPath(outline_dot)
+                painter.setRenderHint(QPainter.Antialiasing, False)
+        painter.setBrush(color)
+        painter.drawRects(rects)
+        if dot is not None:
+            painter.setRenderHint(QPainter.Antialiasing, True)
+            painter.drawPath(dot)
         painter.restore()
+        return True
+
+    @staticmethod
+    def _build_snapped(style, size, thickness, gap, dot, dot_size, t_style,
+                       outline_thickness, scale) -> tuple:
+        """
+        (rects, outline rects, dot, outline dot) in device pixels around the
+        center pixel. Rects are QRegion-decomposed so none overlap (a
+        translucent color never blends twice). () if the geometry is not
+        pixel-aligned.
+        """
+        # The arm length is the half size: an odd size would lose half a pixel
+        for value in (size / 2, gap, thickness, outline_thickness):
+            if not _is_integral(value * scale):
+                return ()
+        th = int(round(thickness * scale))
+        o = int(round(outline_thickness * scale))
+        arms = _snap_rects(int(round(size / 2 * scale)), int(round(gap * scale)), th, t_style)
+        if not arms:
+            return ()
+        c = (th % 2) / 2  # Dot center: middle of the center pixel, or between pixels
+
+        def region(grow):
+            area = QRegion()
+            for rx, ry, rw, rh in arms:
+                area = area.united(QRegion(QRect(rx - grow, ry - grow, rw + 2 * grow, rh + 2 * grow)))
+            return area.rects()
+
+        def disc(radius):
+            path = QPainterPath()
+            path.addEllipse(QPointF(c, c), radius, radius)
+            return path
+
+        dot_shape = outline_dot = None
+        if dot and dot_size > 0:
+            r = (dot_size + 0.5) * scale
+            dot_shape = disc(r)
+            outline_dot = disc(r + o) if o else None
+        return region(0), (region(o) if o else []), dot_shape, outline_dot
 
     # ===================== CROSSHAIR STYLES =====================
+    # Each builder returns the filled area of the style centered at (0, 0).
+    # Dots drawn with a 1px pen in the old painter code get +0.5 radius.
 
-    def _draw_cross(self, painter, cx, cy, size, thickness, gap, color, dot, dot_size, t_style):
+    def _shape_cross(self, size, thickness, gap, dot, dot_size, t_style):
         """Classic cross/plus crosshair."""
-        pen = QPen(color, thickness)
-        pen.setCapStyle(0x10)  # SquareCap
-        painter.setPen(pen)
-
         half = size / 2
-
-        # Right
-        painter.drawLine(QPointF(cx + gap, cy), QPointF(cx + half, cy))
-        # Left
-        painter.drawLine(QPointF(cx - gap, cy), QPointF(cx - half, cy))
-        # Bottom
-        painter.drawLine(QPointF(cx, cy + gap), QPointF(cx, cy + half))
-        # Top (skip if T-style)
-        if not t_style:
-            painter.drawLine(QPointF(cx, cy - gap), QPointF(cx, cy - half))
-
+        segments = [(gap, 0, half, 0), (-gap, 0, -half, 0), (0, gap, 0, half)]
+        if not t_style:  # T-style: no top line
+            segments.append((0, -gap, 0, -half))
+        shape = _stroke(_lines(*segments), thickness)
         if dot and dot_size > 0:
-            painter.setPen(QPen(color, 1))
-            painter.setBrush(QBrush(color))
-            painter.drawEllipse(QPointF(cx, cy), dot_size, dot_size)
+            shape = shape.united(_disc(dot_size + 0.5))
+        return shape
 
-    def _draw_dot(self, painter, cx, cy, size, thickness, gap, color, dot, dot_size, t_style):
+    def _shape_dot(self, size, thickness, gap, dot, dot_size, t_style):
         """Single dot crosshair."""
-        radius = max(dot_size, size / 4)
-        painter.setPen(QPen(color, 1))
-        painter.setBrush(QBrush(color))
-        painter.drawEllipse(QPointF(cx, cy), radius, radius)
+        return _disc(max(dot_size, size / 4) + 0.5)
 
-    def _draw_circle(self, painter, cx, cy, size, thickness, gap, color, dot, dot_size, t_style):
+    def _shape_circle(self, size, thickness, gap, dot, dot_size, t_style):
         """Circle crosshair."""
-        pen = QPen(color, thickness)
-        painter.setPen(pen)
-        painter.setBrush(QBrush())  # No fill
-        radius = size / 2
-        painter.drawEllipse(QPointF(cx, cy), radius, radius)
-
+        shape = _stroke(_disc(size / 2), thickness)
         if dot and dot_size > 0:
-            painter.setBrush(QBrush(color))
-            painter.drawEllipse(QPointF(cx, cy), dot_size, dot_size)
+            # The dot inherits the ring pen
+            shape = shape.united(_disc(dot_size + thickness / 2))
+        return shape
 
-    def _draw_chevron(self, painter, cx, cy, size, thickness, gap, color, dot, dot_size, t_style):
+    def _shape_chevron(self, size, thickness, gap, dot, dot_size, t_style):
         """Chevron/V-shape crosshair."""
-        pen = QPen(color, thickness)
-        pen.setCapStyle(0x20)  # RoundCap
-        pen.setJoinStyle(0x80)  # RoundJoin
-        painter.setPen(pen)
-
         half = size / 2
-        offset = gap
-
-        # Draw V shape
-        polygon = QPolygonF([
-            QPointF(cx - half, cy - half / 2 + offset),
-            QPointF(cx, cy + offset),
-            QPointF(cx + half, cy - half / 2 + offset),
-        ])
-        painter.drawPolyline(polygon)
-
+        shape = _stroke(
+            _polyline((-half, -half / 2 + gap), (0, gap), (half, -half / 2 + gap)),
+            thickness, Qt.RoundCap, Qt.RoundJoin,
+        )
         if dot and dot_size > 0:
-            painter.setBrush(QBrush(color))
-            painter.setPen(QPen(color, 1))
-            painter.drawEllipse(QPointF(cx, cy), dot_size, dot_size)
+            shape = shape.united(_disc(dot_size + 0.5))
+        return shape
 
-    def _draw_diamond(self, painter, cx, cy, size, thickness, gap, color, dot, dot_size, t_style):
+    def _shape_diamond(self, size, thickness, gap, dot, dot_size, t_style):
         """Diamond shape crosshair."""
-        pen = QPen(color, thickness)
-        pen.setJoinStyle(0x00)  # MiterJoin
-        painter.setPen(pen)
-        painter.setBrush(QBrush())  # No fill
-
         half = size / 2
-        polygon = QPolygonF([
-            QPointF(cx, cy - half),       # Top
-            QPointF(cx + half, cy),       # Right
-            QPointF(cx, cy + half),       # Bottom
-            QPointF(cx - half, cy),       # Left
-            QPointF(cx, cy - half),       # Close
-        ])
-        painter.drawPolyline(polygon)
-
+        shape = _stroke(
+            _polyline((0, -half), (half, 0), (0, half), (-half, 0), (0, -half)),
+            thickness, join=Qt.MiterJoin,
+        )
         if dot and dot_size > 0:
-            painter.setBrush(QBrush(color))
-            painter.setPen(QPen(color, 1))
-            painter.drawEllipse(QPointF(cx, cy), dot_size, dot_size)
+            shape = shape.united(_disc(dot_size + 0.5))
+        return shape
 
-    def _draw_crossdot(self, painter, cx, cy, size, thickness, gap, color, dot, dot_size, t_style):
+    def _shape_crossdot(self, size, thickness, gap, dot, dot_size, t_style):
         """Cross with prominent center dot."""
-        # Draw the cross
-        self._draw_cross(painter, cx, cy, size, thickness, gap, color, False, 0, t_style)
+        shape = self._shape_cross(size, thickness, gap, False, 0, t_style)
+        return shape.united(_disc(max(dot_size, 3) + 0.5))
 
-        # Draw larger center dot
-        radius = max(dot_size, 3)
-        painter.setPen(QPen(color, 1))
-        painter.setBrush(QBrush(color))
-        painter.drawEllipse(QPointF(cx, cy), radius, radius)
-
-    def _draw_triangle(self, painter, cx, cy, size, thickness, gap, color, dot, dot_size, t_style):
+    def _shape_triangle(self, size, thickness, gap, dot, dot_size, t_style):
         """Triangle crosshair pointing up."""
-        pen = QPen(color, thickness)
-        pen.setJoinStyle(0x00)  # MiterJoin
-        painter.setPen(pen)
-        painter.setBrush(QBrush())
-
         half = size / 2
         h = half * math.sqrt(3) / 2
-
-        polygon = QPolygonF([
-            QPointF(cx, cy - h + gap),
-            QPointF(cx + half, cy + h / 2 + gap),
-            QPointF(cx - half, cy + h / 2 + gap),
-            QPointF(cx, cy - h + gap),
-        ])
-        painter.drawPolyline(polygon)
-
+        shape = _stroke(
+            _polyline((0, -h + gap), (half, h / 2 + gap), (-half, h / 2 + gap), (0, -h + gap)),
+            thickness, join=Qt.MiterJoin,
+        )
         if dot and dot_size > 0:
-            painter.setBrush(QBrush(color))
-            painter.setPen(QPen(color, 1))
-            painter.drawEllipse(QPointF(cx, cy), dot_size, dot_size)
+            shape = shape.united(_disc(dot_size + 0.5))
+        return shape
 
-    def _draw_classic(self, painter, cx, cy, size, thickness, gap, color, dot, dot_size, t_style):
+    def _shape_classic(self, size, thickness, gap, dot, dot_size, t_style):
         """Classic crosshair with circle + cross."""
-        # Draw circle
-        self._draw_circle(painter, cx, cy, size, thickness, gap, color, False, 0, t_style)
-        # Draw cross lines extending from circle
         half = size / 2
         ext = half * 0.4
-        pen = QPen(color, thickness)
-        painter.setPen(pen)
-        painter.drawLine(QPointF(cx - half - ext, cy), QPointF(cx - half, cy))
-        painter.drawLine(QPointF(cx + half, cy), QPointF(cx + half + ext, cy))
-        painter.drawLine(QPointF(cx, cy - half - ext), QPointF(cx, cy - half))
-        painter.drawLine(QPointF(cx, cy + half), QPointF(cx, cy + half + ext))
-
+        # Cross lines extending from the circle
+        lines = _lines(
+            (-half - ext, 0, -half, 0), (half, 0, half + ext, 0),
+            (0, -half - ext, 0, -half), (0, half, 0, half + ext),
+        )
+        shape = _stroke(_disc(half), thickness).united(_stroke(lines, thickness))
         if dot and dot_size > 0:
-            painter.setBrush(QBrush(color))
-            painter.setPen(QPen(color, 1))
-            painter.drawEllipse(QPointF(cx, cy), dot_size, dot_size)
+            shape = shape.united(_disc(dot_size + 0.5))
+        return shape
 
-    def _draw_square(self, painter, cx, cy, size, thickness, gap, color, dot, dot_size, t_style):
+    def _shape_square(self, size, thickness, gap, dot, dot_size, t_style):
         """Square/box crosshair."""
-        pen = QPen(color, thickness)
-        pen.setJoinStyle(0x00)  # MiterJoin
-        painter.setPen(pen)
-        painter.setBrush(QBrush())
         half = size / 2
-        painter.drawRect(QRectF(cx - half, cy - half, size, size))
-
+        rect = QPainterPath()
+        rect.addRect(QRectF(-half, -half, size, size))
+        shape = _stroke(rect, thickness, join=Qt.MiterJoin)
         if dot and dot_size > 0:
-            painter.setBrush(QBrush(color))
-            painter.setPen(QPen(color, 1))
-            painter.drawEllipse(QPointF(cx, cy), dot_size, dot_size)
+            shape = shape.united(_disc(dot_size + 0.5))
+        return shape
 
-    def _draw_plus_thin(self, painter, cx, cy, size, thickness, gap, color, dot, dot_size, t_style):
+    def _shape_plus_thin(self, size, thickness, gap, dot, dot_size, t_style):
         """Thin plus — full lines through center, no gap."""
-        pen = QPen(color, max(1, thickness * 0.6))
-        pen.setCapStyle(0x10)  # SquareCap
-        painter.setPen(pen)
         half = size / 2
-        painter.drawLine(QPointF(cx - half, cy), QPointF(cx + half, cy))
-        if not t_style:
-            painter.drawLine(QPointF(cx, cy - half), QPointF(cx, cy + half))
-        else:
-            painter.drawLine(QPointF(cx, cy), QPointF(cx, cy + half))
-
+        vertical = (0, 0, 0, half) if t_style else (0, -half, 0, half)
+        shape = _stroke(_lines((-half, 0, half, 0), vertical), max(1, thickness * 0.6))
         if dot and dot_size > 0:
-            painter.setBrush(QBrush(color))
-            painter.setPen(QPen(color, 1))
-            painter.drawEllipse(QPointF(cx, cy), dot_size, dot_size)
+            shape = shape.united(_disc(dot_size + 0.5))
+        return shape
 
-    def _draw_crosscircle(self, painter, cx, cy, size, thickness, gap, color, dot, dot_size, t_style):
+    def _shape_crosscircle(self, size, thickness, gap, dot, dot_size, t_style):
         """Cross inside a circle."""
-        pen = QPen(color, thickness)
-        painter.setPen(pen)
-        painter.setBrush(QBrush())
         radius = size / 2
-        painter.drawEllipse(QPointF(cx, cy), radius, radius)
-
-        # Draw cross lines inside with gap
-        pen.setCapStyle(0x10)
-        painter.setPen(pen)
-        painter.drawLine(QPointF(cx + gap, cy), QPointF(cx + radius * 0.7, cy))
-        painter.drawLine(QPointF(cx - gap, cy), QPointF(cx - radius * 0.7, cy))
-        painter.drawLine(QPointF(cx, cy + gap), QPointF(cx, cy + radius * 0.7))
+        inner = radius * 0.7
+        # Cross lines inside with gap
+        segments = [(gap, 0, inner, 0), (-gap, 0, -inner, 0), (0, gap, 0, inner)]
         if not t_style:
-            painter.drawLine(QPointF(cx, cy - gap), QPointF(cx, cy - radius * 0.7))
-
+            segments.append((0, -gap, 0, -inner))
+        shape = _stroke(_disc(radius), thickness).united(_stroke(_lines(*segments), thickness))
         if dot and dot_size > 0:
-            painter.setBrush(QBrush(color))
-            painter.setPen(QPen(color, 1))
-            painter.drawEllipse(QPointF(cx, cy), dot_size, dot_size)
+            shape = shape.united(_disc(dot_size + 0.5))
+        return shape
 
-    def _draw_arrows(self, painter, cx, cy, size, thickness, gap, color, dot, dot_size, t_style):
+    def _shape_arrows(self, size, thickness, gap, dot, dot_size, t_style):
         """Four small arrows pointing inward toward center."""
-        pen = QPen(color, thickness)
-        pen.setCapStyle(0x20)  # RoundCap
-        pen.setJoinStyle(0x80)  # RoundJoin
-        painter.setPen(pen)
         half = size / 2
-        arrow_len = half * 0.35
-
-        # Right arrow pointing left
-        tip_x = cx + gap
-        base_x = cx + half
-        painter.drawLine(QPointF(base_x, cy), QPointF(tip_x, cy))
-        painter.drawLine(QPointF(tip_x, cy), QPointF(tip_x + arrow_len, cy - arrow_len))
-        painter.drawLine(QPointF(tip_x, cy), QPointF(tip_x + arrow_len, cy + arrow_len))
-
-        # Left arrow pointing right
-        tip_x = cx - gap
-        base_x = cx - half
-        painter.drawLine(QPointF(base_x, cy), QPointF(tip_x, cy))
-        painter.drawLine(QPointF(tip_x, cy), QPointF(tip_x - arrow_len, cy - arrow_len))
-        painter.drawLine(QPointF(tip_x, cy), QPointF(tip_x - arrow_len, cy + arrow_len))
-
-        # Bottom arrow pointing up
-        tip_y = cy + gap
-        base_y = cy + half
-        painter.drawLine(QPointF(cx, base_y), QPointF(cx, tip_y))
-        painter.drawLine(QPointF(cx, tip_y), QPointF(cx - arrow_len, tip_y + arrow_len))
-        painter.drawLine(QPointF(cx, tip_y), QPointF(cx + arrow_len, tip_y + arrow_len))
-
-        # Top arrow pointing down
+        a = half * 0.35
+        segments = [
+            # Right arrow pointing left
+            (half, 0, gap, 0), (gap, 0, gap + a, -a), (gap, 0, gap + a, a),
+            # Left arrow pointing right
+            (-half, 0, -gap, 0), (-gap, 0, -gap - a, -a), (-gap, 0, -gap - a, a),
+            # Bottom arrow pointing up
+            (0, half, 0, gap), (0, gap, -a, gap + a), (0, gap, a, gap + a),
+        ]
         if not t_style:
-            tip_y = cy - gap
-            base_y = cy - half
-            painter.drawLine(QPointF(cx, base_y), QPointF(cx, tip_y))
-            painter.drawLine(QPointF(cx, tip_y), QPointF(cx - arrow_len, tip_y - arrow_len))
-            painter.drawLine(QPointF(cx, tip_y), QPointF(cx + arrow_len, tip_y - arrow_len))
-
+            # Top arrow pointing down
+            segments += [(0, -half, 0, -gap), (0, -gap, -a, -gap - a), (0, -gap, a, -gap - a)]
+        shape = _stroke(_lines(*segments), thickness, Qt.RoundCap, Qt.RoundJoin)
         if dot and dot_size > 0:
-            painter.setBrush(QBrush(color))
-            painter.setPen(QPen(color, 1))
-            painter.drawEllipse(QPointF(cx, cy), dot_size, dot_size)
+            shape = shape.united(_disc(dot_size + 0.5))
+        return shape
+
+
+class SpriteCache:
+    """
+    Rasterized crosshair sprites, shared by every overlay window.
+
+    A sprite is keyed by (CrosshairSnapshot, device pixel ratio) and is
+    rasterized at the screen's native resolution, so screens with the same
+    DPR reuse one crisp raster. Frames whose animation only changes opacity
+    or rotation are blitted from the sprite; geometry/color animations fall
+    back to vector drawing. Thread-safe, so sprites can be prefetched on a
+    worker thread.
+
+    Settings previews pass preview=True: they get their own small LRU, so
+    dragging a slider through dozens of values never evicts the live or
+    prefetched overlay sprites.
+    """
+
+    def __init__(self, renderer: CrosshairRenderer, max_entries: int = 16,
+                 preview_entries: int = 4):
+        self.renderer = renderer
+        self.max_entries = max_entries
+        self.preview_entries = preview_entries
+        self._sprites: OrderedDict = OrderedDict()
+        self._previews: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def sprite(self, config, dpr: float = 1.0,
+               preview: bool = False) -> tuple[QImage, float]:
+        """Return (image, half_extent) for the static crosshair."""
+        config = self.renderer.snapshot(config)
+        key = (config, round(dpr, 3))
+        with self._lock:
+            # A preview of the live crosshair reuses the overlay's sprite
+            for cache in ((self._sprites, self._previews) if preview else (self._sprites,)):
+                entry = cache.get(key)
+                if entry is not None:
+                    cache.move_to_end(key)
+                    return entry
+
+        half = math.ceil(self.renderer.extent(config))
+        side = math.ceil(2 * half * dpr)
+        image = QImage(side, side, QImage.Format_ARGB32_Premultiplied)
+        image.setDevicePixelRatio(dpr)  # Paint in logical px, store device px
+        image.fill(Qt.transparent)
+        painter = QPainter(image)
+        self.renderer.draw(painter, half, half, config)
+        painter.end()
+
+        entry = (image, half)
+        cache, limit = ((self._previews, self.preview_entries) if preview
+                        else (self._sprites, self.max_entries))
+        with self._lock:
+            cache[key] = entry
+            while len(cache) > limit:
+                cache.popitem(last=False)
+        return entry
+
+    def contains(self, config, dpr: float = 1.0) -> bool:
+        with self._lock:
+            return (self.renderer.snapshot(config), round(dpr, 3)) in self._sprites
+
+    def draw(self, painter: QPainter, center_x: float, center_y: float, config,
+             anim_state: dict, dpr: float = 1.0, preview: bool = False):
+        """Draw the crosshair, from the sprite cache when the frame allows it."""
+        if (anim_state.get("size_mult", 1.0) != 1.0
+                or anim_state.get("gap_offset", 0.0) != 0.0
+                or anim_state.get("color_override") is not None):
+            self.renderer.draw(painter, center_x, center_y, config, anim_state)
+            return
+
+        image, half = self.sprite(config, dpr, preview)
+        rotation = anim_state.get("rotation", 0.0)
+        painter.save()
+        painter.setOpacity(painter.opacity() * anim_state.get("opacity", 1.0))
+        if rotation:
+            painter.setRenderHint(QPainter.SmoothPixmapTransform, True)
+            painter.translate(center_x, center_y)
+            painter.rotate(rotation)
+            painter.drawImage(QPointF(-half, -half), image)
+        else:
+            painter.drawImage(QPointF(center_x - half, center_y - half), image)
+        painter.restore()
+
+    def retain_dprs(self, dprs) -> int:
+        """Evict sprites rendered for a DPR no screen uses anymore."""
+        keep = {round(d, 3) for d in dprs}
+        with self._lock:
+            stale = [key for key in self._sprites if key[1] not in keep]
+            for key in stale:
+                del self._sprites[key]
+            stale_previews = [key for key in self._previews if key[1] not in keep]
+            for key in stale_previews:
+                del self._previews[key]
+        return len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._sprites.clear()
+            self._previews.clear()
@@ -0,0 +1,224 @@
+"""
+Game data for CrosshairX: the executables the Games tab detects, a
+recommended crosshair per game and bilingual tips. Plain dicts, imported
+only when the Games tab needs them.
+"""
+
+# -- Known game executables for monitoring --
+KNOWN_GAMES = {
+    "RobloxPlayerBeta.exe": "Roblox",
+    "FortniteClient-Win64-Shipping.exe": "Fortnite",
+    "csgo.exe": "CS:GO",
+    "cs2.exe": "Counter-Strike 2",
+    "valorant.exe": "Valorant",
+    "VALORANT-Win64-Shipping.exe": "Valorant",
+    "javaw.exe": "Minecraft (Java)",
+    "Minecraft.Windows.exe": "Minecraft (Bedrock)",
+    "GTA5.exe": "GTA V",
+    "r5apex.exe": "Apex Legends",
+    "overwatch.exe": "Overwatch 2",
+    "dota2.exe": "Dota 2",
+    "LeagueofLegends.exe": "League of Legends",
+    "League of Legends.exe": "League of Legends",
+    "PUBG-Win64-Shipping.exe": "PUBG",
+    "TslGame.exe": "PUBG",
+    "RocketLeague.exe": "Rocket League",
+    "eldenring.exe": "Elden Ring",
+    "Cyberpunk2077.exe": "Cyberpunk 2077",
+    "cod.exe": "Call of Duty",
+    "ModernWarfare.exe": "Call of Duty: MW",
+    "destiny2.exe": "Destiny 2",
+    "Warframe.x64.exe": "Warframe",
+    "GenshinImpact.exe": "Genshin Impact",
+    "ZenlessZoneZero.exe": "Zenless Zone Zero",
+    "HonkaiStarRail.exe": "Honkai: Star Rail",
+    "DeadByDaylight-Win64-Shipping.exe": "Dead By Daylight",
+    "Terraria.exe": "Terraria",
+    "left4dead2.exe": "Left 4 Dead 2",
+    "hl2.exe": "Half-Life 2",
+    "rust.exe": "Rust",
+    "EscapeFromTarkov.exe": "Escape from Tarkov",
+    "DayZGame_x64.exe": "DayZ",
+    "bf2042.exe": "Battlefield 2042",
+    "WorldOfTanks.exe": "World of Tanks",
+    "WoT.exe": "World of Tanks",
+    "WorldOfWarships.exe": "World of Warships",
+    "Warthunder.exe": "War Thunder",
+    "aces.exe": "War Thunder",
+    "Overwatch.exe": "Overwatch 2",
+    "amongus.exe": "Among Us",
+    "FallGuys_client_game.exe": "Fall Guys",
+    "PalWorld-Win64-Shipping.exe": "Palworld",
+}
+
+# -- Recommended crosshair presets per game --
+GAME_PRESETS = {
+    "Roblox": {
+        "style": "cross", "size": 16, "thickness": 2, "gap": 3,
+        "color": [0, 255, 128, 255], "dot": True, "dot_size": 2,
+        "outline": True, "outline_thickness": 1, "t_style": False,
+    },
+    "Counter-Strike 2": {
+        "style": "cross", "size": 8, "thickness": 1, "gap": 3,
+        "color": [0, 255, 0, 255], "dot": False, "dot_size": 1,
+        "outline": True, "outline_thickness": 1, "t_style": False,
+    },
+    "CS:GO": {
+        "style": "cross", "size": 8, "thickness": 1, "gap": 3,
+        "color": [0, 255, 0, 255], "dot": False, "dot_size": 1,
+        "outline": True, "outline_thickness": 1, "t_style": False,
+    },
+    "Valorant": {
+        "style": "crossdot", "size": 12, "thickness": 2, "gap": 4,
+        "color": [0, 255, 100, 255], "dot": True, "dot_size": 2,
+        "outline": True, "outline_thickness": 1, "t_style": False,
+    },
+    "Fortnite": {
+        "style": "cross", "size": 14, "thickness": 2, "gap": 4,
+        "color": [255, 255, 255, 255], "dot": True, "dot_size": 2,
+        "outline": True, "outline_thickness": 1, "t_style": False,
+    },
+    "Apex Legends": {
+        "style": "circle", "size": 18, "thickness": 2, "gap": 5,
+        "color": [255, 50, 50, 255], "dot": True, "dot_size": 2,
+        "outline": True, "outline_thickness": 1, "t_style": False,
+    },
+    "Overwatch 2": {
+        "style": "crossdot", "size": 10, "thickness": 2, "gap": 5,
+        "color": [0, 255, 0, 255], "dot": True, "dot_size": 3,
+        "outline": False, "outline_thickness": 1, "t_style": False,
+    },
+    "Minecraft (Java)": {
+        "style": "plus_thin", "size": 20, "thickness": 2, "gap": 0,
+        "color": [255, 255, 255, 200], "dot": False, "dot_size": 1,
+        "outline": False, "outline_thickness": 1, "t_style": False,
+    },
+    "Minecraft (Bedrock)": {
+        "style": "plus_thin", "size": 20, "thickness": 2, "gap": 0,
+        "color": [255, 255, 255, 200], "dot": False, "dot_size": 1,
+        "outline": False, "outline_thickness": 1, "t_style": False,
+    },
+    "PUBG": {
+        "style": "cross", "size": 10, "thickness": 1, "gap": 4,
+        "color": [255, 255, 255, 255], "dot": True, "dot_size": 2,
+        "outline": True, "outline_thickness": 1, "t_style": False,
+    },
+    "Dota 2": {
+        "style": "crosscircle", "size": 22, "thickness": 2, "gap": 6,
+        "color": [255, 200, 0, 200], "dot": True, "dot_size": 3,
+        "outline": False, "outline_thickness": 1, "t_style": False,
+    },
+    "GTA V": {
+        "style": "dot", "size": 6, "thickness": 2, "gap": 0,
+        "color": [255, 255, 255, 220], "dot": True, "dot_size": 3,
+        "outline": True, "outline_thickness": 1, "t_style": False,
+    },
+}
+
+# -- Game tips (bilingual) --
+GAME_TIPS = {
+    "Roblox": {
+        "ru": [
+            "Маленький крест (16px) идеален для Arsenal и Phantom Forces",
+            "T-стиль улучшает видимость противников под прицелом",
+            "Зелёный цвет виден на большинстве карт Roblox",
+            "Обводка помогает видеть прицел на ярких поверхностях",
+        ],
+        "en": [
+            "Small cross (16px) is ideal for Arsenal and Phantom Forces",
+            "T-style improves enemy visibility below the crosshair",
+            "Green color is visible on most Roblox maps",
+            "Outline helps see crosshair on bright surfaces",
+        ],
+    },
+    "Counter-Strike 2": {
+        "ru": [
+            "Тонкий крест (1px) — стандарт для про-игроков CS",
+            "Маленький gap помогает точнее целиться на головы",
+            "Отключите точку — она мешает на дальних дистанциях",
+            "Зелёный цвет — классика CS, виден на любой карте",
+        ],
+        "en": [
+            "Thin cross (1px) is standard for CS pro players",
+            "Small gap helps aim at heads more precisely",
+            "Disable dot — it interferes at long distances",
+            "Green — classic CS color, visible on any map",
+        ],
+    },
+    "CS:GO": {
+        "ru": [
+            "Тонкий крест (1px) — стандарт для CS",
+            "Точка в центре мешает на дальней дистанции",
+        ],
+        "en": [
+            "Thin cross (1px) is standard for CS",
+            "Center dot interferes at long distance",
+        ],
+    },
+    "Valorant": {
+        "ru": [
+            "Средний крест с точкой — стандарт Valorant",
+            "Прицел 12-14px оптимален для перестрелок",
+            "Используйте обводку для лучшей видимости",
+        ],
+        "en": [
+            "Medium cross with dot is Valorant standard",
+            "12-14px crosshair is optimal for gunfights",
+            "Use outline for better visibility",
+        ],
+    },
+    "Fortnite": {
+        "ru": [
+            "Белый крест хорошо видно при строительстве",
+            "Точка в центре помогает при стрельбе от бедра",
+            "Средний размер (14px) для баланса ближний/дальний бой",
+        ],
+        "en": [
+            "White cross is clearly visible while building",
+            "Center dot helps with hip-fire",
+            "Medium size (14px) balances close/long range",
+        ],
+    },
+    "Apex Legends": {
+        "ru": [
+            "Круг подходит для отслеживания быстрых целей",
+            "Красный цвет хорошо виден в Apex",
+            "Большой размер помогает при стрельбе навскидку",
+        ],
+        "en": [
+            "Circle suits tracking fast targets",
+            "Red color is clearly visible in Apex",
+            "Larger size helps with snap-aiming",
+        ],
+    },
+    "Overwatch 2": {
+        "ru": [
+            "Крест с точкой (10px) — универсальный выбор",
+            "Зелёный цвет оптимален для большинства карт",
+        ],
+        "en": [
+            "Cross with dot (10px) — universal choice",
+            "Green color is optimal for most maps",
+        ],
+    },
+    "Minecraft (Java)": {
+        "ru": [
+            "Тонкий плюс заменяет стандартный прицел Minecraft",
+            "Белый цвет с прозрачностью не мешает обзору",
+        ],
+        "en": [
+            "Thin plus replaces default Minecraft crosshair",
+            "White with transparency doesn't obstruct the view",
+        ],
+    },
+    "Minecraft (Bedrock)": {
+        "ru": [
+            "Тонкий плюс заменяет стандартный прицел Minecraft",
+            "Белый цвет с прозрачностью не мешает обзору",
+        ],
+        "en": [
+            "Thin plus replaces default Minecraft crosshair",
+            "White with transparency doesn't obstruct the view",
+        ],
+    },
+}
@@ -0,0 +1,117 @@
+"""
+Undo/redo history for CrosshairX settings.
+Every step is a ConfigSnapshot. Snapshots are immutable and share every
+section that did not change, so a step that moves one slider costs one
+small section tuple, not a copy of the config.
+"""
+
+import time
+
+from .config import Config, ConfigSnapshot
+from .schema import SCHEMA
+
+
+def _thaw(section: str, key: str, value):
+    """Snapshot value -> config value (tuples back to lists/dicts)."""
+    if SCHEMA[section][key].kind == "offsets":
+        return {name: list(xy) for name, xy in value}
+    return list(value) if isinstance(value, tuple) else value
+
+
+class EditHistory:
+    """
+    Linear undo/redo stack over the crosshair, animation and display sections.
+
+    Records a step on every config change in those sections. Changes to
+    the same keys within MERGE_WINDOW seconds (a slider drag, a held
+    spin box) collapse into one step. Undo/redo write back only the
+    fields that differ, in one batch, so subscribers see exactly the
+    keys that changed.
+    """
+
+    SECTIONS = ("crosshair", "animation", "display")
+    MAX_STEPS = 5000
+    MERGE_WINDOW = 0.6  # Seconds
+
+    def __init__(self, config: Config, on_change=None):
+        self.config = config
+        self.on_change = on_change    # Called after the stack or position changes
+        self._states: list[ConfigSnapshot] = [config.snapshot]
+        self._index = 0
+        self._last_keys = None
+        self._last_time = 0.0
+        self._applying = False
+        config.subscribe(self._record, *self.SECTIONS)
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def can_undo(self) -> bool:
+        return self._index > 0
+
+    def can_redo(self) -> bool:
+        return self._index < len(self._states) - 1
+
+    def undo(self) -> bool:
+        if not self.can_undo():
+            return False
+        self._index -= 1
+        self._apply(self._states[self._index])
+        return True
+
+    def redo(self) -> bool:
+        if not self.can_redo():
+            return False
+        self._index += 1
+        self._apply(self._states[self._index])
+        return True
+
+    def clear(self):
+        self._states = [self.config.snapshot]
+        self._index = 0
+        self._last_keys = None
+        self._changed()
+
+    def close(self):
+        self.config.unsubscribe(self._record)
+
+    def _changed(self):
+        if self.on_change is not None:
+            self.on_change()
+
+    def _record(self, change):
+        if self._applying:
+            return
+        state = self.config.snapshot
+        if state == self._states[self._index]:
+            return
+        now = time.monotonic()
+        if (change.keys == self._last_keys and now - self._last_time < self.MERGE_WINDOW
+                and self._index == len(self._states) - 1):
+            self._states[self._index] = state
+        else:
+            del self._states[self._index + 1:]  # A new edit drops the redo branch
+            self._states.append(state)
+            if len(self._states) > self.MAX_STEPS:
+                del self._states[:len(self._states) - self.MAX_STEPS]
+            self._index = len(self._states) - 1
+        self._last_keys, self._last_time = change.keys, now
+        self._changed()
+
+    def _apply(self, state: ConfigSnapshot):
+        current = self.config.snapshot
+        self._applying = True
+        try:
+            with self.config.batch():
+                for section in self.SECTIONS:
+                    old, new = getattr(current, section), getattr(state, section)
+                    if old is new:
+                        continue  # Shared section: nothing in it changed
+                    for key, before, after in zip(new._fields, old, new):
+                        if before != after:
+                            self.config.set(f"{section}.{key}", _thaw(section, key, after))
+        finally:
+            self._applying = False
+        self.config.save()
+        self._last_keys = None
+        self._changed()
@@ -21,6 +21,7 @@ _STRINGS = {
     "tray.anim_on": {"ru": "Анимация вкл", "en": "Animation ON"},
     "tray.anim_off": {"ru": "Анимация выкл", "en": "Animation OFF"},
     "tray.profile": {"ru": "Профиль", "en": "Profile"},
+    "tray.more_profiles": {"ru": "Все профили…", "en": "More…"},
 
     # ---- Tabs ----
     "tab.crosshair": {"ru": "Прицел", "en": "Crosshair"},
@@ -108,6 +109,8 @@ _STRINGS = {
     "hk.prev":     {"ru": "Предыдущий профиль",       "en": "Previous profile"},
     "hk.anim":     {"ru": "Вкл / выкл анимацию",      "en": "Toggle animation"},
     "hk.settings": {"ru": "Открыть настройки",        "en": "Open settings"},
+    "hk.undo":     {"ru": "Отменить изменение",       "en": "Undo change"},
+    "hk.redo":     {"ru": "Повторить изменение",      "en": "Redo change"},
 
     # ---- Game Monitor tab ----
     "mon.system": {"ru": "Системные ресурсы", "en": "System Resources"},
@@ -121,6 +124,7 @@ _STRINGS = {
     "mon.uptime": {"ru": "Время работы:", "en": "Uptime:"},
     "mon.cpu_freq": {"ru": "Частота CPU:", "en": "CPU Freq:"},
     "mon.cpu_cores": {"ru": "Ядра / Потоки:", "en": "Cores / Threads:"},
+    "mon.apply_latency": {"ru": "Задержка хоткея:", "en": "Hotkey latency:"},
     "mon.games": {"ru": "Обнаруженные игры", "en": "Detected Games"},
     "mon.no_games": {"ru": "Игры не обнаружены", "en": "No games detected"},
     "mon.refresh": {"ru": "Обновить", "en": "Refresh"},
@@ -215,6 +219,11 @@ _STRINGS = {
     "btn.hide":  {"ru": "Скрыть прицел",   "en": "Hide crosshair"},
     "btn.show":  {"ru": "Показать прицел",  "en": "Show crosshair"},
     "btn.quit":  {"ru": "Выход",            "en": "Quit"},
+    "btn.live":  {"ru": "Сразу",            "en": "Live"},
+    "btn.live_tip": {
+        "ru": "Изменения сразу видны на прицеле, без кнопки «Применить»",
+        "en": "Changes show on the crosshair right away, without Apply",
+    },
 
     # ---- Import crosshair from AI ----
     "prof.import_title": {"ru": "Импорт прицела", "en": "Import Crosshair"},
@@ -272,21 +281,66 @@ _STRINGS = {
                '"outline":true,"outline_thickness":2,"t_style":true}'),
     },
     "prof.import_copy_btn": {"ru": "Копировать инструкцию", "en": "Copy instruction"},
-    "prof.import_paste_hint": {"ru": "Вставьте JSON конфигурацию:", "en": "Paste JSON config:"},
+    "prof.import_paste_hint": {"ru": "Вставьте JSON конфигурацию или код прицела (CX...):",
+                               "en": "Paste JSON config or a share code (CX...):"},
     "prof.import_apply_btn": {"ru": "Применить", "en": "Apply"},
     "prof.import_cancel": {"ru": "Отмена", "en": "Cancel"},
     "prof.import_success": {"ru": "Прицел успешно импортирован!", "en": "Crosshair imported!"},
     "prof.import_error_title": {"ru": "Ошибка импорта", "en": "Import Error"},
+    "prof.search": {"ru": "Поиск по имени, #тег...", "en": "Search by name, #tag..."},
+    "prof.any_style": {"ru": "Любой стиль", "en": "Any style"},
+    "prof.any_color": {"ru": "Любой цвет", "en": "Any color"},
+    "prof.any_anim": {"ru": "Любая анимация", "en": "Any animation"},
+    "prof.count": {"ru": "Показано {shown} из {total}", "en": "Showing {shown} of {total}"},
+    "prof.tags": {"ru": "Теги...", "en": "Tags..."},
+    "prof.tags_prompt": {"ru": "Теги профиля '{name}' (через запятую):",
+                         "en": "Tags for '{name}' (comma-separated):"},
+    "prof.color_red":    {"ru": "Красный",    "en": "Red"},
+    "prof.color_orange": {"ru": "Оранжевый",  "en": "Orange"},
+    "prof.color_yellow": {"ru": "Жёлтый",     "en": "Yellow"},
+    "prof.color_green":  {"ru": "Зелёный",    "en": "Green"},
+    "prof.color_cyan":   {"ru": "Голубой",    "en": "Cyan"},
+    "prof.color_blue":   {"ru": "Синий",      "en": "Blue"},
+    "prof.color_purple": {"ru": "Фиолетовый", "en": "Purple"},
+    "prof.color_pink":   {"ru": "Розовый",    "en": "Pink"},
+    "prof.color_white":  {"ru": "Белый",      "en": "White"},
+    "prof.color_gray":   {"ru": "Серый",      "en": "Gray"},
+    "prof.color_black":  {"ru": "Чёрный",     "en": "Black"},
+    "prof.library": {"ru": "Библиотека профилей", "en": "Profile Library"},
+    "prof.lib_import": {"ru": "Импорт из ZIP...", "en": "Import ZIP..."},
+    "prof.lib_export": {"ru": "Экспорт в ZIP...", "en": "Export ZIP..."},
+    "prof.lib_conflict": {"ru": "Если имя занято:", "en": "If the name exists:"},
+    "prof.conflict_skip": {"ru": "Пропустить", "en": "Skip"},
+    "prof.conflict_overwrite": {"ru": "Заменить", "en": "Overwrite"},
+    "prof.conflict_rename": {"ru": "Переименовать", "en": "Rename"},
+    "prof.lib_done": {
+        "ru": "Готово: {written} записано, {skipped} пропущено, {failed} с ошибками",
+        "en": "Done: {written} written, {skipped} skipped, {failed} failed",
+    },
+    "prof.lib_error": {"ru": "Не удалось обработать архив", "en": "Could not process the archive"},
+    "prof.share_btn": {"ru": "Копировать код прицела", "en": "Copy share code"},
+    "prof.share_hint": {
+        "ru": "Короткий код с прицелом и анимацией — вставьте его в «Импорт» на другом ПК",
+        "en": "A short code with your crosshair and animation — paste it into Import on another PC",
+    },
     "prof.import_error_msg": {"ru": "Не удалось прочитать JSON:", "en": "Failed to parse JSON:"},
 }
 
+LANGUAGES = ("ru", "en")
+
 _current_lang = "ru"
 
+# Text setter (a bound method such as label.setText) -> (key or text callable, format kwargs)
+_bindings: dict = {}
+
 
 def set_language(lang: str):
-    """Set current language ('ru' or 'en')."""
+    """Set current language ('ru' or 'en') and retranslate every bound widget."""
     global _current_lang
-    _current_lang = lang if lang in ("ru", "en") else "ru"
+    lang = lang if lang in LANGUAGES else "ru"
+    if lang != _current_lang:
+        _current_lang = lang
+        retranslate()
 
 
 def get_language() -> str:
@@ -302,3 +356,47 @@ def t(key: str, **kwargs) -> str:
     if kwargs:
         text = text.format(**kwargs)
     return text
+
+
+def _text(key, kwargs: dict) -> str:
+    return key() if callable(key) else t(key, **kwargs)
+
+
+def bind(setter, key, **kwargs):
+    """
+    Show ``t(key, **kwargs)`` through ``setter`` now and after every
+    language change. ``key`` may be a callable returning the text (for
+    composed strings). Binding the same setter again replaces its key,
+    so state-dependent texts (Show/Hide) stay correct.
+    """
+    _bindings[setter] = (key, kwargs)
+    setter(_text(key, kwargs))
+
+
+def tr(widget, key, setter: str = "setText", **kwargs):
+    """bind() ``widget.<setter>`` to ``key`` and return the widget (for inline construction)."""
+    bind(getattr(widget, setter), key, **kwargs)
+    return widget
+
+
+def unbind(setter):
+    """Stop retranslating ``setter`` (its widget now shows text that is not translated)."""
+    _bindings.pop(setter, None)
+
+
+def unbind_widgets(widgets):
+    """Forget every binding whose setter belongs to one of ``widgets`` (a window being destroyed)."""
+    widgets = set(widgets)
+    for setter in list(_bindings):
+        owner = getattr(getattr(setter, "func", setter), "__self__", None)  # partial or method
+        if owner in widgets:
+            del _bindings[setter]
+
+
+def retranslate():
+    """Re-set the text of every bound widget; drops bindings of deleted widgets."""
+    for setter, (key, kwargs) in list(_bindings.items()):
+        try:
+            setter(_text(key, kwargs))
+        except RuntimeError:  # Qt object already deleted
+            del _bindings[setter]
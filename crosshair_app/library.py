@@ -0,0 +1,248 @@
+"""
+Searchable profile library for CrosshairX.
+Keeps a few attributes of every profile (style, color family, size,
+animation, tags) with one secondary index per attribute, so filtering a
+library of tens of thousands of profiles is a handful of set operations
+and never touches a JSON file. Attributes are cached on disk next to the
+config, keyed by file mtime, so only new or changed profiles are parsed
+at startup.
+"""
+
+import colorsys
+import json
+import os
+import threading
+from pathlib import Path
+from typing import NamedTuple
+
+from .profiles import ProfileIndex
+from .schema import default_section, normalize_profile
+
+
+COLOR_FAMILIES = ("red", "orange", "yellow", "green", "cyan", "blue", "purple", "pink",
+                  "white", "gray", "black")
+CACHE_VERSION = 1
+
+
+class ProfileAttrs(NamedTuple):
+    """What the library knows about one profile."""
+    stamp: float          # mtime of the file/pack it was read from
+    style: str
+    color: str            # One of COLOR_FAMILIES
+    size: int
+    animation: str
+    tags: tuple
+
+
+def color_family(rgba) -> str:
+    """Coarse, human color name for an [R, G, B(, A)] color."""
+    r, g, b = (c / 255 for c in rgba[:3])
+    h, s, v = colorsys.rgb_to_hsv(r, g, b)
+    if v < 0.2:
+        return "black"
+    if s < 0.2:
+        return "white" if v > 0.8 else "gray"
+    hue = h * 360
+    for limit, name in ((15, "red"), (45, "orange"), (70, "yellow"), (160, "green"),
+                        (200, "cyan"), (260, "blue"), (290, "purple"), (335, "pink")):
+        if hue < limit:
+            return name
+    return "red"
+
+
+_BASE = {"crosshair": default_section("crosshair"), "animation": default_section("animation")}
+
+
+def profile_attrs(profile: dict, stamp: float) -> ProfileAttrs:
+    """Attributes of a normalized profile (missing keys read as the defaults)."""
+    crosshair = {**_BASE["crosshair"], **profile.get("crosshair", {})}
+    animation = {**_BASE["animation"], **profile.get("animation", {})}
+    return ProfileAttrs(stamp, crosshair["style"], color_family(crosshair["color"]),
+                        crosshair["size"], animation["type"], tuple(profile.get("tags", ())))
+
+
+class ProfileLibrary:
+    """
+    Attribute indexes over a ProfileIndex.
+
+    Every attribute maps value -> set of names; a query intersects the
+    sets it needs (smallest first). Sizes are bucketed per pixel, so a
+    size range is a union of at most ~100 buckets. The library listens
+    to the profile index and re-reads only the profiles that changed.
+    Thread-safe: bulk imports report new files from a worker thread.
+    """
+
+    FIELDS = ("style", "color", "size", "animation")
+
+    def __init__(self, index: ProfileIndex, cache_file: Path = None):
+        self.index = index
+        self.cache_file = Path(cache_file) if cache_file else None
+        self._lock = threading.RLock()
+        self._attrs: dict[str, ProfileAttrs] = {}
+        self._by: dict[str, dict] = {field: {} for field in self.FIELDS}
+        self._by_tag: dict[str, set] = {}
+        self._haystack = None     # (sorted names, lowercase names) for text search
+        self._dirty = False
+        self._build()
+        index.listen(self._on_index_changed)
+
+    def __len__(self) -> int:
+        return len(self._attrs)
+
+    # -- building --
+
+    def _load_cache(self) -> dict:
+        if self.cache_file is None or not self.cache_file.exists():
+            return {}
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != CACHE_VERSION:
+                return {}
+            return {name: ProfileAttrs(row[0], row[1], row[2], row[3], row[4], tuple(row[5]))
+                    for name, row in data.get("profiles", {}).items()}
+        except (ValueError, IOError, TypeError, IndexError, AttributeError) as e:
+            print(f"[Library] Ignoring attribute cache: {e}")
+            return {}
+
+    def _read(self, name: str, stamp: float) -> ProfileAttrs | None:
+        data = self.index.raw(name)
+        if data is None:
+            return None
+        try:
+            return profile_attrs(normalize_profile(json.loads(data)), stamp)
+        except ValueError as e:
+            print(f"[Library] Cannot index profile '{name}': {e}")
+            return None
+
+    def _build(self):
+        cached = self._load_cache()
+        stamps = self.index.stamps()
+        for name in self.index.names():
+            stamp = stamps.get(name)
+            attrs = cached.get(name)
+            if attrs is None or attrs.stamp != stamp:
+                attrs = self._read(name, stamp)
+                self._dirty = True
+            if attrs is not None:
+                self._add(name, attrs)
+        if len(cached) != len(self._attrs):
+            self._dirty = True
+
+    def _add(self, name: str, attrs: ProfileAttrs):
+        self._attrs[name] = attrs
+        for field in self.FIELDS:
+            self._by[field].setdefault(getattr(attrs, field), set()).add(name)
+        for tag in attrs.tags:
+            self._by_tag.setdefault(tag, set()).add(name)
+
+    def _remove(self, name: str):
+        attrs = self._attrs.pop(name, None)
+        if attrs is None:
+            return
+        for field in self.FIELDS:
+            bucket = self._by[field][getattr(attrs, field)]
+            bucket.discard(name)
+            if not bucket:
+                del self._by[field][getattr(attrs, field)]
+        for tag in attrs.tags:
+            bucket = self._by_tag[tag]
+            bucket.discard(name)
+            if not bucket:
+                del self._by_tag[tag]
+
+    def _on_index_changed(self, changed: set, removed: set):
+        fresh = {}
+        for name in changed:
+            attrs = self._read(name, self.index.stamp(name))
+            if attrs is not None:
+                fresh[name] = attrs
+        with self._lock:
+            for name in removed | changed:
+                self._remove(name)
+            for name, attrs in fresh.items():
+                self._add(name, attrs)
+            self._haystack = None
+            self._dirty = True
+
+    # -- queries --
+
+    def _lowered(self) -> tuple:
+        """(sorted names, their lowercase forms), rebuilt after index changes."""
+        if self._haystack is None:
+            names = self.index.names()
+            self._haystack = (names, [name.lower() for name in names])
+        return self._haystack
+
+    def attrs(self, name: str) -> ProfileAttrs | None:
+        return self._attrs.get(name)
+
+    def values(self, field: str) -> list:
+        """Distinct values of ``field`` (or "tags") present in the library, sorted."""
+        with self._lock:
+            return sorted(self._by_tag if field == "tags" else self._by[field])
+
+    def query(self, text: str = "", style: str = None, color: str = None,
+              animation: str = None, size: tuple = None, tags=()) -> list[str]:
+        """
+        Sorted names matching every given filter. ``text`` matches names
+        (case-insensitive substring); its ``#words`` are tags. ``size`` is
+        an inclusive (min, max) range.
+        """
+        words = text.lower().split()
+        tags = [*tags, *(w[1:] for w in words if w.startswith("#") and len(w) > 1)]
+        needles = [w for w in words if not w.startswith("#")]
+
+        with self._lock:
+            sets = []
+            for field, value in (("style", style), ("color", color), ("animation", animation)):
+                if value is not None:
+                    sets.append(self._by[field].get(value, set()))
+            for tag in tags:
+                sets.append(self._by_tag.get(tag.lower(), set()))
+            if size is not None:
+                lo, hi = size
+                buckets = [b for s, b in self._by["size"].items() if lo <= s <= hi]
+                if len(buckets) < len(self._by["size"]):  # Skip ranges that cover everything
+                    sets.append(set().union(*buckets))
+            matches = None
+            if sets:
+                sets.sort(key=len)
+                matches = sets[0].intersection(*sets[1:])
+            if matches is None and not needles:
+                return self.index.names()
+            if matches is not None and len(matches) * 8 < len(self.index):
+                names = sorted(matches)
+                lowered = [n.lower() for n in names]
+            else:
+                # Broad result: filter in (already sorted) index order instead of sorting
+                names, lowered = self._lowered()
+                if matches is not None and not needles:
+                    return [n for n in names if n in matches]
+                if matches is not None:
+                    keep = [n in matches for n in names]
+                    names = [n for n, k in zip(names, keep) if k]
+                    lowered = [low for low, k in zip(lowered, keep) if k]
+        for needle in needles:
+            keep = [needle in low for low in lowered]
+            names = [n for n, k in zip(names, keep) if k]
+            lowered = [low for low, k in zip(lowered, keep) if k]
+        return names
+
+    # -- persistence --
+
+    def flush(self):
+        """Write the attribute cache if it changed."""
+        if self.cache_file is None or not self._dirty:
+            return
+        with self._lock:
+            rows = {name: list(attrs) for name, attrs in self._attrs.items()}
+            self._dirty = False
+        tmp = self.cache_file.with_name(self.cache_file.name + ".tmp")
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"version": CACHE_VERSION, "profiles": rows}, f,
+                          separators=(",", ":"), ensure_ascii=False)
+            os.replace(tmp, self.cache_file)
+        except IOError as e:
+            print(f"[Library] Cannot save attribute cache: {e}")
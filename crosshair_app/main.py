@@ -6,21 +6,34 @@ Usage:
     python -m crosshair_app          — Launch the app
     python -m crosshair_app --help   — Show help
     python -m crosshair_app --tray   — Launch minimized to tray
+    python -m crosshair_app --export-pack FILE   — Bundle all profiles into a pack
+    python -m crosshair_app --import-pack FILE   — Unpack a pack into profiles
+    python -m crosshair_app --export-profiles ZIP|DIR  — Export all profiles
+    python -m crosshair_app --import-profiles ZIP|DIR  — Import profiles in bulk
+    python -m crosshair_app --share-code [NAME]  — Print a share code
+    python -m crosshair_app --decode-code CODE   — Print a share code as JSON
+    python -m crosshair_app --profile-startup    — Print startup phase timings, then exit
 """
 
 import sys
+import gc
+import json
 import os
 import ctypes
 import threading
 
-from PyQt5.QtCore import Qt, QTimer
+from . import startup  # Before Qt: its clock starts here
+from PyQt5 import sip
+from PyQt5.QtCore import Qt, QTimer, QFileSystemWatcher, QObject, QEvent
 from PyQt5.QtWidgets import QApplication, QSystemTrayIcon, QMenu, QAction, QMessageBox
-from PyQt5.QtGui import QIcon, QPixmap, QPainter, QColor, QBrush, QPen
+from PyQt5.QtGui import QIcon, QPixmap, QPixmapCache, QPainter, QColor, QBrush, QPen
 
-from .config import Config
-from .overlay import OverlayWindow
-from .settings import SettingsPanel
-from .i18n import t, set_language
+from .config import Config, PROFILES_DIR
+from .overlay import OverlayManager
+from .prefetch import ProfilePrefetcher
+from .i18n import tr, set_language, unbind_widgets
+
+startup.mark("imports")
 
 
 def _resource_path(relative: str) -> str:
@@ -63,6 +76,27 @@ def create_app_icon() -> QIcon:
     return QIcon(pixmap)
 
 
+def process_rss_mib() -> float | None:
+    """Resident memory of this process in MiB (None without psutil)."""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss / 2**20
+    except (ImportError, OSError):
+        return None
+
+
+def release_free_memory():
+    """Hand freed heap pages back to the OS, so RSS shows what is really in use."""
+    try:
+        if sys.platform == "win32":
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetProcessWorkingSetSize(kernel32.GetCurrentProcess(), -1, -1)
+        elif sys.platform.startswith("linux"):
+            ctypes.CDLL("libc.so.6").malloc_trim(0)
+    except (OSError, AttributeError):
+        pass
+
+
 def _get_icon_path() -> str:
     """Return path to the .ico file (bundled or assets/)."""
     return _resource_path(os.path.join("assets", "icon.ico"))
@@ -115,9 +149,26 @@ $s.Save()
         return False
 
 
+class _FirstPaint(QObject):
+    """Calls ``callback`` once the watched widget has finished its first paint."""
+
+    def __init__(self, widget, callback):
+        super().__init__(widget)
+        self._callback = callback
+        widget.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint:
+            obj.removeEventFilter(self)
+            QTimer.singleShot(0, self._callback)  # Runs after this paint completes
+        return False
+
+
 class CrosshairXApp:
     """Main application controller."""
 
+    TRAY_PROFILES = 30  # Profiles listed in the tray submenu; the rest via "More…"
+
     def __init__(self, start_minimized: bool = False):
         # Enable DPI awareness on Windows
         if sys.platform == "win32":
@@ -133,16 +184,26 @@ class CrosshairXApp:
             except Exception:
                 pass
 
+        # Per-screen device pixel ratios: overlays render at native resolution
+        QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
+        QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
+        if hasattr(QApplication, "setHighDpiScaleFactorRoundingPolicy"):
+            QApplication.setHighDpiScaleFactorRoundingPolicy(
+                Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
+            )
+
         self.app = QApplication(sys.argv)
         self.app.setApplicationName("CrosshairX")
         self.app.setQuitOnLastWindowClosed(False)
 
         self.icon = create_app_icon()
         self.app.setWindowIcon(self.icon)
+        startup.mark("qapplication")
 
         # Load config
         self.config = Config()
         set_language(self.config.get("general.language", "ru"))
+        startup.mark("config")
 
         # Create desktop shortcut on first launch (EXE only)
         # Always check if shortcut file exists (user may have deleted it)
@@ -161,25 +222,33 @@ class CrosshairXApp:
             if not os.path.exists(shortcut_path):
                 create_desktop_shortcut()
 
-        # Create overlay (starts hidden — no crosshair until user applies)
-        self.overlay = OverlayWindow(self.config)
+        # Create overlays (start hidden — no crosshair until user applies)
+        self.overlay = OverlayManager(self.config)
+        # Keep the F7/F8 neighbors parsed and rasterized in the background
+        self.prefetcher = ProfilePrefetcher(self.config, self.overlay)
+        startup.mark("overlay")
 
-        # Create settings panel
-        self.settings = SettingsPanel(self.config, self.overlay)
-        self.settings.setWindowIcon(self.icon)  # Set app icon on settings window
-        self.settings.close_app.connect(self.quit)
-        self.settings.hide_to_tray.connect(self._on_hide_to_tray)
+        # Settings panel is created on first _show_settings (a --tray launch may never need it)
+        # and released again once it has sat hidden in the tray for general.trim_after seconds
+        self.settings = None
+        self._edit_history = None  # Survives the panel, so undo works after a rebuild
+        self._settings_trim = QTimer(self.app)
+        self._settings_trim.setSingleShot(True)
+        self._settings_trim.timeout.connect(self._trim_settings)
 
         # Create system tray
         self._setup_tray()
+        self._setup_profile_watcher()
 
         # Setup global hotkeys
         self._setup_hotkeys()
 
-        # Show overlay window (but _visible=False so nothing draws)
+        # Show overlay windows (but _visible=False so nothing draws)
         self.overlay.show()
+        startup.mark("tray")
         if not start_minimized:
-            self.settings.show()
+            self._show_settings()
+            startup.mark("panel")
 
     def _setup_tray(self):
         """Setup system tray icon with context menu."""
@@ -187,38 +256,89 @@ class CrosshairXApp:
 
         menu = QMenu()
 
-        action_settings = QAction(t('tray.settings'), menu)
+        action_settings = tr(QAction(menu), 'tray.settings')
         action_settings.triggered.connect(self._show_settings)
         menu.addAction(action_settings)
 
-        action_toggle = QAction(t('tray.toggle'), menu)
+        action_toggle = tr(QAction(menu), 'tray.toggle')
         action_toggle.triggered.connect(self._toggle_overlay)
         menu.addAction(action_toggle)
 
-        action_anim = QAction(t('tray.animation'), menu)
-        action_anim.triggered.connect(self._toggle_animation)
-        menu.addAction(action_anim)
+        self._action_anim = tr(QAction(menu), 'tray.animation')
+        self._action_anim.setCheckable(True)
+        self._action_anim.triggered.connect(self._toggle_animation)
+        menu.addAction(self._action_anim)
 
         menu.addSeparator()
 
-        profiles_menu = QMenu(t('tray.profiles'), menu)
-        for name in self.config.list_profiles():
-            action = QAction(name, profiles_menu)
-            action.triggered.connect(lambda checked, n=name: self._switch_profile(n))
-            profiles_menu.addAction(action)
-        menu.addMenu(profiles_menu)
+        # Filled when it opens, capped: a bulk-imported library can hold thousands of profiles
+        self._profiles_menu = tr(QMenu(menu), 'tray.profiles', setter='setTitle')
+        self._profiles_menu.aboutToShow.connect(self._fill_profiles_menu)
+        self._profile_names = self.config.list_profiles()
+        self._profile_actions = {}
+        menu.addMenu(self._profiles_menu)
 
         menu.addSeparator()
 
-        action_quit = QAction(t('tray.quit'), menu)
+        action_quit = tr(QAction(menu), 'tray.quit')
         action_quit.triggered.connect(self.quit)
         menu.addAction(action_quit)
 
         self.tray.setContextMenu(menu)
-        self.tray.setToolTip(t('app.tray_tooltip'))
+        tr(self.tray, 'app.tray_tooltip', setter='setToolTip')
         self.tray.activated.connect(self._on_tray_activated)
         self.tray.show()
 
+        self._update_tray()
+        self.config.subscribe(self._update_tray, "general.current_profile", "animation.enabled")
+
+    def _fill_profiles_menu(self):
+        """Up to TRAY_PROFILES entries (plus the current profile), then "More…"."""
+        current = self.config.get("general.current_profile", "default")
+        shown = self._profile_names[:self.TRAY_PROFILES]
+        if current in self._profile_names and current not in shown:
+            shown.append(current)
+        if shown != list(self._profile_actions):
+            unbind_widgets(self._profiles_menu.actions())  # The old "More…" entry
+            self._profiles_menu.clear()
+            self._profile_actions = {}
+            for name in shown:
+                action = QAction(name, self._profiles_menu)
+                action.setCheckable(True)
+                action.triggered.connect(lambda checked, n=name: self._switch_profile(n))
+                self._profiles_menu.addAction(action)
+                self._profile_actions[name] = action
+            if len(self._profile_names) > len(shown):
+                self._profiles_menu.addSeparator()
+                more = tr(QAction(self._profiles_menu), 'tray.more_profiles')
+                more.triggered.connect(self._show_profile_library)
+                self._profiles_menu.addAction(more)
+        self._update_tray()
+
+    def _setup_profile_watcher(self):
+        """Keep the profile index in sync with the profiles folder (debounced)."""
+        self._profiles_rescan = QTimer(self.app)
+        self._profiles_rescan.setSingleShot(True)
+        self._profiles_rescan.setInterval(150)
+        self._profiles_rescan.timeout.connect(self._on_profiles_dir_changed)
+        self._profiles_watcher = QFileSystemWatcher([str(PROFILES_DIR)], self.app)
+        self._profiles_watcher.directoryChanged.connect(self._profiles_rescan.start)
+
+    def _on_profiles_dir_changed(self):
+        self.config.profiles.rescan()
+        names = self.config.list_profiles()
+        if names != self._profile_names:
+            self._profile_names = names  # The tray submenu picks it up when it next opens
+            if self.settings is not None:
+                self.settings._refresh_profiles()
+
+    def _update_tray(self, change=None):
+        """Check the current profile and the animation toggle in the tray menu."""
+        current = self.config.get("general.current_profile", "default")
+        for name, action in self._profile_actions.items():
+            action.setChecked(name == current)
+        self._action_anim.setChecked(self.config.get("animation.enabled", True))
+
     def _setup_hotkeys(self):
         """Setup global hotkeys using a background thread (Windows)."""
         if sys.platform != "win32":
@@ -262,8 +382,26 @@ class CrosshairXApp:
 
     # ===================== ACTIONS =====================
 
+    def _ensure_settings(self):
+        """The settings panel, created (and its module imported) on first use."""
+        if self.settings is None:
+            from .settings import SettingsPanel
+            self.settings = SettingsPanel(self.config, self.overlay, history=self._edit_history)
+            self.settings.setWindowIcon(self.icon)  # Set app icon on settings window
+            self.settings.close_app.connect(self.quit)
+            self.settings.hide_to_tray.connect(self._on_hide_to_tray)
+        return self.settings
+
+    def _show_profile_library(self):
+        """Settings panel on the Profiles tab, search field focused."""
+        self._show_settings()
+        self.settings.tabs.setCurrentIndex(self.settings.TABS.index("profiles"))
+        self.settings.edit_profile_search.setFocus()
+
     def _show_settings(self):
         """Show settings panel (restore from hidden/minimized state)."""
+        self._settings_trim.stop()
+        self._ensure_settings()
         self.settings.setWindowState(
             self.settings.windowState() & ~Qt.WindowMinimized | Qt.WindowActive
         )
@@ -280,21 +418,17 @@ class CrosshairXApp:
         self.overlay.toggle_animation()
 
     def _next_profile(self):
-        name = self.config.next_profile()
-        if name:
-            self.overlay.refresh_config()
-            self.settings._load_from_config()
+        # One batch from the key press: overlay and panel update via subscriptions
+        with self.config.batch():
+            self.config.next_profile()
 
     def _prev_profile(self):
-        name = self.config.prev_profile()
-        if name:
-            self.overlay.refresh_config()
-            self.settings._load_from_config()
+        # One batch from the key press: overlay and panel update via subscriptions
+        with self.config.batch():
+            self.config.prev_profile()
 
     def _switch_profile(self, name: str):
-        if self.config.load_profile(name):
-            self.overlay.refresh_config()
-            self.settings._load_from_config()
+        self.config.load_profile(name)
 
     def _on_tray_activated(self, reason):
         """Handle tray icon clicks."""
@@ -303,11 +437,37 @@ class CrosshairXApp:
 
     def _on_hide_to_tray(self):
         """Settings window was closed with X — app keeps running in tray."""
-        pass  # Nothing to do; tray is already visible, overlay keeps rendering
+        delay = self.config.get("general.trim_after", 60)
+        if delay > 0:
+            self._settings_trim.start(delay * 1000)
+
+    def _trim_settings(self):
+        """Destroy the hidden settings panel; the next _show_settings rebuilds it."""
+        panel = self.settings
+        if panel is None or panel.isVisible():
+            return
+        if panel.busy():
+            self._settings_trim.start()  # Bulk import/export still running: try later
+            return
+        before = process_rss_mib()
+        self._edit_history = panel.history
+        panel.dispose()
+        self.settings = None
+        sip.delete(panel)  # Now, not deleteLater: nothing of the panel is on the stack
+        # PyQt drops its slot proxies (and the lambdas holding the panel) a few loop passes later
+        QTimer.singleShot(1000, lambda: self._settings_released(before))
+
+    def _settings_released(self, before):
+        QPixmapCache.clear()  # Style pixmaps rendered for the panel's widgets
+        gc.collect()
+        release_free_memory()
+        after = process_rss_mib()
+        if before is not None and after is not None:
+            print(f"[CrosshairX] Settings panel released: RSS {before:.0f} -> {after:.0f} MiB")
 
     def quit(self):
         """Quit the application completely — kills process, removes crosshair."""
-        self.config.save()
+        self.config.flush()  # Synchronous: os._exit below skips the writer thread
         # Stop hotkey polling
         if hasattr(self, '_hotkey_timer'):
             self._hotkey_timer.stop()
@@ -320,8 +480,92 @@ class CrosshairXApp:
 
     def run(self) -> int:
         """Start the application event loop."""
+        if self.settings is not None and self.settings.isVisible():
+            _FirstPaint(self.settings, self._startup_done)
+        else:
+            QTimer.singleShot(0, self._startup_done)  # Tray only: nothing to paint
         return self.app.exec_()
 
+    def _startup_done(self):
+        """The panel has painted (or, tray only, the first event loop pass ran)."""
+        startup.mark("first paint")
+        if "--profile-startup" in sys.argv:
+            print(startup.report(), flush=True)
+            self.quit()
+
+
+def _run_library_command() -> bool:
+    """Handle pack / bulk import-export flags without starting the GUI. True if handled."""
+    for flag in ("--export-pack", "--import-pack", "--export-profiles", "--import-profiles"):
+        if flag not in sys.argv:
+            continue
+        idx = sys.argv.index(flag)
+        if idx + 1 >= len(sys.argv):
+            print(f"[CrosshairX] {flag} needs a file path")
+            sys.exit(2)
+        from .packs import export_pack, import_pack, PackError
+        from . import bulk
+        import zipfile
+        path = sys.argv[idx + 1]
+        try:
+            if flag in ("--export-profiles", "--import-profiles"):
+                config = Config()  # Creates the profiles directory if needed
+                index = config.profiles
+                if flag == "--export-profiles":
+                    result = bulk.export_profiles(index, path)
+                else:
+                    policy = next((p for p in bulk.CONFLICT_POLICIES if f"--{p}" in sys.argv),
+                                  "skip")
+                    result = bulk.import_profiles(path, index, policy)
+                for entry, reason in result.failed:
+                    print(f"[CrosshairX] {entry}: {reason}")
+                print(f"[CrosshairX] {len(result.written)} written, {result.skipped} skipped, "
+                      f"{len(result.failed)} failed")
+                config.flush()
+            elif flag == "--export-pack":
+                count = export_pack(PROFILES_DIR, path)
+                print(f"[CrosshairX] Exported {count} profiles to {path}")
+            else:
+                count = import_pack(path, PROFILES_DIR, overwrite="--overwrite" in sys.argv)
+                print(f"[CrosshairX] Imported {count} profiles from {path}")
+        except (PackError, OSError, zipfile.BadZipFile) as e:
+            print(f"[CrosshairX] {flag} failed: {e}")
+            sys.exit(1)
+        return True
+    return False
+
+
+def _run_share_command() -> bool:
+    """Handle --share-code/--decode-code without starting the GUI. True if handled."""
+    from . import sharecode
+    if "--share-code" in sys.argv:
+        config = Config()
+        setup = config.data
+        idx = sys.argv.index("--share-code")
+        if idx + 1 < len(sys.argv) and not sys.argv[idx + 1].startswith("-"):
+            name = sys.argv[idx + 1]
+            profile = config.profiles.get(name)
+            if profile is None:
+                print(f"[CrosshairX] Unknown profile: {name}")
+                sys.exit(1)
+            setup = {section: {**setup.get(section, {}), **profile.get(section, {})}
+                     for section in ("crosshair", "animation")}
+        print(sharecode.encode(setup))
+        config.flush()
+        return True
+    if "--decode-code" in sys.argv:
+        idx = sys.argv.index("--decode-code")
+        if idx + 1 >= len(sys.argv):
+            print("[CrosshairX] --decode-code needs a share code")
+            sys.exit(2)
+        try:
+            print(json.dumps(sharecode.decode(sys.argv[idx + 1]), indent=2))
+        except sharecode.ShareCodeError as e:
+            print(f"[CrosshairX] Invalid share code: {e}")
+            sys.exit(1)
+        return True
+    return False
+
 
 def main():
     """CLI entry point."""
@@ -338,6 +582,17 @@ Usage:
     crosshairx              Launch with settings panel
     crosshairx --tray       Launch minimized to system tray
     crosshairx --help       Show this help message
+    crosshairx --export-pack FILE    Bundle all profiles into one pack file
+    crosshairx --import-pack FILE    Unpack a pack into profile files
+                                     (add --overwrite to replace existing ones)
+    crosshairx --export-profiles ZIP|DIR  Export all profiles to a zip or folder
+    crosshairx --import-profiles ZIP|DIR  Import profiles from a zip or folder
+                                     (existing names: --skip, --overwrite, --rename)
+    crosshairx --share-code [NAME]   Print a share code for the current
+                                     crosshair (or for profile NAME)
+    crosshairx --decode-code CODE    Print the settings in a share code
+    crosshairx --profile-startup     Print the time of each startup phase and exit
+                                     (add --tray to time a tray-only start)
 
 Hotkeys:
     F6   — Toggle overlay on/off
@@ -345,11 +600,15 @@ Hotkeys:
     F8   — Previous profile
     F9   — Toggle animation
     F10  — Open settings
+    Ctrl+Z / Ctrl+Y — Undo / redo a settings change (settings window)
 
 Profiles are stored in: %APPDATA%/CrosshairX/profiles/
 """)
         return
 
+    if _run_library_command() or _run_share_command():
+        return
+
     app = CrosshairXApp(start_minimized=start_minimized)
     sys.exit(app.run())
 
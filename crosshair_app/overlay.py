@@ -1,39 +1,39 @@
 """
-Transparent overlay window for CrosshairX.
-Ultra-lightweight, click-through transparent overlay.
-Optimized: adaptive FPS, minimal CPU/GPU usage.
+Transparent overlay windows for CrosshairX.
+Ultra-lightweight, click-through transparent overlays — one per selected screen.
+Optimized: one shared clock, shared sprite cache, adaptive FPS.
 """
 
 import sys
-from PyQt5.QtCore import Qt, QTimer
+import time
+from PyQt5.QtCore import Qt, QTimer, QRect, QObject
 from PyQt5.QtGui import QPainter, QColor
 from PyQt5.QtWidgets import QApplication, QWidget
 
-from .crosshair import CrosshairRenderer
+from .crosshair import CrosshairRenderer, SpriteCache
 from .animations import AnimationEngine
-from .config import Config
+from .config import Config, AnimationSnapshot
 
 
 class OverlayWindow(QWidget):
     """
-    Ultra-lightweight transparent overlay.
-    Uses hide()/show() for visibility — guarantees clean clearing.
-    Adaptive FPS: high when animating, low when idle.
+    Ultra-lightweight transparent overlay covering a single screen.
+    Owns no timer: the OverlayManager pushes frames to it.
+    Config changes are applied in place by clearing the old crosshair
+    bounds and repainting once.
     """
 
-    IDLE_FPS = 5
-    ACTIVE_FPS = 60
-
-    def __init__(self, config: Config, parent=None):
+    def __init__(self, manager: "OverlayManager", screen, parent=None):
         super().__init__(parent)
-        self.config = config
-        self.renderer = CrosshairRenderer()
-        self.animation = AnimationEngine()
-        self._visible = False  # Start hidden — no crosshair until user applies
-        self._animation_enabled = config.get("animation.enabled", True)
+        self.manager = manager
+        self.config = manager.config
+        self.screen_ref = screen
+        self._geo_key = None
+        self._bounds = QRect()
+        self._pending_since = None   # perf_counter() of a not-yet-painted reconfig
+        self.last_apply_ms = 0.0     # Reconfig -> painted latency (ms)
 
         self._setup_window()
-        self._setup_timer()
 
     def _setup_window(self):
         """Configure click-through transparent overlay."""
@@ -46,21 +46,179 @@ class OverlayWindow(QWidget):
         self.setAttribute(Qt.WA_TranslucentBackground, True)
         self.setAttribute(Qt.WA_NoSystemBackground, True)
         self.setAttribute(Qt.WA_TransparentForMouseEvents, True)
-        self._update_geometry()
+        self.update_geometry()
 
-    def _update_geometry(self):
-        """Cover the selected monitor."""
+    def update_geometry(self):
+        """Cover the screen (no-op if screen geometry and offsets are unchanged)."""
+        geo = self.screen_ref.geometry()
+        display = self.config.snapshot.display
+        off_x, off_y = display.offset_x, display.offset_y
+        extra = dict(display.screen_offsets).get(self.screen_ref.name())
+        if extra:
+            off_x += extra[0]
+            off_y += extra[1]
+        key = (geo.x(), geo.y(), geo.width(), geo.height(), off_x, off_y)
+        if key == self._geo_key:
+            return
+        self._geo_key = key
+        if geo != self.geometry():
+            self.setGeometry(geo)
+        self._center_x = geo.width() / 2 + off_x
+        self._center_y = geo.height() / 2 + off_y
+
+    def _crosshair_bounds(self) -> QRect:
+        """Conservative rect around the crosshair, including animation headroom."""
+        r = int(self.manager.renderer.extent(self.config.snapshot.crosshair)) + 1
+        return QRect(int(self._center_x) - r, int(self._center_y) - r, 2 * r, 2 * r)
+
+    def next_frame(self):
+        """Repaint the crosshair area only."""
+        self.update(self._bounds)
+
+    def reconfigure(self, started_at: float):
+        """Clear old bounds and paint the new crosshair in one pass."""
+        old_bounds = self._bounds
+        self.update_geometry()
+        self._bounds = self._crosshair_bounds()
+        self._pending_since = started_at
+        self.update(old_bounds.united(self._bounds))
+
+    def paintEvent(self, event):
+        """Render the crosshair."""
+        if not self.manager.is_visible():
+            return
+
+        painter = QPainter(self)
+        # Explicitly clear the dirty area (old crosshair pixels included)
+        painter.setCompositionMode(QPainter.CompositionMode_Source)
+        painter.fillRect(event.rect(), Qt.transparent)
+        painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
+        painter.setRenderHint(QPainter.Antialiasing, True)
+
+        self.manager.sprites.draw(
+            painter, self._center_x, self._center_y,
+            self.config.snapshot.crosshair, self.manager.frame_state,
+            self.screen_ref.devicePixelRatio(),
+        )
+        painter.end()
+
+        if self._pending_since is not None:
+            self.last_apply_ms = (time.perf_counter() - self._pending_since) * 1000.0
+            self._pending_since = None
+            budget_ms = 1000.0 / max(1, self.config.snapshot.display.fps)
+            if self.last_apply_ms > budget_ms:
+                print(f"[Overlay] Config applied in {self.last_apply_ms:.1f} ms "
+                      f"(frame budget {budget_ms:.1f} ms)")
+
+
+class OverlayManager(QObject):
+    """
+    Drives one OverlayWindow per selected screen from a single clock.
+
+    Screens are selected by name in ``display.monitors``; when that list is
+    empty the legacy ``display.monitor`` index is used. Windows follow
+    screenAdded / screenRemoved / geometryChanged without a restart.
+    Subscribed to config changes: only the parts a change touches are redone.
+    Uses hide()/show() for visibility — guarantees clean clearing.
+    Adaptive FPS: high when animating (or a clock client is registered), low when idle.
+    Other widgets that animate (the settings preview) tick from the same
+    clock as clock clients instead of running a timer of their own.
+    """
+
+    IDLE_FPS = 5
+    ACTIVE_FPS = 60
+
+    def __init__(self, config: Config, parent=None):
+        super().__init__(parent)
+        self.config = config
+        self.renderer = CrosshairRenderer()
+        self.sprites = SpriteCache(self.renderer)
+        self.animation = AnimationEngine()
+        self.frame_state = self.animation.get_state(AnimationSnapshot(enabled=False))
+        self._visible = False  # Start hidden — no crosshair until user applies
+        self._shown = False
+        self._animation_enabled = config.get("animation.enabled", True)
+        self._windows: dict = {}  # QScreen -> OverlayWindow
+        self._dprs: dict = {}     # QScreen -> devicePixelRatio the sprites were made for
+        self._clock_clients: list = []  # Callables run on every tick, overlay shown or not
+        self._closed = False  # Set by shutdown(); the clock is gone after that
+
+        app = QApplication.instance()
+        app.screenAdded.connect(self._on_screen_added)
+        app.screenRemoved.connect(self._on_screen_removed)
+        for screen in app.screens():
+            self._watch_screen(screen)
+
+        self._sync_windows()
+        self._setup_timer()
+        config.subscribe(self._on_config_changed, "crosshair", "animation", "display")
+
+    # ---- Screens ----
+
+    def _selected_screens(self) -> list:
         app = QApplication.instance()
         screens = app.screens()
-        idx = self.config.get("display.monitor", 0)
-        screen = screens[idx] if idx < len(screens) else app.primaryScreen()
-        geo = screen.geometry()
-        self.setGeometry(geo)
-        self._center_x = geo.width() / 2 + self.config.get("display.offset_x", 0)
-        self._center_y = geo.height() / 2 + self.config.get("display.offset_y", 0)
+        names = self.config.get("display.monitors", [])
+        selected = [s for s in screens if s.name() in names]
+        if not selected:
+            idx = self.config.get("display.monitor", 0)
+            selected = [screens[idx] if idx < len(screens) else app.primaryScreen()]
+        return selected
+
+    def _sync_windows(self):
+        """Create/destroy windows so exactly the selected screens are covered."""
+        wanted = self._selected_screens()
+        for screen in list(self._windows):
+            if screen not in wanted:
+                self._destroy_window(self._windows.pop(screen))
+        for screen in wanted:
+            if screen not in self._windows:
+                window = OverlayWindow(self, screen)
+                self._windows[screen] = window
+                if self._shown:
+                    window.show()
+                    window.raise_()
+
+    @staticmethod
+    def _destroy_window(window: OverlayWindow):
+        window.hide()
+        window.close()
+        window.deleteLater()
+
+    def _watch_screen(self, screen):
+        self._dprs[screen] = screen.devicePixelRatio()
+        screen.geometryChanged.connect(self._on_screen_changed)
+        screen.logicalDotsPerInchChanged.connect(self._on_screen_changed)
+        screen.physicalDotsPerInchChanged.connect(self._on_screen_changed)
+
+    def _update_dprs(self):
+        """Drop sprites for DPRs that vanished (screen removed or rescaled)."""
+        self._dprs = {s: s.devicePixelRatio() for s in QApplication.instance().screens()}
+        self.sprites.retain_dprs(self._dprs.values())
+
+    def _on_screen_added(self, screen):
+        self._watch_screen(screen)
+        self._sync_windows()
+        self.refresh_config()
+
+    def _on_screen_removed(self, screen):
+        window = self._windows.pop(screen, None)
+        if window is not None:
+            self._destroy_window(window)
+        self._dprs.pop(screen, None)
+        self._sync_windows()
+        self._update_dprs()
+        self.refresh_config()
+
+    def _on_screen_changed(self, _value=None):
+        if any(s.devicePixelRatio() != dpr for s, dpr in self._dprs.items()):
+            self._update_dprs()
+        self.refresh_config()
+
+    # ---- Clock ----
 
     def _setup_timer(self):
-        """Smart adaptive timer."""
+        """Smart adaptive timer — the only clock for every overlay."""
         self._timer = QTimer(self)
         self._timer.timeout.connect(self._tick)
         self._update_timer_interval()
@@ -68,86 +226,138 @@ class OverlayWindow(QWidget):
 
     def _update_timer_interval(self):
         """Set FPS based on animation state."""
-        anim_type = self.config.get("animation.type", "none")
-        if self._animation_enabled and anim_type != "none":
-            fps = min(self.config.get("display.fps", 60), self.ACTIVE_FPS)
+        snapshot = self.config.snapshot
+        if self._clock_clients or (self._animation_enabled and snapshot.animation.type != "none"):
+            fps = min(snapshot.display.fps, self.ACTIVE_FPS)
         else:
             fps = self.IDLE_FPS
         self._timer.setInterval(max(1, int(1000 / fps)))
 
+    def _compute_frame(self):
+        """Animation state for this tick, computed once for all screens."""
+        snapshot = self.config.snapshot
+        anim_config = snapshot.animation
+        if not self._animation_enabled and anim_config.enabled:
+            anim_config = anim_config._replace(enabled=False)
+
+        anim_state = self.animation.get_state(anim_config)
+        anim_state["opacity"] = anim_state.get("opacity", 1.0) * snapshot.display.opacity
+        self.frame_state = anim_state
+
     def _tick(self):
-        """Trigger repaint."""
+        """Advance the shared clock and repaint every overlay."""
+        for client in self._clock_clients:
+            client()
         if not self._visible:
             return
-        self.update()
+        self._compute_frame()
+        for window in self._windows.values():
+            window.next_frame()
 
-    def paintEvent(self, event):
-        """Render the crosshair."""
-        if not self._visible:
-            return
+    def add_clock_client(self, callback):
+        """Run ``callback()`` on every tick (at the active frame rate) until removed."""
+        if self._closed:
+            return  # App teardown: a settings preview shown after the clock stopped
+        if callback not in self._clock_clients:
+            self._clock_clients.append(callback)
+            self._update_timer_interval()
 
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing, True)
+    def remove_clock_client(self, callback):
+        if callback in self._clock_clients:
+            self._clock_clients.remove(callback)
+            self._update_timer_interval()
 
-        anim_config = self.config.data.get("animation", {})
-        if not self._animation_enabled:
-            anim_config = dict(anim_config)
-            anim_config["enabled"] = False
+    # ---- Public API ----
 
-        anim_state = self.animation.get_state(anim_config)
-        opacity = self.config.get("display.opacity", 1.0)
-        anim_state["opacity"] = anim_state.get("opacity", 1.0) * opacity
+    def is_visible(self) -> bool:
+        return self._visible
 
-        self.renderer.draw(
-            painter, self._center_x, self._center_y,
-            self.config.data.get("crosshair", {}), anim_state
-        )
-        painter.end()
+    def active_dprs(self) -> set:
+        """Device pixel ratios of the screens that currently have an overlay."""
+        return {screen.devicePixelRatio() for screen in self._windows}
 
-    # ---- Public API ----
+    @property
+    def last_apply_ms(self) -> float:
+        """Worst reconfig -> painted latency across screens (ms)."""
+        return max((w.last_apply_ms for w in self._windows.values()), default=0.0)
+
+    def show(self):
+        """Map the overlay windows (nothing is drawn until set_visible(True))."""
+        self._shown = True
+        for window in self._windows.values():
+            window.show()
 
     def toggle_visibility(self) -> bool:
         """Toggle overlay on/off. Uses hide()/show() for clean clearing."""
-        self._visible = not self._visible
-        if self._visible:
-            self.show()
-            self.raise_()
-        else:
-            self.hide()
+        self.set_visible(not self._visible)
         return self._visible
 
     def toggle_animation(self) -> bool:
-        self._animation_enabled = not self._animation_enabled
-        self.config.set("animation.enabled", self._animation_enabled)
-        self._update_timer_interval()
+        self.config.set("animation.enabled", not self._animation_enabled)
         return self._animation_enabled
 
     def set_visible(self, visible: bool):
+        if visible == self._visible and (not visible or self._shown):
+            return
         self._visible = visible
         if visible:
-            self.show()
-            self.raise_()
+            self._shown = True
+            self._compute_frame()
+            for window in self._windows.values():
+                window.reconfigure(time.perf_counter())
+                window.show()
+                window.raise_()
         else:
-            self.hide()
+            self._shown = False
+            for window in self._windows.values():
+                window.hide()
 
     def shutdown(self):
-        """Completely stop overlay — timer, visibility, widget. For app quit."""
+        """Completely stop overlays — timer, visibility, widgets. For app quit."""
+        self._closed = True
         self._visible = False
         self._timer.stop()
-        self.hide()
-        self.close()
+        self._clock_clients.clear()
+        self.config.unsubscribe(self._on_config_changed)
+        for window in self._windows.values():
+            self._destroy_window(window)
+        self._windows.clear()
         self.deleteLater()
 
-    def refresh_config(self):
-        """Reload config and recalculate geometry + timer."""
-        self._update_geometry()
+    def refresh_config(self, started_at: float | None = None):
+        """
+        Re-apply everything in place: no hide()/show(), no new window surface.
+        Used for screen changes; config edits arrive via _on_config_changed.
+
+        Args:
+            started_at: perf_counter() of the triggering input (e.g. F7 press);
+                the latency until the new crosshair is painted lands in
+                ``last_apply_ms``.
+        """
+        if started_at is None:
+            started_at = time.perf_counter()
+        self._sync_windows()
         self._animation_enabled = self.config.get("animation.enabled", True)
         self._update_timer_interval()
-        # Hide and re-show to force clean redraw (clears old pixels completely)
-        if self._visible:
-            self.hide()
-            self.show()
-            self.raise_()
+        self._reconfigure_windows(started_at)
+
+    def _on_config_changed(self, change):
+        """Redo only what the changed keys affect; always repaint once."""
+        if change.touches("display.monitors", "display.monitor"):
+            self._sync_windows()
+        if change.touches("animation.enabled"):
+            self._animation_enabled = self.config.get("animation.enabled", True)
+        if change.touches("animation.enabled", "animation.type", "display.fps"):
+            self._update_timer_interval()
+        self._reconfigure_windows(change.started_at)
+
+    def _reconfigure_windows(self, started_at: float):
+        self._compute_frame()
+        for window in self._windows.values():
+            if self._visible:
+                window.reconfigure(started_at)
+            else:
+                window.update_geometry()
 
     def trigger_recoil(self):
         self.animation.trigger_recoil()
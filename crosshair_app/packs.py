@@ -0,0 +1,180 @@
+"""
+Profile packs for CrosshairX.
+A pack is one file holding many profiles: a small binary header and name
+index followed by compact JSON records. It is read through mmap, so
+opening a pack only parses the index and a profile's bytes are touched
+only when that profile is used.
+
+Layout (little-endian):
+    b"CXPK" | u16 version | u32 count
+    count x (u16 name length | name utf-8 | u64 offset | u32 length)
+    records (compact JSON), offsets relative to the end of the index
+"""
+
+import json
+import mmap
+import os
+import struct
+from pathlib import Path
+
+from .schema import normalize_profile
+
+
+PACK_SUFFIX = ".cxpack"
+MAGIC = b"CXPK"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sHI")
+_NAME_LEN = struct.Struct("<H")
+_ENTRY = struct.Struct("<QI")
+
+
+class PackError(ValueError):
+    """The file is not a readable profile pack."""
+
+
+def valid_profile_name(name: str) -> bool:
+    """Profile names become file names: no paths, no hidden files."""
+    return bool(name) and not name.startswith(".") and not any(c in name for c in '/\\:')
+
+
+class ProfilePack:
+    """Read-only, memory-mapped view of a pack file."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._map = None
+        self._file = open(self.path, "rb")
+        try:
+            size = os.fstat(self._file.fileno()).st_size
+            if size < _HEADER.size:
+                raise PackError(f"{self.path.name}: too small to be a pack")
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._index = self._read_index()
+        except Exception:
+            self._file.close()
+            raise
+
+    def _read_index(self) -> dict:
+        magic, version, count = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise PackError(f"{self.path.name}: not a CrosshairX pack")
+        if version != VERSION:
+            raise PackError(f"{self.path.name}: unsupported pack version {version}")
+        pos = _HEADER.size
+        entries = []
+        try:
+            for _ in range(count):
+                (name_len,) = _NAME_LEN.unpack_from(self._map, pos)
+                pos += _NAME_LEN.size
+                name = self._map[pos:pos + name_len].decode("utf-8")
+                pos += name_len
+                offset, length = _ENTRY.unpack_from(self._map, pos)
+                pos += _ENTRY.size
+                entries.append((name, offset, length))
+        except (struct.error, UnicodeDecodeError) as e:
+            raise PackError(f"{self.path.name}: corrupt index ({e})") from e
+        index = {}
+        for name, offset, length in entries:
+            if not valid_profile_name(name):
+                raise PackError(f"{self.path.name}: invalid profile name {name!r}")
+            if pos + offset + length > len(self._map):
+                raise PackError(f"{self.path.name}: record '{name}' is truncated")
+            index[name] = (pos + offset, length)
+        return index
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._index
+
+    def names(self) -> list[str]:
+        return sorted(self._index)
+
+    def raw(self, name: str) -> bytes | None:
+        entry = self._index.get(name)
+        if entry is None:
+            return None
+        offset, length = entry
+        return self._map[offset:offset + length]
+
+    def get(self, name: str) -> dict | None:
+        """Parsed, schema-normalized profile, or None if the pack doesn't have it."""
+        data = self.raw(name)
+        if data is None:
+            return None
+        try:
+            return normalize_profile(json.loads(data))
+        except ValueError as e:  # Also UnicodeDecodeError
+            raise PackError(f"{self.path.name}: corrupt record '{name}' ({e})") from e
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+
+def write_pack(path, profiles: dict):
+    """Write ``{name: profile}`` as a pack (temp file + rename)."""
+    path = Path(path)
+    records = []
+    for name in sorted(profiles):
+        records.append((name.encode("utf-8"),
+                        json.dumps(profiles[name], separators=(",", ":"),
+                                   ensure_ascii=False).encode("utf-8")))
+    index = bytearray(_HEADER.pack(MAGIC, VERSION, len(records)))
+    offset = 0
+    for name, data in records:
+        index += _NAME_LEN.pack(len(name)) + name + _ENTRY.pack(offset, len(data))
+        offset += len(data)
+
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(index)
+        for _, data in records:
+            f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def export_pack(profiles_dir, pack_path, names=None) -> int:
+    """Bundle per-file profiles (all, or ``names``) into one pack. Returns the count."""
+    profiles_dir = Path(profiles_dir)
+    if names is None:
+        names = sorted(p.stem for p in profiles_dir.glob("*.json"))
+    profiles = {}
+    for name in names:
+        try:
+            with open(profiles_dir / f"{name}.json", "r", encoding="utf-8") as f:
+                profiles[name] = normalize_profile(json.load(f))
+        except (ValueError, IOError) as e:
+            print(f"[Packs] Skipping profile '{name}': {e}")
+    write_pack(pack_path, profiles)
+    return len(profiles)
+
+
+def import_pack(pack_path, profiles_dir, overwrite: bool = False) -> int:
+    """Unpack a pack into per-file profiles. Returns how many files were written."""
+    profiles_dir = Path(profiles_dir)
+    profiles_dir.mkdir(parents=True, exist_ok=True)
+    written = 0
+    with ProfilePack(pack_path) as pack:
+        for name in pack.names():
+            target = profiles_dir / f"{name}.json"
+            if target.exists() and not overwrite:
+                continue
+            tmp = target.with_name(target.name + ".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(pack.get(name), f, indent=2)
+            os.replace(tmp, target)
+            written += 1
+    return written
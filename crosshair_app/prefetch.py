@@ -0,0 +1,77 @@
+"""
+Background warm-up of neighbor profiles for CrosshairX.
+Keeps the previous/next profiles parsed and their sprites rasterized, so
+an F7/F8 switch only swaps config values and blits a cached sprite.
+"""
+
+import copy
+import threading
+from PyQt5.QtCore import QObject, QTimer
+
+from .config import Config, CrosshairSnapshot, snapshot_of
+
+
+class ProfilePrefetcher(QObject):
+    """
+    Prefetches the profiles on either side of the current one.
+
+    After the current profile (or the crosshair it is merged onto) changes,
+    a worker thread parses both neighbors into the profile index, predicts
+    the CrosshairSnapshot each one would produce, and renders its sprite
+    for every DPR an overlay uses. Requests are debounced; a newer request
+    makes a running worker stop early.
+    """
+
+    DELAY_MS = 200
+
+    def __init__(self, config: Config, overlay, parent=None):
+        super().__init__(parent)
+        self.config = config
+        self.overlay = overlay
+        self._generation = 0
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(self.DELAY_MS)
+        self._timer.timeout.connect(self._start)
+        config.subscribe(self.schedule, "general.current_profile", "crosshair", "display.monitors")
+        self.schedule()
+
+    def schedule(self, change=None):
+        """(Re)start the debounce window."""
+        self._timer.start()
+
+    def neighbors(self) -> list[str]:
+        current = self.config.get("general.current_profile", "default")
+        names = [self.config.profiles.neighbor(current, step) for step in (1, -1)]
+        return [name for i, name in enumerate(names) if name and name not in names[:i]]
+
+    def _job(self) -> tuple:
+        # Everything the worker needs is captured on the GUI thread
+        self._generation += 1
+        base = copy.deepcopy(self.config.data.get("crosshair", {}))
+        return self._generation, self.neighbors(), base, self.overlay.active_dprs()
+
+    def _start(self):
+        threading.Thread(target=self._run, args=self._job(), daemon=True).start()
+
+    def warm_now(self):
+        """Prefetch synchronously on the calling thread (GUI thread only)."""
+        self._timer.stop()
+        self._run(*self._job())
+
+    def _run(self, generation: int, names: list, base: dict, dprs: set):
+        try:
+            for name in names:
+                if generation != self._generation:
+                    return
+                profile = self.config.profiles.get(name)
+                if profile is None:
+                    continue
+                crosshair = dict(base)
+                crosshair.update(profile.get("crosshair", {}))
+                snapshot = snapshot_of(CrosshairSnapshot, crosshair)
+                for dpr in dprs:
+                    self.overlay.sprites.sprite(snapshot, dpr)
+        except Exception as e:
+            print(f"[Prefetch] Failed: {e}")
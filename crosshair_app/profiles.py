@@ -0,0 +1,286 @@
+"""
+In-memory profile index for CrosshairX.
+Keeps profile names sorted and parsed profiles cached, so switching
+profiles never globs or re-parses the profiles directory.
+Profiles come from ``<name>.json`` files and from ``*.cxpack`` packs
+dropped into the same directory.
+"""
+
+import bisect
+import copy
+import json
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+from .packs import PACK_SUFFIX, PackError, ProfilePack
+from .schema import normalize_profile
+
+
+class ProfileIndex:
+    """
+    Sorted index of ``<name>.json`` profiles and pack contents in one
+    directory. A loose file wins over a pack entry of the same name.
+
+    Names and file mtimes are loaded once; rescan() applies only what
+    changed on disk (call it from a filesystem watcher). Profiles are
+    parsed and schema-normalized on first use and kept in memory until
+    their file changes.
+    Neighbor lookups (next/previous profile) are O(1). Saving or deleting
+    one profile is a bisect plus a shift of the names after it: still
+    linear in the worst case, but a C-level list move and dict update
+    instead of a re-sort and a full positions rebuild.
+    Listeners get the names that changed or went away, so derived indexes
+    (the profile library) can update incrementally.
+    Thread-safe: the prefetcher reads it from a worker thread.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self._lock = threading.RLock()
+        self._names: list[str] = []           # Sorted
+        self._positions: dict[str, int] = {}  # name -> index in _names
+        self._mtimes: dict[str, float] = {}
+        self._parsed: dict[str, dict] = {}
+        self._packs: dict[str, tuple] = {}     # pack file name -> (mtime, ProfilePack)
+        self._packed: dict[str, ProfilePack] = {}  # profile name -> pack providing it
+        self._holds = 0
+        self._listeners: list = []            # callback(changed: set, removed: set)
+        self.rescan()
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._positions
+
+    def names(self) -> list[str]:
+        """Sorted profile names (a copy)."""
+        with self._lock:
+            return list(self._names)
+
+    def _scan(self) -> tuple[dict[str, float], dict[str, float]]:
+        """({profile name: mtime}, {pack file name: mtime})."""
+        found, packs = {}, {}
+        try:
+            with os.scandir(self.directory) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".json") and entry.is_file():
+                        found[entry.name[:-5]] = entry.stat().st_mtime
+                    elif entry.name.endswith(PACK_SUFFIX) and entry.is_file():
+                        packs[entry.name] = entry.stat().st_mtime
+        except OSError as e:
+            print(f"[Profiles] Cannot scan {self.directory}: {e}")
+        return found, packs
+
+    def listen(self, callback):
+        """Call ``callback(changed, removed)`` after names are added/changed/removed."""
+        self._listeners.append(callback)
+
+    def unlisten(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _emit(self, touched: set):
+        """Notify listeners (outside the lock) about ``touched`` names."""
+        if not touched or not self._listeners:
+            return
+        with self._lock:
+            removed = {name for name in touched if name not in self._positions}
+        changed = touched - removed
+        for callback in list(self._listeners):
+            try:
+                callback(changed, removed)
+            except Exception as e:
+                print(f"[Profiles] Listener error: {e}")
+
+    def stamp(self, name: str) -> float | None:
+        """Modification time of whatever provides ``name`` (its file or its pack)."""
+        with self._lock:
+            if name in self._mtimes:
+                return self._mtimes[name]
+            pack = self._packed.get(name)
+            if pack is not None and pack.path.name in self._packs:
+                return self._packs[pack.path.name][0]
+            return None
+
+    def stamps(self) -> dict[str, float]:
+        """stamp() of every profile at once."""
+        with self._lock:
+            packs = {pack.path.name: mtime for mtime, pack in self._packs.values()}
+            result = {name: packs.get(pack.path.name) for name, pack in self._packed.items()}
+            result.update(self._mtimes)
+            return result
+
+    def _sync_packs(self, packs: dict[str, float]) -> set:
+        """Open new/changed packs, close vanished ones. Returns the names they affect."""
+        changed = False
+        for file_name in list(self._packs):
+            if packs.get(file_name) != self._packs[file_name][0]:
+                self._packs.pop(file_name)[1].close()
+                changed = True
+        for file_name, mtime in packs.items():
+            if file_name in self._packs:
+                continue
+            try:
+                self._packs[file_name] = (mtime, ProfilePack(self.directory / file_name))
+            except (PackError, OSError) as e:
+                print(f"[Profiles] Cannot open pack {file_name}: {e}")
+                continue
+            changed = True
+        if changed:
+            old = self._packed
+            self._packed = {}
+            for file_name in sorted(self._packs, reverse=True):  # First pack (by name) wins
+                pack = self._packs[file_name][1]
+                self._packed.update(dict.fromkeys(pack.names(), pack))
+            affected = {name for name in old.keys() | self._packed.keys()
+                        if old.get(name) is not self._packed.get(name)}
+            for name in affected:
+                self._parsed.pop(name, None)
+            return affected
+        return set()
+
+    def _reindex(self, start: int = 0):
+        """Refresh positions from ``start`` on; names before it did not move."""
+        if start == 0:
+            self._positions = {name: i for i, name in enumerate(self._names)}
+        else:
+            self._positions.update(zip(self._names[start:], range(start, len(self._names))))
+
+    @contextmanager
+    def hold(self):
+        """Skip rescans inside the block (a bulk import that reports its files via add_many)."""
+        with self._lock:
+            self._holds += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._holds -= 1
+
+    def rescan(self) -> bool:
+        """Sync with the directory. Returns True if any profile was added, removed or changed."""
+        if self._holds:
+            return False
+        found, packs = self._scan()
+        with self._lock:
+            touched = self._sync_packs(packs)
+            for name, mtime in found.items():
+                if self._mtimes.get(name) != mtime:
+                    self._mtimes[name] = mtime
+                    self._parsed.pop(name, None)
+                    touched.add(name)
+            removed = self._mtimes.keys() - found.keys()
+            for name in removed:
+                del self._mtimes[name]
+                self._parsed.pop(name, None)
+            touched |= removed
+            if touched:
+                self._names = sorted(found.keys() | self._packed.keys())
+                self._reindex()
+        self._emit(touched)
+        return bool(touched)
+
+    def _pack_record(self, name: str) -> bytes | None:
+        """
+        Record bytes of a pack-provided profile, None for a loose file.
+        Call with the lock held: a rescan on another thread may close the
+        pack's mmap, so the bytes are copied out before the lock is released.
+        """
+        if name in self._mtimes:
+            return None
+        pack = self._packed.get(name)
+        return None if pack is None else pack.raw(name)
+
+    def get(self, name: str) -> dict | None:
+        """Parsed profile (shared, do not mutate), or None if missing/unreadable."""
+        with self._lock:
+            profile = self._parsed.get(name)
+            if profile is not None or name not in self._positions:
+                return profile
+            data = self._pack_record(name)
+            stamp = self.stamp(name)
+        try:
+            if data is not None:
+                profile = normalize_profile(json.loads(data))
+            else:
+                with open(self.directory / f"{name}.json", "r", encoding="utf-8") as f:
+                    profile = normalize_profile(json.load(f))
+        except (ValueError, IOError) as e:
+            print(f"[Profiles] Cannot read profile '{name}': {e}")
+            return None
+        with self._lock:
+            if name in self._positions and self.stamp(name) == stamp:  # Not replaced meanwhile
+                self._parsed[name] = profile
+        return profile
+
+    def raw(self, name: str) -> bytes | None:
+        """Stored JSON bytes of a profile (file or pack record), not parsed or cached."""
+        with self._lock:
+            if name not in self._positions:
+                return None
+            data = self._pack_record(name)
+        if data is not None:
+            return data
+        try:
+            with open(self.directory / f"{name}.json", "rb") as f:
+                return f.read()
+        except (ValueError, IOError) as e:
+            print(f"[Profiles] Cannot read profile '{name}': {e}")
+            return None
+
+    def put(self, name: str, profile: dict):
+        """Record a profile that was just written to disk."""
+        path = self.directory / f"{name}.json"
+        with self._lock:
+            if name not in self._positions:
+                i = bisect.bisect_left(self._names, name)
+                self._names.insert(i, name)
+                self._reindex(i)
+            self._parsed[name] = copy.deepcopy(profile)
+            try:
+                self._mtimes[name] = path.stat().st_mtime
+            except OSError:
+                self._mtimes[name] = 0.0
+        self._emit({name})
+
+    def add_many(self, names):
+        """Record many profile files just written to disk: one sort, parsed lazily."""
+        mtimes = {}
+        for name in names:
+            try:
+                mtimes[name] = (self.directory / f"{name}.json").stat().st_mtime
+            except OSError:
+                continue
+        with self._lock:
+            for name, mtime in mtimes.items():
+                self._mtimes[name] = mtime
+                self._parsed.pop(name, None)
+            new = mtimes.keys() - self._positions.keys()
+            if new:
+                self._names = sorted(self._positions.keys() | new)
+                self._reindex()
+        self._emit(set(mtimes))
+
+    def discard(self, name: str):
+        """Forget a profile file that was just deleted (a pack may still provide it)."""
+        with self._lock:
+            self._mtimes.pop(name, None)
+            self._parsed.pop(name, None)
+            if name in self._positions and name not in self._packed:
+                i = self._positions.pop(name)
+                self._names.pop(i)
+                self._reindex(i)
+        self._emit({name})
+
+    def neighbor(self, name: str, step: int) -> str:
+        """Name ``step`` places after ``name`` (wrapping); the first profile if unknown."""
+        with self._lock:
+            if not self._names:
+                return ""
+            idx = self._positions.get(name)
+            if idx is None:
+                return self._names[0]
+            return self._names[(idx + step) % len(self._names)]
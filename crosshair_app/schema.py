@@ -0,0 +1,269 @@
+"""
+Config schema for CrosshairX.
+Declares every known setting with its type, range and allowed values, and
+compiles that into per-key normalizers. Whatever enters the config (file,
+profile, import, preset, UI) is coerced to a clean, typed value, so the
+render path never has to second-guess it.
+"""
+
+import math
+from typing import Any, Callable, NamedTuple
+
+from .i18n import LANGUAGES
+
+
+# Allowed values for enum-like settings (the UI lists them in this order)
+STYLE_KEYS = [
+    "cross", "dot", "circle", "chevron", "diamond", "crossdot",
+    "triangle", "crosshair_classic", "square", "plus_thin",
+    "crosscircle", "arrows",
+]
+ANIM_KEYS = [
+    "none", "pulse", "rotate", "breathe", "rainbow",
+    "recoil", "flash", "wave",
+]
+THEME_KEYS = ["midnight", "purple", "ocean", "sakura"]
+
+
+class Field(NamedTuple):
+    """One setting: ``kind`` picks the normalizer, the rest parameterizes it."""
+    kind: str
+    default: Any
+    lo: float | None = None
+    hi: float | None = None
+    choices: tuple = ()
+
+
+def Bool(default: bool) -> Field:
+    return Field("bool", default)
+
+
+def Int(default: int, lo: int, hi: int) -> Field:
+    return Field("int", default, lo, hi)
+
+
+def Float(default: float, lo: float, hi: float) -> Field:
+    return Field("float", default, lo, hi)
+
+
+def Choice(default: str, choices) -> Field:
+    return Field("choice", default, choices=tuple(choices))
+
+
+def Str(default: str) -> Field:
+    return Field("str", default)
+
+
+def Color(default: list) -> Field:
+    return Field("color", default)
+
+
+def Names(default: list) -> Field:
+    return Field("names", default)
+
+
+def Offsets(default: dict) -> Field:
+    return Field("offsets", default)
+
+
+SCHEMA = {
+    "crosshair": {
+        "style": Choice("cross", STYLE_KEYS),
+        "size": Int(20, 4, 100),
+        "thickness": Int(2, 1, 10),
+        "gap": Int(4, 0, 30),
+        "color": Color([0, 255, 0, 255]),
+        "outline": Bool(True),
+        "outline_color": Color([0, 0, 0, 180]),
+        "outline_thickness": Int(1, 1, 5),
+        "dot": Bool(True),
+        "dot_size": Int(2, 0, 10),
+        "t_style": Bool(False),
+    },
+    "animation": {
+        "enabled": Bool(True),
+        "type": Choice("pulse", ANIM_KEYS),
+        "speed": Float(1.0, 0.1, 5.0),
+        "intensity": Float(0.3, 0.0, 1.0),
+    },
+    "display": {
+        "monitor": Int(0, 0, 63),
+        "monitors": Names([]),
+        "screen_offsets": Offsets({}),
+        "offset_x": Int(0, -500, 500),
+        "offset_y": Int(0, -500, 500),
+        "opacity": Float(1.0, 0.1, 1.0),
+        "fps": Int(60, 10, 144),
+    },
+    "hotkeys": {
+        "toggle_overlay": Str("F6"),
+        "next_profile": Str("F7"),
+        "prev_profile": Str("F8"),
+        "toggle_animation": Str("F9"),
+        "open_settings": Str("F10"),
+        "undo": Str("Ctrl+Z"),
+        "redo": Str("Ctrl+Y"),
+    },
+    "general": {
+        "start_minimized": Bool(False),
+        "start_with_windows": Bool(False),
+        "current_profile": Str("default"),
+        "language": Choice("ru", LANGUAGES),
+        "theme": Choice("midnight", THEME_KEYS),
+        "gpu_acceleration": Bool(True),
+        "live_apply": Bool(False),
+        "trim_after": Int(60, 0, 86400),
+    },
+}
+
+
+# ===================== COMPILATION =====================
+
+def _number(value) -> float | None:
+    """Finite float from an int/float/numeric string; None otherwise (bools too)."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, str):
+        try:
+            value = float(value)
+        except ValueError:
+            return None
+    if isinstance(value, (int, float)) and math.isfinite(value):
+        return float(value)
+    return None
+
+
+def _compile_field(field: Field) -> Callable[[Any], Any]:
+    kind, default, lo, hi, choices = field
+
+    if kind == "bool":
+        return lambda v: v if isinstance(v, bool) else (bool(v) if isinstance(v, int) else default)
+
+    if kind in ("int", "float"):
+        cast = (lambda x: int(round(x))) if kind == "int" else float
+
+        def norm_number(v):
+            if type(v) is (int if kind == "int" else float) and lo <= v <= hi:
+                return v  # Fast path: already clean
+            x = _number(v)
+            return default if x is None else cast(min(hi, max(lo, x)))
+        return norm_number
+
+    if kind == "choice":
+        return lambda v: v if v in choices else default
+
+    if kind == "str":
+        return lambda v: v if isinstance(v, str) else default
+
+    if kind == "color":
+        def norm_color(v):
+            if (type(v) is list and len(v) == 4
+                    and all(type(c) is int and 0 <= c <= 255 for c in v)):
+                return v  # Fast path: already clean
+            if not isinstance(v, (list, tuple)) or not 3 <= len(v) <= 4:
+                return list(default)
+            channels = [_number(c) for c in v]
+            if None in channels:
+                return list(default)
+            if len(channels) == 3:
+                channels.append(255)
+            return [int(min(255, max(0, round(c)))) for c in channels]
+        return norm_color
+
+    if kind == "names":
+        return lambda v: [n for n in v if isinstance(n, str)] if isinstance(v, list) else list(default)
+
+    if kind == "offsets":
+        def norm_offsets(v):
+            if not isinstance(v, dict):
+                return dict(default)
+            clean = {}
+            for name, xy in v.items():
+                if isinstance(xy, (list, tuple)) and len(xy) == 2:
+                    x, y = _number(xy[0]), _number(xy[1])
+                    if x is not None and y is not None:
+                        clean[str(name)] = [int(x), int(y)]
+            return clean
+        return norm_offsets
+
+    raise ValueError(f"Unknown field kind: {kind}")
+
+
+# "section.key" -> normalizer, built once at import
+_NORMALIZERS = {
+    f"{section}.{key}": _compile_field(field)
+    for section, fields in SCHEMA.items()
+    for key, field in fields.items()
+}
+
+
+# ===================== PUBLIC API =====================
+
+def _copy(value):
+    return list(value) if isinstance(value, list) else dict(value) if isinstance(value, dict) else value
+
+
+def default_section(section: str) -> dict:
+    """Fresh dict of a section's defaults."""
+    return {key: _copy(field.default) for key, field in SCHEMA.get(section, {}).items()}
+
+
+def normalize(key_path: str, value: Any) -> Any:
+    """Clean value for a dotted key; whole sections are normalized key by key."""
+    norm = _NORMALIZERS.get(key_path)
+    if norm is not None:
+        return norm(value)
+    if key_path in SCHEMA and isinstance(value, dict):
+        return normalize_section(key_path, value)
+    return value
+
+
+def normalize_section(section: str, data: dict, fill: bool = False) -> dict:
+    """
+    Normalize the known keys of one section. Unknown keys are kept as-is.
+    With ``fill``, missing known keys get their defaults.
+    """
+    result = default_section(section) if fill else {}
+    for key, value in data.items():
+        norm = _NORMALIZERS.get(f"{section}.{key}")
+        result[key] = norm(value) if norm is not None else value
+    return result
+
+
+def normalize_config(data: dict) -> dict:
+    """Full config: every schema section complete and clean, other sections untouched."""
+    result = dict(data)
+    for section in SCHEMA:
+        value = data.get(section)
+        result[section] = normalize_section(section, value if isinstance(value, dict) else {},
+                                            fill=True)
+    return result
+
+
+def normalize_tags(tags) -> list[str]:
+    """Profile tags: lowercase words without '#', unique, in order (at most 16)."""
+    if isinstance(tags, str):
+        tags = tags.replace(",", " ").split()
+    if not isinstance(tags, (list, tuple)):
+        return []
+    clean = []
+    for tag in tags:
+        if isinstance(tag, str):
+            tag = tag.strip().lstrip("#").lower()[:32]
+            if tag and tag not in clean:
+                clean.append(tag)
+    return clean[:16]
+
+
+def normalize_profile(profile: dict) -> dict:
+    """Profile overlay: only the crosshair/animation keys it sets, cleaned."""
+    if not isinstance(profile, dict):
+        raise ValueError("a profile must be a JSON object")
+    result = dict(profile)
+    if "tags" in profile:
+        result["tags"] = normalize_tags(profile["tags"])
+    for section in ("crosshair", "animation"):
+        value = profile.get(section)
+        if value is not None:
+            result[section] = normalize_section(section, value if isinstance(value, dict) else {})
+    return result
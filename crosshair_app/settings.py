@@ -13,31 +13,33 @@ import os
 import sys
 import json
 import ctypes
-import subprocess
 import threading
-import webbrowser
-import urllib.request
-import urllib.parse
-import hashlib
-import ssl
+import functools
+from collections import OrderedDict
 
 from PyQt5.QtCore import (
-    Qt, pyqtSignal, QRect, QPoint, QTimer,
+    Qt, pyqtSignal, QObject, QRect, QRectF, QPoint, QTimer,
+    QAbstractListModel, QModelIndex,
     QPropertyAnimation, QEasingCurve,
 )
 from PyQt5.QtGui import (
     QColor, QFont, QPainter, QPen, QBrush,
-    QLinearGradient, QPixmap, QImage, QPainterPath, QRegion,
+    QLinearGradient, QPixmap, QImage, QImageReader, QPainterPath, QRegion, QKeySequence,
 )
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QSlider, QComboBox,
     QPushButton, QGroupBox, QCheckBox, QColorDialog, QSpinBox,
     QTabWidget, QGridLayout, QMessageBox, QInputDialog, QScrollArea,
     QDialog, QTextEdit, QApplication, QProgressBar, QSizePolicy,
-    QFrame, QLineEdit,
+    QFrame, QLineEdit, QFileDialog, QListView, QShortcut,
 )
 
-from .i18n import t, set_language, get_language
+from .i18n import t, bind, tr, unbind, unbind_widgets, set_language, get_language
+from .config import AnimationSnapshot, CrosshairSnapshot, snapshot_of
+from .schema import STYLE_KEYS, ANIM_KEYS, THEME_KEYS, SCHEMA, normalize_section
+from . import sharecode
+from .library import COLOR_FAMILIES
+from .history import EditHistory
 
 
 def _resource_path(relative: str) -> str:
@@ -49,227 +51,11 @@ def _resource_path(relative: str) -> str:
     return os.path.join(base, relative)
 
 
-# -- Theme wallpaper paths --
-THEME_KEYS = ["midnight", "purple", "ocean", "sakura"]
-
-# -- Known game executables for monitoring --
-KNOWN_GAMES = {
-    "RobloxPlayerBeta.exe": "Roblox",
-    "FortniteClient-Win64-Shipping.exe": "Fortnite",
-    "csgo.exe": "CS:GO",
-    "cs2.exe": "Counter-Strike 2",
-    "valorant.exe": "Valorant",
-    "VALORANT-Win64-Shipping.exe": "Valorant",
-    "javaw.exe": "Minecraft (Java)",
-    "Minecraft.Windows.exe": "Minecraft (Bedrock)",
-    "GTA5.exe": "GTA V",
-    "r5apex.exe": "Apex Legends",
-    "overwatch.exe": "Overwatch 2",
-    "dota2.exe": "Dota 2",
-    "LeagueofLegends.exe": "League of Legends",
-    "League of Legends.exe": "League of Legends",
-    "PUBG-Win64-Shipping.exe": "PUBG",
-    "TslGame.exe": "PUBG",
-    "RocketLeague.exe": "Rocket League",
-    "eldenring.exe": "Elden Ring",
-    "Cyberpunk2077.exe": "Cyberpunk 2077",
-    "cod.exe": "Call of Duty",
-    "ModernWarfare.exe": "Call of Duty: MW",
-    "destiny2.exe": "Destiny 2",
-    "Warframe.x64.exe": "Warframe",
-    "GenshinImpact.exe": "Genshin Impact",
-    "ZenlessZoneZero.exe": "Zenless Zone Zero",
-    "HonkaiStarRail.exe": "Honkai: Star Rail",
-    "DeadByDaylight-Win64-Shipping.exe": "Dead By Daylight",
-    "Terraria.exe": "Terraria",
-    "left4dead2.exe": "Left 4 Dead 2",
-    "hl2.exe": "Half-Life 2",
-    "rust.exe": "Rust",
-    "EscapeFromTarkov.exe": "Escape from Tarkov",
-    "DayZGame_x64.exe": "DayZ",
-    "bf2042.exe": "Battlefield 2042",
-    "WorldOfTanks.exe": "World of Tanks",
-    "WoT.exe": "World of Tanks",
-    "WorldOfWarships.exe": "World of Warships",
-    "Warthunder.exe": "War Thunder",
-    "aces.exe": "War Thunder",
-    "Overwatch.exe": "Overwatch 2",
-    "amongus.exe": "Among Us",
-    "FallGuys_client_game.exe": "Fall Guys",
-    "PalWorld-Win64-Shipping.exe": "Palworld",
-}
-
-# -- Recommended crosshair presets per game --
-GAME_PRESETS = {
-    "Roblox": {
-        "style": "cross", "size": 16, "thickness": 2, "gap": 3,
-        "color": [0, 255, 128, 255], "dot": True, "dot_size": 2,
-        "outline": True, "outline_thickness": 1, "t_style": False,
-    },
-    "Counter-Strike 2": {
-        "style": "cross", "size": 8, "thickness": 1, "gap": 3,
-        "color": [0, 255, 0, 255], "dot": False, "dot_size": 1,
-        "outline": True, "outline_thickness": 1, "t_style": False,
-    },
-    "CS:GO": {
-        "style": "cross", "size": 8, "thickness": 1, "gap": 3,
-        "color": [0, 255, 0, 255], "dot": False, "dot_size": 1,
-        "outline": True, "outline_thickness": 1, "t_style": False,
-    },
-    "Valorant": {
-        "style": "crossdot", "size": 12, "thickness": 2, "gap": 4,
-        "color": [0, 255, 100, 255], "dot": True, "dot_size": 2,
-        "outline": True, "outline_thickness": 1, "t_style": False,
-    },
-    "Fortnite": {
-        "style": "cross", "size": 14, "thickness": 2, "gap": 4,
-        "color": [255, 255, 255, 255], "dot": True, "dot_size": 2,
-        "outline": True, "outline_thickness": 1, "t_style": False,
-    },
-    "Apex Legends": {
-        "style": "circle", "size": 18, "thickness": 2, "gap": 5,
-        "color": [255, 50, 50, 255], "dot": True, "dot_size": 2,
-        "outline": True, "outline_thickness": 1, "t_style": False,
-    },
-    "Overwatch 2": {
-        "style": "crossdot", "size": 10, "thickness": 2, "gap": 5,
-        "color": [0, 255, 0, 255], "dot": True, "dot_size": 3,
-        "outline": False, "outline_thickness": 1, "t_style": False,
-    },
-    "Minecraft (Java)": {
-        "style": "plus_thin", "size": 20, "thickness": 2, "gap": 0,
-        "color": [255, 255, 255, 200], "dot": False, "dot_size": 1,
-        "outline": False, "outline_thickness": 1, "t_style": False,
-    },
-    "Minecraft (Bedrock)": {
-        "style": "plus_thin", "size": 20, "thickness": 2, "gap": 0,
-        "color": [255, 255, 255, 200], "dot": False, "dot_size": 1,
-        "outline": False, "outline_thickness": 1, "t_style": False,
-    },
-    "PUBG": {
-        "style": "cross", "size": 10, "thickness": 1, "gap": 4,
-        "color": [255, 255, 255, 255], "dot": True, "dot_size": 2,
-        "outline": True, "outline_thickness": 1, "t_style": False,
-    },
-    "Dota 2": {
-        "style": "crosscircle", "size": 22, "thickness": 2, "gap": 6,
-        "color": [255, 200, 0, 200], "dot": True, "dot_size": 3,
-        "outline": False, "outline_thickness": 1, "t_style": False,
-    },
-    "GTA V": {
-        "style": "dot", "size": 6, "thickness": 2, "gap": 0,
-        "color": [255, 255, 255, 220], "dot": True, "dot_size": 3,
-        "outline": True, "outline_thickness": 1, "t_style": False,
-    },
-}
-
-# -- Game tips (bilingual) --
-GAME_TIPS = {
-    "Roblox": {
-        "ru": [
-            "Маленький крест (16px) идеален для Arsenal и Phantom Forces",
-            "T-стиль улучшает видимость противников под прицелом",
-            "Зелёный цвет виден на большинстве карт Roblox",
-            "Обводка помогает видеть прицел на ярких поверхностях",
-        ],
-        "en": [
-            "Small cross (16px) is ideal for Arsenal and Phantom Forces",
-            "T-style improves enemy visibility below the crosshair",
-            "Green color is visible on most Roblox maps",
-            "Outline helps see crosshair on bright surfaces",
-        ],
-    },
-    "Counter-Strike 2": {
-        "ru": [
-            "Тонкий крест (1px) — стандарт для про-игроков CS",
-            "Маленький gap помогает точнее целиться на головы",
-            "Отключите точку — она мешает на дальних дистанциях",
-            "Зелёный цвет — классика CS, виден на любой карте",
-        ],
-        "en": [
-            "Thin cross (1px) is standard for CS pro players",
-            "Small gap helps aim at heads more precisely",
-            "Disable dot — it interferes at long distances",
-            "Green — classic CS color, visible on any map",
-        ],
-    },
-    "CS:GO": {
-        "ru": [
-            "Тонкий крест (1px) — стандарт для CS",
-            "Точка в центре мешает на дальней дистанции",
-        ],
-        "en": [
-            "Thin cross (1px) is standard for CS",
-            "Center dot interferes at long distance",
-        ],
-    },
-    "Valorant": {
-        "ru": [
-            "Средний крест с точкой — стандарт Valorant",
-            "Прицел 12-14px оптимален для перестрелок",
-            "Используйте обводку для лучшей видимости",
-        ],
-        "en": [
-            "Medium cross with dot is Valorant standard",
-            "12-14px crosshair is optimal for gunfights",
-            "Use outline for better visibility",
-        ],
-    },
-    "Fortnite": {
-        "ru": [
-            "Белый крест хорошо видно при строительстве",
-            "Точка в центре помогает при стрельбе от бедра",
-            "Средний размер (14px) для баланса ближний/дальний бой",
-        ],
-        "en": [
-            "White cross is clearly visible while building",
-            "Center dot helps with hip-fire",
-            "Medium size (14px) balances close/long range",
-        ],
-    },
-    "Apex Legends": {
-        "ru": [
-            "Круг подходит для отслеживания быстрых целей",
-            "Красный цвет хорошо виден в Apex",
-            "Большой размер помогает при стрельбе навскидку",
-        ],
-        "en": [
-            "Circle suits tracking fast targets",
-            "Red color is clearly visible in Apex",
-            "Larger size helps with snap-aiming",
-        ],
-    },
-    "Overwatch 2": {
-        "ru": [
-            "Крест с точкой (10px) — универсальный выбор",
-            "Зелёный цвет оптимален для большинства карт",
-        ],
-        "en": [
-            "Cross with dot (10px) — universal choice",
-            "Green color is optimal for most maps",
-        ],
-    },
-    "Minecraft (Java)": {
-        "ru": [
-            "Тонкий плюс заменяет стандартный прицел Minecraft",
-            "Белый цвет с прозрачностью не мешает обзору",
-        ],
-        "en": [
-            "Thin plus replaces default Minecraft crosshair",
-            "White with transparency doesn't obstruct the view",
-        ],
-    },
-    "Minecraft (Bedrock)": {
-        "ru": [
-            "Тонкий плюс заменяет стандартный прицел Minecraft",
-            "Белый цвет с прозрачностью не мешает обзору",
-        ],
-        "en": [
-            "Thin plus replaces default Minecraft crosshair",
-            "White with transparency doesn't obstruct the view",
-        ],
-    },
-}
+def _add_item(combo, key: str, data=None):
+    """Add a combo item whose text follows the language (bound to ``key``)."""
+    combo.addItem("", data)
+    bind(functools.partial(combo.setItemText, combo.count() - 1), key)
+
 
 # -- Master promo code (admin testing) --
 _MASTER_PROMO = "CROSSHAIRX-ULTIMATE-2026"
@@ -314,7 +100,19 @@ def _enable_acrylic(hwnd, tint=0x14000000):
         pass
 
 
+# -- Theme button swatches (each wallpaper's dominant color) --
+THEME_SWATCHES = {
+    "midnight": "#0a1432",
+    "purple":   "#1c0828",
+    "ocean":    "#061840",
+    "sakura":   "#28081c",
+}
+
 # -- Glass stylesheet (balanced 14px — fits text, looks clean) --
+# Parsed once for the whole panel. Widgets pick their look by objectName
+# and switch state through dynamic properties (see _set_state), never by
+# per-widget setStyleSheet, which re-parses and re-polishes the subtree.
+# The active theme button rule comes after the swatches so it wins.
 GLASS_STYLE = """
 QWidget {
     color: #e8e8f0;
@@ -383,9 +181,9 @@ QPushButton:pressed {
 }
 QPushButton#colorBtn {
     border: 2px solid #00d4ff;
-    border-radius: 15px;
-    min-width: 30px;
-    min-height: 30px;
+    border-radius: 14px;
+    min-width: 28px;
+    min-height: 28px;
 }
 QPushButton#accentBtn {
     background-color: rgba(0, 160, 210, 40);
@@ -411,18 +209,35 @@ QPushButton#dangerBtn:hover {
     color: #ff6888;
 }
 QPushButton#themeBtn {
-    padding: 6px 10px;
-    font-size: 12px;
+    border: 1px solid rgba(80, 100, 180, 40);
     border-radius: 8px;
-}
-QPushButton#themeBtnActive {
+    color: #a0a8c0;
+    font-size: 13px;
     padding: 6px 10px;
-    font-size: 12px;
-    border-radius: 8px;
-    border: 2px solid rgba(0, 212, 255, 200);
-    background: rgba(0, 160, 220, 30);
-    color: #00d4ff;
-    font-weight: 700;
+}
+QPushButton#themeBtn:hover {
+    border-color: #00d4ff;
+    color: #d0d8f0;
+}
+QPushButton#titleBtn, QPushButton#closeBtn {
+    background: transparent;
+    border: none;
+    color: #8090b0;
+    font-size: 15px;
+    font-weight: bold;
+    border-radius: 6px;
+    padding: 0 8px;
+}
+QPushButton#titleBtn:hover {
+    background: rgba(255, 255, 255, 15);
+    color: #e0e8ff;
+}
+QPushButton#closeBtn {
+    font-size: 13px;
+}
+QPushButton#closeBtn:hover {
+    background: rgba(255, 60, 60, 60);
+    color: #ff6080;
 }
 QPushButton#descToggle {
     background: rgba(20, 20, 48, 160);
@@ -509,6 +324,108 @@ QLabel#valueLabel {
     min-width: 36px;
     font-size: 14px;
 }
+QLabel#appTitle {
+    color: #e0e8ff;
+}
+QLabel#appSubtitle {
+    color: rgba(160, 170, 200, 140);
+    font-size: 11px;
+}
+QLabel#hotkeyChip {
+    background: rgba(0, 170, 230, 30);
+    padding: 3px 10px;
+    border-radius: 5px;
+    font-weight: bold;
+    color: #00d4ff;
+    min-width: 32px;
+    font-size: 13px;
+}
+QLabel#hotkeyDesc {
+    color: #a0a8c0;
+    font-size: 13px;
+}
+QLabel#statValue {
+    color: #d4d4e8;
+    font-size: 13px;
+}
+QLabel#statValue[tone="sent"] {
+    color: #80e0a0;
+}
+QLabel#statValue[tone="recv"] {
+    color: #80c0e0;
+}
+QLabel#gamesLabel {
+    color: #a0a8c0;
+    font-size: 13px;
+    padding: 4px;
+}
+QLabel#gamesLabel[found="true"] {
+    color: #80e0a0;
+    font-size: 14px;
+}
+QLabel#gameTip {
+    color: #b0b8d0;
+    font-size: 13px;
+    padding: 2px 4px;
+}
+QLabel#premStatus {
+    color: #a0a8c0;
+    font-size: 16px;
+    font-weight: bold;
+    padding: 8px;
+}
+QLabel#premStatus[premium="true"] {
+    color: #00e070;
+}
+QLabel#featureItem {
+    color: #c0c8e0;
+    font-size: 13px;
+    padding: 2px 4px;
+}
+QLabel#sectionHelper[tone="info"] {
+    color: #80a0d0;
+    font-size: 13px;
+}
+QLabel#sectionHelper[tone="warn"] {
+    color: #ff8060;
+    font-size: 13px;
+}
+QLabel#sectionHelper[tone="error"] {
+    color: #ff5060;
+}
+QLabel#robloxAvatar {
+    background: rgba(30, 40, 80, 120);
+    border-radius: 10px;
+}
+QLabel#robloxName {
+    color: #e0e8ff;
+}
+QLabel#robloxMeta, QLabel#robloxBio {
+    color: #8090b0;
+    font-size: 12px;
+}
+QLabel#robloxBio {
+    color: #a0a8c0;
+}
+QLabel#robloxBanned {
+    color: #ff5060;
+    font-size: 12px;
+    font-weight: bold;
+}
+QLabel#robloxPresence {
+    color: #606880;
+    font-size: 13px;
+    font-weight: bold;
+}
+QLabel#robloxPresence[presence="1"] {
+    color: #00e070;
+}
+QLabel#robloxPresence[presence="2"] {
+    color: #00c0ff;
+}
+QLabel#robloxPresence[presence="3"] {
+    color: #ffb020;
+}
 QScrollArea {
     border: none;
     background: transparent;
@@ -568,44 +485,307 @@ QLineEdit:focus {
 QLineEdit:hover {
     border: 1px solid rgba(0, 212, 255, 60);
 }
+QListView {
+    background-color: rgba(16, 16, 40, 200);
+    border: 1px solid rgba(80, 100, 180, 40);
+    border-radius: 10px;
+    padding: 4px;
+    color: #d4d4e8;
+    font-size: 13px;
+    outline: none;
+}
+QListView::item {
+    padding: 4px 8px;
+    border-radius: 6px;
+}
+QListView::item:hover {
+    background-color: rgba(35, 35, 72, 200);
+}
+QListView::item:selected {
+    background-color: rgba(0, 160, 210, 60);
+    color: #ffffff;
+}
 QTabBar {
     alignment: center;
 }
+""" + "".join(
+    f'QPushButton#themeBtn[theme="{key}"] {{ background: {color}; }}\n'
+    for key, color in THEME_SWATCHES.items()
+) + """
+QPushButton#themeBtn[active="true"] {
+    border: 2px solid rgba(0, 212, 255, 200);
+    background: rgba(0, 160, 220, 30);
+    color: #00d4ff;
+    font-weight: 700;
+}
 """
 
 
-class CrosshairPreview(QWidget):
-    """Live preview of the crosshair."""
+def _set_state(widget, name: str, value):
+    """
+    Set a dynamic property the stylesheet selects on. Only ``widget`` is
+    re-polished: no stylesheet is parsed and no subtree is touched.
+    """
+    if widget.property(name) == value:
+        return
+    widget.setProperty(name, value)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+
+
+class ColorSwatch(QPushButton):
+    """Rounded color button; the color is painted, not set through a stylesheet."""
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setFixedSize(150, 150)
-        self._config = {}
-        self._renderer = None
+        self._color = QColor(0, 0, 0)
 
-    def set_renderer(self, renderer):
-        self._renderer = renderer
+    def set_color(self, color: QColor):
+        if color != self._color:
+            self._color = QColor(color)
+            self.update()
+
+    def paintEvent(self, event):
+        p = QPainter(self)
+        p.setRenderHint(QPainter.Antialiasing)
+        p.setPen(QPen(QColor("#ffffff" if self.underMouse() else "#00d4ff"), 2))
+        p.setBrush(self._color)
+        p.drawRoundedRect(QRectF(self.rect()).adjusted(1, 1, -1, -1), 14, 14)
+        p.end()
+
+
+class CrosshairPreview(QWidget):
+    """
+    Live preview of the crosshair, drawn through the overlay's sprite cache.
 
-    def set_config(self, config: dict):
-        self._config = config
+    The grid background is rendered once per DPR. While visible and set to
+    an animation, the preview repaints from the overlay manager's clock
+    (as a clock client), so it never runs a timer of its own.
+    """
+
+    SIZE = 150
+    _STATIC = AnimationSnapshot(enabled=False)
+
+    def __init__(self, overlay, parent=None):
+        super().__init__(parent)
+        self.setFixedSize(self.SIZE, self.SIZE)
+        self._overlay = overlay
+        self._crosshair = None
+        self._animation = self._STATIC
+        self._grid = None
+        self._ticking = False
+
+    def set_setup(self, crosshair: CrosshairSnapshot, animation: AnimationSnapshot = None):
+        """Show ``crosshair``, animated by ``animation`` if given."""
+        animation = animation or self._STATIC
+        if crosshair == self._crosshair and animation == self._animation:
+            return
+        self._crosshair, self._animation = crosshair, animation
+        self._sync_clock()
         self.update()
 
+    def _sync_clock(self):
+        """Tick from the overlay clock only while visible and animated."""
+        wanted = self.isVisible() and self._animation.enabled and self._animation.type != "none"
+        if wanted == self._ticking:
+            return
+        self._ticking = wanted
+        if wanted:
+            self._overlay.add_clock_client(self.update)
+        else:
+            self._overlay.remove_clock_client(self.update)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._sync_clock()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._sync_clock()
+
+    def _grid_pixmap(self) -> QPixmap:
+        dpr = self.devicePixelRatioF()
+        if self._grid is None or self._grid.devicePixelRatio() != dpr:
+            grid = QPixmap(round(self.SIZE * dpr), round(self.SIZE * dpr))
+            grid.setDevicePixelRatio(dpr)
+            grid.fill(Qt.transparent)
+            p = QPainter(grid)
+            p.setRenderHint(QPainter.Antialiasing)
+            p.setBrush(QColor(8, 8, 22))
+            p.setPen(QPen(QColor(50, 60, 100, 60), 1))
+            p.drawRoundedRect(0, 0, self.SIZE - 1, self.SIZE - 1, 10, 10)
+            p.setPen(QPen(QColor(25, 25, 45), 1))
+            for i in range(0, self.SIZE, 20):
+                p.drawLine(i, 0, i, self.SIZE)
+                p.drawLine(0, i, self.SIZE, i)
+            p.end()
+            self._grid = grid
+        return self._grid
+
     def paintEvent(self, event):
         p = QPainter(self)
-        p.setRenderHint(QPainter.Antialiasing)
-        p.setBrush(QColor(8, 8, 22))
-        p.setPen(QPen(QColor(50, 60, 100, 60), 1))
-        p.drawRoundedRect(0, 0, 149, 149, 10, 10)
-        pen = QPen(QColor(25, 25, 45), 1)
-        p.setPen(pen)
-        for i in range(0, 150, 20):
-            p.drawLine(i, 0, i, 150)
-            p.drawLine(0, i, 150, i)
-        if self._renderer and self._config:
-            self._renderer.draw(p, 75, 75, self._config)
+        p.drawPixmap(0, 0, self._grid_pixmap())
+        if self._crosshair is not None:
+            p.setRenderHint(QPainter.Antialiasing)
+            state = self._overlay.animation.get_state(self._animation)
+            center = self.SIZE / 2
+            self._overlay.sprites.draw(p, center, center, self._crosshair, state,
+                                       self.devicePixelRatioF(), preview=True)
         p.end()
 
 
+class ProfileListModel(QAbstractListModel):
+    """
+    Profile names from a library query. Rows are handed to the view in
+    batches as it scrolls (fetchMore), and text/tooltips are produced only
+    for rows the view actually paints.
+    """
+
+    BATCH = 200
+
+    def __init__(self, library, parent=None):
+        super().__init__(parent)
+        self.library = library
+        self._names: list[str] = []
+        self._loaded = 0
+
+    def set_names(self, names: list):
+        self.beginResetModel()
+        self._names = names
+        self._loaded = min(self.BATCH, len(names))
+        self.endResetModel()
+
+    def total(self) -> int:
+        return len(self._names)
+
+    def name_at(self, row: int) -> str:
+        return self._names[row] if 0 <= row < self._loaded else ""
+
+    def row_of(self, name: str) -> int:
+        """Row of ``name`` (loading batches up to it), or -1."""
+        try:
+            row = self._names.index(name)
+        except ValueError:
+            return -1
+        if row >= self._loaded:
+            self.beginInsertRows(QModelIndex(), self._loaded, row)
+            self._loaded = row + 1
+            self.endInsertRows()
+        return row
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._loaded
+
+    def canFetchMore(self, parent):
+        return not parent.isValid() and self._loaded < len(self._names)
+
+    def fetchMore(self, parent):
+        count = min(self.BATCH, len(self._names) - self._loaded)
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= self._loaded:
+            return None
+        name = self._names[index.row()]
+        if role in (Qt.DisplayRole, Qt.UserRole):
+            return name
+        if role == Qt.ToolTipRole:
+            attrs = self.library.attrs(name)
+            if attrs is None:
+                return name
+            tags = "  #" + " #".join(attrs.tags) if attrs.tags else ""
+            return (f"{t('style.' + attrs.style)} · {attrs.size}px · "
+                    f"{t('prof.color_' + attrs.color)} · {t('anim.' + attrs.animation)}{tags}")
+        return None
+
+
+class BulkTask(QObject):
+    """Runs a bulk profile import/export on a thread; reports via queued signals."""
+
+    progress = pyqtSignal(int, int)   # done, total
+    finished = pyqtSignal(object)     # BulkResult, or the exception that stopped it
+
+    def __init__(self, fn, *args, parent=None, **kwargs):
+        super().__init__(parent)
+        self._fn, self._args, self._kwargs = fn, args, kwargs
+        self.cancel = threading.Event()
+
+    def start(self):
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def _run(self):
+        try:
+            result = self._fn(*self._args, progress=self.progress.emit,
+                              cancel=self.cancel, **self._kwargs)
+        except Exception as e:
+            print(f"[Settings] Bulk task failed: {e}")
+            result = e
+        self.finished.emit(result)
+
+
+class WallpaperCache(QObject):
+    """
+    Theme wallpapers, decoded straight to window size on a worker thread.
+
+    QImageReader.setScaledSize scales while decoding, so the full-size
+    image never exists on the GUI thread. Images are kept (premultiplied,
+    ready to blit) in a small LRU keyed by (theme, width, height), so
+    flipping back to a theme is a dict hit.
+    """
+
+    ready = pyqtSignal(object)                # key whose image is now cached
+    _decoded = pyqtSignal(object, QImage)     # worker thread -> GUI thread
+
+    def __init__(self, max_entries: int = 4, parent=None):
+        super().__init__(parent)
+        self.max_entries = max_entries
+        self._images: OrderedDict = OrderedDict()
+        self._pending = set()
+        self._decoded.connect(self._store)
+
+    @staticmethod
+    def path(theme: str) -> str:
+        return _resource_path(os.path.join("assets", "themes", f"{theme}.png"))
+
+    def get(self, theme: str, width: int, height: int) -> QImage | None:
+        """Cached wallpaper, or None while it decodes (``ready`` fires when done)."""
+        key = (theme, width, height)
+        image = self._images.get(key)
+        if image is not None:
+            self._images.move_to_end(key)
+            return image
+        path = self.path(theme)
+        if key not in self._pending and os.path.exists(path):
+            self._pending.add(key)
+            threading.Thread(target=self._decode, args=(key, path), daemon=True).start()
+        return None
+
+    def _decode(self, key, path: str):
+        width, height = key[1], key[2]
+        reader = QImageReader(path)
+        # Cover the window (KeepAspectRatioByExpanding); paintEvent crops the center
+        reader.setScaledSize(reader.size().scaled(width, height, Qt.KeepAspectRatioByExpanding))
+        reader.setQuality(100)  # Smooth scaling
+        image = reader.read()
+        if image.isNull():
+            print(f"[Settings] Cannot load wallpaper {path}: {reader.errorString()}")
+        else:
+            image = image.convertToFormat(QImage.Format_ARGB32_Premultiplied)
+        self._decoded.emit(key, image)
+
+    def _store(self, key, image: QImage):
+        self._pending.discard(key)
+        if image.isNull():
+            return
+        self._images[key] = image
+        while len(self._images) > self.max_entries:
+            self._images.popitem(last=False)
+        self.ready.emit(key)
+
+
 class ImportCrosshairDialog(QDialog):
     """Dialog for importing crosshair configs generated by AI."""
 
@@ -614,6 +794,7 @@ class ImportCrosshairDialog(QDialog):
         self.setWindowTitle(t("prof.import_title"))
         self.setFixedSize(540, 480)
         self.result_config = None
+        self.result_animation = None  # Only share codes carry an animation
         self.setStyleSheet(
             "QDialog { background: rgb(12, 12, 32); }"
             "QLabel { color: #e0e8f0; background: transparent; }"
@@ -655,7 +836,7 @@ class ImportCrosshairDialog(QDialog):
         lay.addWidget(lbl)
 
         self.text = QTextEdit()
-        self.text.setPlaceholderText('{ "style": "cross", "size": 20, ... }')
+        self.text.setPlaceholderText('{ "style": "cross", "size": 20, ... }  /  CX04104G0FY...')
         self.text.setMinimumHeight(120)
         lay.addWidget(self.text)
 
@@ -682,6 +863,12 @@ class ImportCrosshairDialog(QDialog):
         if not raw:
             return
         try:
+            if sharecode.is_share_code(raw):
+                setup = sharecode.decode(raw)
+                self.result_config = setup["crosshair"]
+                self.result_animation = setup["animation"]
+                self.accept()
+                return
             data = json.loads(raw)
             if not isinstance(data, dict):
                 raise ValueError("Expected a JSON object {...}")
@@ -709,25 +896,18 @@ class SettingsPanel(QWidget):
     hide_to_tray = pyqtSignal()
 
     W, H = 980, 660
+    # Tab order; "<key>" is built by _build_<key>_tab and titled t("tab.<key>")
+    TABS = ("crosshair", "animation", "display", "monitor", "games", "profiles", "premium")
 
-    STYLE_KEYS = [
-        "cross", "dot", "circle", "chevron", "diamond", "crossdot",
-        "triangle", "crosshair_classic", "square", "plus_thin",
-        "crosscircle", "arrows",
-    ]
-    ANIM_KEYS = [
-        "none", "pulse", "rotate", "breathe", "rainbow",
-        "recoil", "flash", "wave",
-    ]
-
-    def __init__(self, config, overlay, parent=None):
+    def __init__(self, config, overlay, history: EditHistory = None, parent=None):
         super().__init__(parent)
         self.config = config
         self.overlay = overlay
         self._color = QColor(*config.get("crosshair.color", [0, 255, 0, 255]))
         self._outline_color = QColor(*config.get("crosshair.outline_color", [0, 0, 0, 180]))
         self._theme = config.get("general.theme", "midnight")
-        self._bg_pixmap = None
+        self._bg_image = None
+        self._bg_cache = None     # Composited background (QPixmap), see _background()
 
         lang = config.get("general.language", "ru")
         set_language(lang)
@@ -743,13 +923,40 @@ class SettingsPanel(QWidget):
         self._drag_pos = None
         self._acrylic_done = False
 
+        # Preview updates are coalesced to at most one per display frame
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        refresh = QApplication.primaryScreen().refreshRate() or 60
+        self._preview_timer.setInterval(max(1, int(1000 / refresh)))
+        self._preview_timer.timeout.connect(self._flush_params)
+
+        # Gradient until the wallpaper is decoded off the GUI thread
+        self._wallpapers = WallpaperCache(parent=self)
+        self._wallpapers.ready.connect(self._on_wallpaper_ready)
         self._load_wallpaper()
 
         self._main_layout = QVBoxLayout(self)
         self._main_layout.setContentsMargins(14, 6, 14, 10)
         self._main_layout.setSpacing(4)
         self._build_ui()
-        self._load_from_config()
+        self._ensure_tab(self.tabs.currentIndex())
+        self._load_from_config(tab="general")  # Header widgets (Live) live outside the tabs
+        # Widgets follow config changes made anywhere (hotkeys, tray, presets)
+        config.subscribe(self._load_from_config,
+                         "crosshair", "animation", "display", "general.theme", "general.live_apply")
+
+        # Undo/redo over every settings change (panel, hotkeys, presets);
+        # handed over from a disposed panel so reopening keeps the stack
+        self.history = history or EditHistory(config)
+        self.history.on_change = self._update_history_buttons
+        self._update_history_buttons()
+        QShortcut(QKeySequence(config.get("hotkeys.undo", "Ctrl+Z")), self, self._undo)
+        QShortcut(QKeySequence(config.get("hotkeys.redo", "Ctrl+Y")), self, self._redo)
+
+        # Keep the monitor list in sync with connected screens
+        app = QApplication.instance()
+        app.screenAdded.connect(self._on_screens_changed)
+        app.screenRemoved.connect(self._on_screens_changed)
 
         # Monitor auto-refresh timer
         self._mon_timer = QTimer(self)
@@ -765,29 +972,45 @@ class SettingsPanel(QWidget):
     # -- Wallpaper --
 
     def _load_wallpaper(self):
-        img_path = _resource_path(os.path.join("assets", "themes", f"{self._theme}.png"))
-        if os.path.exists(img_path):
-            raw = QPixmap(img_path)
-            # Scale to window size immediately to save memory
-            self._bg_pixmap = raw.scaled(
-                self.W, self.H, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation
-            )
-        else:
-            self._bg_pixmap = None
+        """Show the current theme's wallpaper if cached; otherwise the gradient until ``ready``."""
+        self._bg_image = self._wallpapers.get(self._theme, self.W, self.H)
+        self._bg_cache = None
+        self.update()
 
-    def paintEvent(self, event):
-        p = QPainter(self)
+    def _on_wallpaper_ready(self, key):
+        if key == (self._theme, self.W, self.H):
+            self._load_wallpaper()
+
+    def _background(self) -> QPixmap:
+        """
+        The clipped, composited window background. Rendered once per
+        wallpaper, size and DPR; every repaint (drags, hovers) is one blit.
+        """
+        dpr = self.devicePixelRatioF()
+        cache = self._bg_cache
+        if (cache is None or cache.devicePixelRatio() != dpr
+                or cache.size() != self.size() * dpr):
+            image = QImage(self.size() * dpr, QImage.Format_ARGB32_Premultiplied)
+            image.setDevicePixelRatio(dpr)
+            image.fill(Qt.transparent)
+            p = QPainter(image)
+            self._paint_background(p)
+            p.end()
+            self._bg_cache = cache = QPixmap.fromImage(image)
+        return cache
+
+    def _paint_background(self, p: QPainter):
         p.setRenderHint(QPainter.Antialiasing)
         path = QPainterPath()
         path.addRoundedRect(0.0, 0.0, float(self.width()), float(self.height()), 14.0, 14.0)
         p.setClipPath(path)
 
-        if self._bg_pixmap and not self._bg_pixmap.isNull():
-            # Wallpaper is pre-scaled to window size
-            x = max(0, (self._bg_pixmap.width() - self.width()) // 2)
-            y = max(0, (self._bg_pixmap.height() - self.height()) // 2)
+        if self._bg_image is not None:
+            # Wallpaper is decoded at window size (covering it); crop the center
+            x = max(0, (self._bg_image.width() - self.width()) // 2)
+            y = max(0, (self._bg_image.height() - self.height()) // 2)
             p.setOpacity(0.88)
-            p.drawPixmap(0, 0, self._bg_pixmap, x, y, self.width(), self.height())
+            p.drawImage(0, 0, self._bg_image, x, y, self.width(), self.height())
             p.setOpacity(1.0)
             p.fillRect(self.rect(), QColor(0, 0, 0, 30))
         else:
@@ -796,19 +1019,16 @@ class SettingsPanel(QWidget):
             grad.setColorAt(0.5, QColor(12, 12, 38))
             grad.setColorAt(1.0, QColor(8, 14, 30))
             p.fillRect(self.rect(), grad)
+
+    def paintEvent(self, event):
+        p = QPainter(self)
+        p.setCompositionMode(QPainter.CompositionMode_Source)  # Bottom layer: plain copy
+        p.drawPixmap(0, 0, self._background())
         p.end()
 
     # -- UI construction --
 
     def _build_ui(self):
-        while self._main_layout.count():
-            item = self._main_layout.takeAt(0)
-            w = item.widget()
-            if w:
-                w.deleteLater()
-            elif item.layout():
-                self._clear_layout(item.layout())
-
         lay = self._main_layout
 
         # -- Custom frameless title bar --
@@ -818,11 +1038,11 @@ class SettingsPanel(QWidget):
 
         hdr = QLabel("CrosshairX")
         hdr.setFont(QFont("Segoe UI", 13, QFont.Bold))
-        hdr.setStyleSheet("color: #e0e8ff; background: transparent;")
+        hdr.setObjectName("appTitle")
         title_bar.addWidget(hdr)
 
-        sub = QLabel(t("app.subtitle"))
-        sub.setStyleSheet("color: rgba(160,170,200,140); font-size: 11px; background: transparent;")
+        sub = tr(QLabel(), "app.subtitle")
+        sub.setObjectName("appSubtitle")
         title_bar.addWidget(sub)
         title_bar.addStretch()
 
@@ -837,24 +1057,15 @@ class SettingsPanel(QWidget):
         self.combo_lang.setFixedHeight(24)
         title_bar.addWidget(self.combo_lang)
 
-        _btn_tb = (
-            "QPushButton { background: transparent; border: none; color: #8090b0;"
-            " font-size: 15px; font-weight: bold; border-radius: 6px; padding: 0 8px; }"
-            "QPushButton:hover { background: rgba(255,255,255,15); color: #e0e8ff; }"
-        )
         btn_min = QPushButton("\u2013")
+        btn_min.setObjectName("titleBtn")
         btn_min.setFixedSize(30, 24)
-        btn_min.setStyleSheet(_btn_tb)
         btn_min.clicked.connect(self.showMinimized)
         title_bar.addWidget(btn_min)
 
         btn_close = QPushButton("\u2715")
+        btn_close.setObjectName("closeBtn")
         btn_close.setFixedSize(30, 24)
-        btn_close.setStyleSheet(
-            "QPushButton { background: transparent; border: none; color: #8090b0;"
-            " font-size: 13px; font-weight: bold; border-radius: 6px; padding: 0 8px; }"
-            "QPushButton:hover { background: rgba(255,60,60,60); color: #ff6080; }"
-        )
         btn_close.clicked.connect(self.close)
         title_bar.addWidget(btn_close)
 
@@ -864,14 +1075,16 @@ class SettingsPanel(QWidget):
         lay.addWidget(title_bar_w)
 
         # -- Tabs --
+        # Every tab starts as an empty page; _ensure_tab builds it on first activation
         self.tabs = QTabWidget()
-        self.tabs.addTab(self._build_crosshair_tab(), t("tab.crosshair"))
-        self.tabs.addTab(self._build_animation_tab(), t("tab.animation"))
-        self.tabs.addTab(self._build_display_tab(), t("tab.display"))
-        self.tabs.addTab(self._build_monitor_tab(), t("tab.monitor"))
-        self.tabs.addTab(self._build_games_tab(), t("tab.games"))
-        self.tabs.addTab(self._build_profiles_tab(), t("tab.profiles"))
-        self.tabs.addTab(self._build_premium_tab(), t("tab.premium"))
+        self._built = set()
+        for i, key in enumerate(self.TABS):
+            page = QWidget()
+            page_lay = QVBoxLayout(page)
+            page_lay.setContentsMargins(0, 0, 0, 0)
+            self.tabs.addTab(page, "")
+            bind(functools.partial(self.tabs.setTabText, i), f"tab.{key}")
+        self.tabs.currentChanged.connect(self._ensure_tab)
         lay.addWidget(self.tabs)
 
         # -- Bottom buttons (stretched evenly, no min-width) --
@@ -879,23 +1092,44 @@ class SettingsPanel(QWidget):
         btn_row.setSpacing(10)
         btn_row.setContentsMargins(0, 0, 0, 0)
 
-        self.btn_apply = QPushButton(t("btn.apply"))
+        self.btn_undo = QPushButton("↶")
+        bind(self.btn_undo.setToolTip,
+             lambda: f"{t('hk.undo')} ({self.config.get('hotkeys.undo', 'Ctrl+Z')})")
+        self.btn_undo.setMinimumHeight(36)
+        self.btn_undo.setFixedWidth(40)
+        self.btn_undo.clicked.connect(self._undo)
+        btn_row.addWidget(self.btn_undo)
+
+        self.btn_redo = QPushButton("↷")
+        bind(self.btn_redo.setToolTip,
+             lambda: f"{t('hk.redo')} ({self.config.get('hotkeys.redo', 'Ctrl+Y')})")
+        self.btn_redo.setMinimumHeight(36)
+        self.btn_redo.setFixedWidth(40)
+        self.btn_redo.clicked.connect(self._redo)
+        btn_row.addWidget(self.btn_redo)
+
+        self.btn_apply = tr(QPushButton(), "btn.apply")
         self.btn_apply.setObjectName("accentBtn")
         self.btn_apply.setMinimumHeight(36)
         self.btn_apply.clicked.connect(self._apply_settings)
         btn_row.addWidget(self.btn_apply, 1)
 
-        self.btn_reset = QPushButton(t("btn.reset"))
+        self.chk_live = tr(QCheckBox(), "btn.live")
+        bind(self.chk_live.setToolTip, "btn.live_tip")
+        self.chk_live.toggled.connect(self._toggle_live_apply)
+        btn_row.addWidget(self.chk_live)
+
+        self.btn_reset = tr(QPushButton(), "btn.reset")
         self.btn_reset.setMinimumHeight(36)
         self.btn_reset.clicked.connect(self._reset_defaults)
         btn_row.addWidget(self.btn_reset, 1)
 
-        self.btn_hide = QPushButton(t("btn.show"))
+        self.btn_hide = tr(QPushButton(), "btn.show")
         self.btn_hide.setMinimumHeight(36)
         self.btn_hide.clicked.connect(self._toggle_overlay)
         btn_row.addWidget(self.btn_hide, 1)
 
-        self.btn_quit = QPushButton(t("btn.quit"))
+        self.btn_quit = tr(QPushButton(), "btn.quit")
         self.btn_quit.setObjectName("dangerBtn")
         self.btn_quit.setMinimumHeight(36)
         self.btn_quit.clicked.connect(self._quit_app)
@@ -910,6 +1144,18 @@ class SettingsPanel(QWidget):
     #                       TAB BUILDERS
     # ================================================================
 
+    def _ensure_tab(self, index: int):
+        """Build tab ``index`` if it is still an empty page, then show config values in it."""
+        if not 0 <= index < len(self.TABS) or self.TABS[index] in self._built:
+            return
+        key = self.TABS[index]
+        self.tabs.widget(index).layout().addWidget(getattr(self, f"_build_{key}_tab")())
+        self._built.add(key)
+        if key == "profiles":
+            self._refresh_profiles()
+        else:
+            self._load_from_config(tab=key)
+
     def _make_scroll(self, inner_widget):
         """Wrap a widget in a transparent QScrollArea."""
         scroll = QScrollArea()
@@ -931,30 +1177,27 @@ class SettingsPanel(QWidget):
         top.setSpacing(8)
 
         # Preview
-        pg = QGroupBox(t("xhair.preview"))
+        pg = tr(QGroupBox(), "xhair.preview", setter="setTitle")
         pl = QVBoxLayout(pg)
-        self.preview = CrosshairPreview()
-        from .crosshair import CrosshairRenderer
-        self._preview_renderer = CrosshairRenderer()
-        self.preview.set_renderer(self._preview_renderer)
+        self.preview = CrosshairPreview(self.overlay)
         pl.addWidget(self.preview, alignment=Qt.AlignCenter)
         pg.setFixedWidth(185)
         top.addWidget(pg)
 
         # Style + color
-        sg = QGroupBox(t("xhair.style"))
+        sg = tr(QGroupBox(), "xhair.style", setter="setTitle")
         sl = QVBoxLayout(sg)
         sl.setSpacing(6)
 
         self.combo_style = QComboBox()
-        for key in self.STYLE_KEYS:
-            self.combo_style.addItem(t(f"style.{key}"), key)
+        for key in STYLE_KEYS:
+            _add_item(self.combo_style, f"style.{key}", key)
         self.combo_style.currentIndexChanged.connect(self._on_param_changed)
         sl.addWidget(self.combo_style)
 
         cr = QHBoxLayout()
-        cr.addWidget(QLabel(t("xhair.color")))
-        self.btn_color = QPushButton()
+        cr.addWidget(tr(QLabel(), "xhair.color"))
+        self.btn_color = ColorSwatch()
         self.btn_color.setObjectName("colorBtn")
         self.btn_color.setFixedSize(28, 28)
         self.btn_color.clicked.connect(self._pick_color)
@@ -963,7 +1206,7 @@ class SettingsPanel(QWidget):
         cr.addStretch()
         sl.addLayout(cr)
 
-        self.chk_t_style = QCheckBox(t("xhair.t_style"))
+        self.chk_t_style = tr(QCheckBox(), "xhair.t_style")
         self.chk_t_style.stateChanged.connect(self._on_param_changed)
         sl.addWidget(self.chk_t_style)
         sl.addStretch()
@@ -972,7 +1215,7 @@ class SettingsPanel(QWidget):
         lay.addLayout(top)
 
         # Parameters
-        pg2 = QGroupBox(t("xhair.params"))
+        pg2 = tr(QGroupBox(), "xhair.params", setter="setTitle")
         g = QGridLayout(pg2)
         g.setVerticalSpacing(7)
         g.setHorizontalSpacing(8)
@@ -980,7 +1223,7 @@ class SettingsPanel(QWidget):
         g.setColumnStretch(1, 1)
         g.setColumnMinimumWidth(2, 36)
 
-        g.addWidget(QLabel(t("xhair.size")), 0, 0)
+        g.addWidget(tr(QLabel(), "xhair.size"), 0, 0)
         self.slider_size = QSlider(Qt.Horizontal)
         self.slider_size.setRange(4, 100)
         self.slider_size.valueChanged.connect(self._on_param_changed)
@@ -989,7 +1232,7 @@ class SettingsPanel(QWidget):
         self.lbl_size.setObjectName("valueLabel")
         g.addWidget(self.lbl_size, 0, 2)
 
-        g.addWidget(QLabel(t("xhair.thickness")), 1, 0)
+        g.addWidget(tr(QLabel(), "xhair.thickness"), 1, 0)
         self.slider_thickness = QSlider(Qt.Horizontal)
         self.slider_thickness.setRange(1, 10)
         self.slider_thickness.valueChanged.connect(self._on_param_changed)
@@ -998,7 +1241,7 @@ class SettingsPanel(QWidget):
         self.lbl_thickness.setObjectName("valueLabel")
         g.addWidget(self.lbl_thickness, 1, 2)
 
-        g.addWidget(QLabel(t("xhair.gap")), 2, 0)
+        g.addWidget(tr(QLabel(), "xhair.gap"), 2, 0)
         self.slider_gap = QSlider(Qt.Horizontal)
         self.slider_gap.setRange(0, 30)
         self.slider_gap.valueChanged.connect(self._on_param_changed)
@@ -1008,10 +1251,10 @@ class SettingsPanel(QWidget):
         g.addWidget(self.lbl_gap, 2, 2)
 
         dr = QHBoxLayout()
-        self.chk_dot = QCheckBox(t("xhair.dot"))
+        self.chk_dot = tr(QCheckBox(), "xhair.dot")
         self.chk_dot.stateChanged.connect(self._on_param_changed)
         dr.addWidget(self.chk_dot)
-        dr.addWidget(QLabel(t("xhair.dot_size")))
+        dr.addWidget(tr(QLabel(), "xhair.dot_size"))
         self.spin_dot_size = QSpinBox()
         self.spin_dot_size.setRange(1, 10)
         self.spin_dot_size.valueChanged.connect(self._on_param_changed)
@@ -1020,10 +1263,10 @@ class SettingsPanel(QWidget):
         g.addLayout(dr, 3, 0, 1, 3)
 
         olr = QHBoxLayout()
-        self.chk_outline = QCheckBox(t("xhair.outline"))
+        self.chk_outline = tr(QCheckBox(), "xhair.outline")
         self.chk_outline.stateChanged.connect(self._on_param_changed)
         olr.addWidget(self.chk_outline)
-        olr.addWidget(QLabel(t("xhair.outline_thick")))
+        olr.addWidget(tr(QLabel(), "xhair.outline_thick"))
         self.spin_outline = QSpinBox()
         self.spin_outline.setRange(1, 5)
         self.spin_outline.valueChanged.connect(self._on_param_changed)
@@ -1043,7 +1286,7 @@ class SettingsPanel(QWidget):
         lay.setSpacing(6)
         lay.setContentsMargins(6, 4, 6, 4)
 
-        grp = QGroupBox(t("anim.settings"))
+        grp = tr(QGroupBox(), "anim.settings", setter="setTitle")
         g = QGridLayout(grp)
         g.setVerticalSpacing(7)
         g.setHorizontalSpacing(8)
@@ -1051,18 +1294,18 @@ class SettingsPanel(QWidget):
         g.setColumnStretch(1, 1)
         g.setColumnMinimumWidth(2, 36)
 
-        self.chk_anim = QCheckBox(t("anim.enable"))
+        self.chk_anim = tr(QCheckBox(), "anim.enable")
         self.chk_anim.stateChanged.connect(self._on_param_changed)
         g.addWidget(self.chk_anim, 0, 0, 1, 3)
 
-        g.addWidget(QLabel(t("anim.type")), 1, 0)
+        g.addWidget(tr(QLabel(), "anim.type"), 1, 0)
         self.combo_anim = QComboBox()
-        for key in self.ANIM_KEYS:
-            self.combo_anim.addItem(t(f"anim.{key}"), key)
+        for key in ANIM_KEYS:
+            _add_item(self.combo_anim, f"anim.{key}", key)
         self.combo_anim.currentIndexChanged.connect(self._on_param_changed)
         g.addWidget(self.combo_anim, 1, 1, 1, 2)
 
-        g.addWidget(QLabel(t("anim.speed")), 2, 0)
+        g.addWidget(tr(QLabel(), "anim.speed"), 2, 0)
         self.slider_anim_speed = QSlider(Qt.Horizontal)
         self.slider_anim_speed.setRange(1, 50)
         self.slider_anim_speed.valueChanged.connect(self._on_param_changed)
@@ -1071,7 +1314,7 @@ class SettingsPanel(QWidget):
         self.lbl_anim_speed.setObjectName("valueLabel")
         g.addWidget(self.lbl_anim_speed, 2, 2)
 
-        g.addWidget(QLabel(t("anim.intensity")), 3, 0)
+        g.addWidget(tr(QLabel(), "anim.intensity"), 3, 0)
         self.slider_anim_intensity = QSlider(Qt.Horizontal)
         self.slider_anim_intensity.setRange(0, 100)
         self.slider_anim_intensity.valueChanged.connect(self._on_param_changed)
@@ -1083,7 +1326,7 @@ class SettingsPanel(QWidget):
         lay.addWidget(grp)
 
         # -- Collapsible effect descriptions (hidden by default) --
-        self._desc_toggle = QPushButton(t("anim.show_desc"))
+        self._desc_toggle = tr(QPushButton(), "anim.show_desc")
         self._desc_toggle.setObjectName("descToggle")
         self._desc_toggle.setCursor(Qt.PointingHandCursor)
         self._desc_toggle.clicked.connect(self._toggle_descriptions)
@@ -1096,7 +1339,7 @@ class SettingsPanel(QWidget):
         desc_lay.setContentsMargins(8, 4, 8, 4)
         desc_lay.setSpacing(2)
         for dk in ["pulse", "rotate", "breathe", "rainbow", "recoil", "flash", "wave"]:
-            lbl = QLabel(t(f"anim.desc.{dk}"))
+            lbl = tr(QLabel(), f"anim.desc.{dk}")
             lbl.setObjectName("sectionHelper")
             lbl.setWordWrap(True)
             desc_lay.addWidget(lbl)
@@ -1116,32 +1359,23 @@ class SettingsPanel(QWidget):
         lay.setContentsMargins(6, 4, 6, 4)
 
         # Theme selector
-        theme_grp = QGroupBox(t("disp.theme"))
+        theme_grp = tr(QGroupBox(), "disp.theme", setter="setTitle")
         theme_lay = QHBoxLayout(theme_grp)
         theme_lay.setSpacing(6)
         self.theme_buttons = {}
-        _theme_colors = {
-            "midnight": "#0a1432",
-            "purple":   "#1c0828",
-            "ocean":    "#061840",
-            "sakura":   "#28081c",
-        }
         for key in THEME_KEYS:
-            btn = QPushButton(t(f"theme.{key}"))
+            btn = tr(QPushButton(), f"theme.{key}")
             btn.setFixedHeight(32)
-            active = key == self._theme
-            btn.setObjectName("themeBtnActive" if active else "themeBtn")
-            btn.setStyleSheet(
-                f"QPushButton {{ background: {_theme_colors[key]}; }}"
-                if not active else ""
-            )
+            btn.setObjectName("themeBtn")
+            btn.setProperty("theme", key)
+            btn.setProperty("active", key == self._theme)
             btn.clicked.connect(lambda checked, k=key: self._set_theme(k))
             self.theme_buttons[key] = btn
             theme_lay.addWidget(btn)
         lay.addWidget(theme_grp)
 
         # Display settings
-        grp = QGroupBox(t("disp.settings"))
+        grp = tr(QGroupBox(), "disp.settings", setter="setTitle")
         g = QGridLayout(grp)
         g.setVerticalSpacing(7)
         g.setHorizontalSpacing(8)
@@ -1149,22 +1383,28 @@ class SettingsPanel(QWidget):
         g.setColumnStretch(1, 1)
         g.setColumnMinimumWidth(2, 36)
 
-        g.addWidget(QLabel(t("disp.monitor")), 0, 0)
-        self.spin_monitor = QSpinBox()
-        self.spin_monitor.setRange(0, 10)
-        g.addWidget(self.spin_monitor, 0, 1)
+        g.addWidget(tr(QLabel(), "disp.monitor"), 0, 0, Qt.AlignTop)
+        monitors_w = QWidget()
+        self._monitor_lay = QVBoxLayout(monitors_w)
+        self._monitor_lay.setContentsMargins(0, 0, 0, 0)
+        self._monitor_lay.setSpacing(3)
+        self.monitor_checks = []
+        self._rebuild_monitor_checks()
+        g.addWidget(monitors_w, 0, 1, 1, 2)
 
-        g.addWidget(QLabel(t("disp.offset_x")), 1, 0)
+        g.addWidget(tr(QLabel(), "disp.offset_x"), 1, 0)
         self.spin_offset_x = QSpinBox()
         self.spin_offset_x.setRange(-500, 500)
+        self.spin_offset_x.valueChanged.connect(self._on_param_changed)
         g.addWidget(self.spin_offset_x, 1, 1)
 
-        g.addWidget(QLabel(t("disp.offset_y")), 2, 0)
+        g.addWidget(tr(QLabel(), "disp.offset_y"), 2, 0)
         self.spin_offset_y = QSpinBox()
         self.spin_offset_y.setRange(-500, 500)
+        self.spin_offset_y.valueChanged.connect(self._on_param_changed)
         g.addWidget(self.spin_offset_y, 2, 1)
 
-        g.addWidget(QLabel(t("disp.opacity")), 3, 0)
+        g.addWidget(tr(QLabel(), "disp.opacity"), 3, 0)
         self.slider_opacity = QSlider(Qt.Horizontal)
         self.slider_opacity.setRange(10, 100)
         self.slider_opacity.valueChanged.connect(self._on_param_changed)
@@ -1173,36 +1413,36 @@ class SettingsPanel(QWidget):
         self.lbl_opacity.setObjectName("valueLabel")
         g.addWidget(self.lbl_opacity, 3, 2)
 
-        g.addWidget(QLabel(t("disp.fps")), 4, 0)
+        g.addWidget(tr(QLabel(), "disp.fps"), 4, 0)
         self.spin_fps = QSpinBox()
         self.spin_fps.setRange(10, 144)
+        self.spin_fps.valueChanged.connect(self._on_param_changed)
         g.addWidget(self.spin_fps, 4, 1)
 
         lay.addWidget(grp)
 
         # Hotkeys
-        hk_grp = QGroupBox(t("disp.hotkeys"))
+        hk_grp = tr(QGroupBox(), "disp.hotkeys", setter="setTitle")
         hk_lay = QVBoxLayout(hk_grp)
         hk_lay.setSpacing(3)
         hk_data = [
-            ("F6",  t("hk.toggle")),
-            ("F7",  t("hk.next")),
-            ("F8",  t("hk.prev")),
-            ("F9",  t("hk.anim")),
-            ("F10", t("hk.settings")),
+            ("F6",  "hk.toggle"),
+            ("F7",  "hk.next"),
+            ("F8",  "hk.prev"),
+            ("F9",  "hk.anim"),
+            ("F10", "hk.settings"),
+            (self.config.get("hotkeys.undo", "Ctrl+Z"), "hk.undo"),
+            (self.config.get("hotkeys.redo", "Ctrl+Y"), "hk.redo"),
         ]
         for key, desc in hk_data:
             row = QHBoxLayout()
             kl = QLabel(key)
-            kl.setStyleSheet(
-                "background: rgba(0,170,230,30); padding: 3px 10px; border-radius: 5px;"
-                "font-weight: bold; color: #00d4ff; min-width: 32px; font-size: 13px;"
-            )
+            kl.setObjectName("hotkeyChip")
             kl.setAlignment(Qt.AlignCenter)
-            kl.setFixedWidth(46)
+            kl.setMinimumWidth(46)
             row.addWidget(kl)
-            dl = QLabel(f"  {desc}")
-            dl.setStyleSheet("color: #a0a8c0; font-size: 13px;")
+            dl = tr(QLabel(), lambda desc=desc: f"  {t(desc)}")
+            dl.setObjectName("hotkeyDesc")
             row.addWidget(dl)
             row.addStretch()
             hk_lay.addLayout(row)
@@ -1220,7 +1460,7 @@ class SettingsPanel(QWidget):
         lay.setContentsMargins(6, 4, 6, 4)
 
         # System Resources
-        sys_grp = QGroupBox(t("mon.system"))
+        sys_grp = tr(QGroupBox(), "mon.system", setter="setTitle")
         sg = QGridLayout(sys_grp)
         sg.setVerticalSpacing(6)
         sg.setHorizontalSpacing(8)
@@ -1228,7 +1468,7 @@ class SettingsPanel(QWidget):
         sg.setColumnStretch(1, 1)
 
         row = 0
-        sg.addWidget(QLabel(t("mon.cpu")), row, 0)
+        sg.addWidget(tr(QLabel(), "mon.cpu"), row, 0)
         self._cpu_bar = QProgressBar()
         self._cpu_bar.setRange(0, 100)
         self._cpu_bar.setValue(0)
@@ -1236,7 +1476,7 @@ class SettingsPanel(QWidget):
         sg.addWidget(self._cpu_bar, row, 1)
 
         row += 1
-        sg.addWidget(QLabel(t("mon.ram")), row, 0)
+        sg.addWidget(tr(QLabel(), "mon.ram"), row, 0)
         self._ram_bar = QProgressBar()
         self._ram_bar.setRange(0, 100)
         self._ram_bar.setValue(0)
@@ -1244,7 +1484,7 @@ class SettingsPanel(QWidget):
         sg.addWidget(self._ram_bar, row, 1)
 
         row += 1
-        sg.addWidget(QLabel(t("mon.gpu")), row, 0)
+        sg.addWidget(tr(QLabel(), "mon.gpu"), row, 0)
         self._gpu_bar = QProgressBar()
         self._gpu_bar.setRange(0, 100)
         self._gpu_bar.setValue(0)
@@ -1252,13 +1492,13 @@ class SettingsPanel(QWidget):
         sg.addWidget(self._gpu_bar, row, 1)
 
         row += 1
-        sg.addWidget(QLabel(t("mon.gpu_temp")), row, 0)
+        sg.addWidget(tr(QLabel(), "mon.gpu_temp"), row, 0)
         self._gpu_temp_lbl = QLabel("N/A")
-        self._gpu_temp_lbl.setStyleSheet("color: #d4d4e8; font-size: 13px;")
+        self._gpu_temp_lbl.setObjectName("statValue")
         sg.addWidget(self._gpu_temp_lbl, row, 1)
 
         row += 1
-        sg.addWidget(QLabel(t("mon.disk")), row, 0)
+        sg.addWidget(tr(QLabel(), "mon.disk"), row, 0)
         self._disk_bar = QProgressBar()
         self._disk_bar.setRange(0, 100)
         self._disk_bar.setValue(0)
@@ -1266,46 +1506,54 @@ class SettingsPanel(QWidget):
         sg.addWidget(self._disk_bar, row, 1)
 
         row += 1
-        sg.addWidget(QLabel(t("mon.cpu_freq")), row, 0)
+        sg.addWidget(tr(QLabel(), "mon.cpu_freq"), row, 0)
         self._cpu_freq_lbl = QLabel("—")
-        self._cpu_freq_lbl.setStyleSheet("color: #d4d4e8; font-size: 13px;")
+        self._cpu_freq_lbl.setObjectName("statValue")
         sg.addWidget(self._cpu_freq_lbl, row, 1)
 
         row += 1
-        sg.addWidget(QLabel(t("mon.cpu_cores")), row, 0)
+        sg.addWidget(tr(QLabel(), "mon.cpu_cores"), row, 0)
         self._cpu_cores_lbl = QLabel("—")
-        self._cpu_cores_lbl.setStyleSheet("color: #d4d4e8; font-size: 13px;")
+        self._cpu_cores_lbl.setObjectName("statValue")
         sg.addWidget(self._cpu_cores_lbl, row, 1)
 
         row += 1
-        sg.addWidget(QLabel(t("mon.net_sent")), row, 0)
+        sg.addWidget(tr(QLabel(), "mon.net_sent"), row, 0)
         self._net_sent_lbl = QLabel("—")
-        self._net_sent_lbl.setStyleSheet("color: #80e0a0; font-size: 13px;")
+        self._net_sent_lbl.setObjectName("statValue")
+        self._net_sent_lbl.setProperty("tone", "sent")
         sg.addWidget(self._net_sent_lbl, row, 1)
 
         row += 1
-        sg.addWidget(QLabel(t("mon.net_recv")), row, 0)
+        sg.addWidget(tr(QLabel(), "mon.net_recv"), row, 0)
         self._net_recv_lbl = QLabel("—")
-        self._net_recv_lbl.setStyleSheet("color: #80c0e0; font-size: 13px;")
+        self._net_recv_lbl.setObjectName("statValue")
+        self._net_recv_lbl.setProperty("tone", "recv")
         sg.addWidget(self._net_recv_lbl, row, 1)
 
         row += 1
-        sg.addWidget(QLabel(t("mon.uptime")), row, 0)
+        sg.addWidget(tr(QLabel(), "mon.uptime"), row, 0)
         self._uptime_lbl = QLabel("—")
-        self._uptime_lbl.setStyleSheet("color: #d4d4e8; font-size: 13px;")
+        self._uptime_lbl.setObjectName("statValue")
         sg.addWidget(self._uptime_lbl, row, 1)
 
+        row += 1
+        sg.addWidget(tr(QLabel(), "mon.apply_latency"), row, 0)
+        self._latency_lbl = QLabel("—")
+        self._latency_lbl.setObjectName("statValue")
+        sg.addWidget(self._latency_lbl, row, 1)
+
         lay.addWidget(sys_grp)
 
         # Controls
         ctrl = QHBoxLayout()
         ctrl.setSpacing(8)
-        btn_refresh = QPushButton(t("mon.refresh"))
+        btn_refresh = tr(QPushButton(), "mon.refresh")
         btn_refresh.setObjectName("accentBtn")
         btn_refresh.clicked.connect(self._refresh_monitor)
         ctrl.addWidget(btn_refresh)
 
-        self._chk_auto_refresh = QCheckBox(t("mon.auto_refresh"))
+        self._chk_auto_refresh = tr(QCheckBox(), "mon.auto_refresh")
         self._chk_auto_refresh.stateChanged.connect(self._toggle_monitor_auto)
         ctrl.addWidget(self._chk_auto_refresh)
         ctrl.addStretch()
@@ -1327,40 +1575,40 @@ class SettingsPanel(QWidget):
         lay.setContentsMargins(6, 4, 6, 4)
 
         # Detected Games
-        game_grp = QGroupBox(t("games.detected"))
+        game_grp = tr(QGroupBox(), "games.detected", setter="setTitle")
         gl = QVBoxLayout(game_grp)
         gl.setSpacing(4)
-        self._games_label = QLabel(t("games.no_games"))
+        self._games_label = QLabel(t("games.no_games"))  # Rewritten by _show_games
         self._games_label.setWordWrap(True)
-        self._games_label.setStyleSheet("color: #a0a8c0; font-size: 13px; padding: 4px;")
+        self._games_label.setObjectName("gamesLabel")
         gl.addWidget(self._games_label)
         lay.addWidget(game_grp)
 
         # Controls
         ctrl = QHBoxLayout()
         ctrl.setSpacing(8)
-        btn_refresh_games = QPushButton(t("games.refresh"))
+        btn_refresh_games = tr(QPushButton(), "games.refresh")
         btn_refresh_games.setObjectName("accentBtn")
         btn_refresh_games.clicked.connect(self._refresh_games)
         ctrl.addWidget(btn_refresh_games)
-        self._chk_auto_games = QCheckBox(t("games.auto_detect"))
+        self._chk_auto_games = tr(QCheckBox(), "games.auto_detect")
         self._chk_auto_games.stateChanged.connect(self._toggle_games_auto)
         ctrl.addWidget(self._chk_auto_games)
         ctrl.addStretch()
         lay.addLayout(ctrl)
 
         # Roblox Player Search
-        roblox_grp = QGroupBox(t("roblox.search"))
+        roblox_grp = tr(QGroupBox(), "roblox.search", setter="setTitle")
         rl = QVBoxLayout(roblox_grp)
         rl.setSpacing(6)
         search_row = QHBoxLayout()
         search_row.setSpacing(6)
         self._roblox_input = QLineEdit()
-        self._roblox_input.setPlaceholderText(t("roblox.search_hint"))
+        bind(self._roblox_input.setPlaceholderText, "roblox.search_hint")
         self._roblox_input.setMinimumHeight(30)
         self._roblox_input.returnPressed.connect(self._search_roblox)
         search_row.addWidget(self._roblox_input, 1)
-        btn_roblox = QPushButton(t("roblox.search_btn"))
+        btn_roblox = tr(QPushButton(), "roblox.search_btn")
         btn_roblox.setObjectName("accentBtn")
         btn_roblox.setMinimumHeight(30)
         btn_roblox.clicked.connect(self._search_roblox)
@@ -1377,20 +1625,20 @@ class SettingsPanel(QWidget):
         lay.addWidget(roblox_grp)
 
         # Recommended presets
-        preset_grp = QGroupBox(t("games.recommended"))
+        preset_grp = tr(QGroupBox(), "games.recommended", setter="setTitle")
         self._preset_lay = QVBoxLayout(preset_grp)
         self._preset_lay.setSpacing(4)
-        _ph = QLabel(t("games.no_preset"))
+        _ph = tr(QLabel(), "games.no_preset")
         _ph.setObjectName("sectionHelper")
         _ph.setWordWrap(True)
         self._preset_lay.addWidget(_ph)
         lay.addWidget(preset_grp)
 
         # Tips
-        tips_grp = QGroupBox(t("games.tips"))
+        tips_grp = tr(QGroupBox(), "games.tips", setter="setTitle")
         self._tips_lay = QVBoxLayout(tips_grp)
         self._tips_lay.setSpacing(3)
-        _th = QLabel(t("games.no_tips"))
+        _th = tr(QLabel(), "games.no_tips")
         _th.setObjectName("sectionHelper")
         _th.setWordWrap(True)
         self._tips_lay.addWidget(_th)
@@ -1408,40 +1656,35 @@ class SettingsPanel(QWidget):
         lay.setContentsMargins(6, 4, 6, 4)
 
         # Status card
-        status_grp = QGroupBox(t("prem.status"))
+        status_grp = tr(QGroupBox(), "prem.status", setter="setTitle")
         sl = QVBoxLayout(status_grp)
         sl.setSpacing(6)
         is_prem = self._is_premium()
-        self._prem_status_lbl = QLabel(
-            t("prem.active") if is_prem else t("prem.free")
-        )
-        self._prem_status_lbl.setStyleSheet(
-            "color: #00e070; font-size: 16px; font-weight: bold; padding: 8px;"
-            if is_prem
-            else "color: #a0a8c0; font-size: 16px; font-weight: bold; padding: 8px;"
-        )
+        self._prem_status_lbl = tr(QLabel(), "prem.active" if is_prem else "prem.free")
+        self._prem_status_lbl.setObjectName("premStatus")
+        self._prem_status_lbl.setProperty("premium", is_prem)
         self._prem_status_lbl.setAlignment(Qt.AlignCenter)
         sl.addWidget(self._prem_status_lbl)
         lay.addWidget(status_grp)
 
         # Features list
-        feat_grp = QGroupBox(t("prem.features"))
+        feat_grp = tr(QGroupBox(), "prem.features", setter="setTitle")
         fl = QVBoxLayout(feat_grp)
         fl.setSpacing(4)
         for key in [
             "prem.feat_ai", "prem.feat_anim", "prem.feat_roblox",
             "prem.feat_auto", "prem.feat_profiles", "prem.feat_presets",
         ]:
-            lbl = QLabel(f"  \u2726  {t(key)}")
-            lbl.setStyleSheet("color: #c0c8e0; font-size: 13px; padding: 2px 4px;")
+            lbl = tr(QLabel(), lambda key=key: f"  \u2726  {t(key)}")
+            lbl.setObjectName("featureItem")
             fl.addWidget(lbl)
         lay.addWidget(feat_grp)
 
         # Promo code
-        promo_grp = QGroupBox(t("prem.promo"))
+        promo_grp = tr(QGroupBox(), "prem.promo", setter="setTitle")
         pl = QVBoxLayout(promo_grp)
         pl.setSpacing(6)
-        hint = QLabel(t("prem.promo_hint"))
+        hint = tr(QLabel(), "prem.promo_hint")
         hint.setObjectName("sectionHelper")
         hint.setWordWrap(True)
         pl.addWidget(hint)
@@ -1452,7 +1695,7 @@ class SettingsPanel(QWidget):
         self._promo_input.setMinimumHeight(30)
         self._promo_input.returnPressed.connect(self._try_promo)
         promo_row.addWidget(self._promo_input, 1)
-        btn_promo = QPushButton(t("prem.activate"))
+        btn_promo = tr(QPushButton(), "prem.activate")
         btn_promo.setObjectName("accentBtn")
         btn_promo.setMinimumHeight(30)
         btn_promo.clicked.connect(self._try_promo)
@@ -1461,11 +1704,11 @@ class SettingsPanel(QWidget):
         lay.addWidget(promo_grp)
 
         # Buy Premium button
-        buy_hint = QLabel(t("prem.buy_hint"))
+        buy_hint = tr(QLabel(), "prem.buy_hint")
         buy_hint.setObjectName("sectionHelper")
         buy_hint.setWordWrap(True)
         lay.addWidget(buy_hint)
-        btn_buy = QPushButton(t("prem.buy"))
+        btn_buy = tr(QPushButton(), "prem.buy")
         btn_buy.setObjectName("accentBtn")
         btn_buy.setMinimumHeight(38)
         btn_buy.clicked.connect(self._buy_premium)
@@ -1477,59 +1720,138 @@ class SettingsPanel(QWidget):
     # -- Profiles Tab --
 
     def _build_profiles_tab(self):
+        from . import bulk
         w = QWidget()
         lay = QVBoxLayout(w)
         lay.setSpacing(6)
         lay.setContentsMargins(6, 4, 6, 4)
 
-        grp = QGroupBox(t("prof.title"))
+        grp = tr(QGroupBox(), "prof.title", setter="setTitle")
         gl = QVBoxLayout(grp)
         gl.setSpacing(5)
 
-        sr = QHBoxLayout()
-        sr.addWidget(QLabel(t("prof.profile")))
-        self.combo_profile = QComboBox()
-        self._refresh_profiles()
-        sr.addWidget(self.combo_profile, 1)
-        gl.addLayout(sr)
+        self.edit_profile_search = QLineEdit()
+        bind(self.edit_profile_search.setPlaceholderText, "prof.search")
+        self.edit_profile_search.setClearButtonEnabled(True)
+        gl.addWidget(self.edit_profile_search)
+
+        fr = QGridLayout()
+        fr.setSpacing(5)
+        self.combo_filter_style = QComboBox()
+        _add_item(self.combo_filter_style, "prof.any_style", None)
+        for key in STYLE_KEYS:
+            _add_item(self.combo_filter_style, f"style.{key}", key)
+        fr.addWidget(self.combo_filter_style, 0, 0)
+        self.combo_filter_color = QComboBox()
+        _add_item(self.combo_filter_color, "prof.any_color", None)
+        for key in COLOR_FAMILIES:
+            _add_item(self.combo_filter_color, f"prof.color_{key}", key)
+        fr.addWidget(self.combo_filter_color, 0, 1)
+        self.combo_filter_anim = QComboBox()
+        _add_item(self.combo_filter_anim, "prof.any_anim", None)
+        for key in ANIM_KEYS:
+            _add_item(self.combo_filter_anim, f"anim.{key}", key)
+        fr.addWidget(self.combo_filter_anim, 1, 0)
+        size_row = QHBoxLayout()
+        size_row.addWidget(tr(QLabel(), "xhair.size"))
+        lo, hi = int(SCHEMA["crosshair"]["size"].lo), int(SCHEMA["crosshair"]["size"].hi)
+        self.spin_filter_size_min = QSpinBox()
+        self.spin_filter_size_min.setRange(lo, hi)
+        self.spin_filter_size_min.setValue(lo)
+        size_row.addWidget(self.spin_filter_size_min)
+        size_row.addWidget(QLabel("–"))
+        self.spin_filter_size_max = QSpinBox()
+        self.spin_filter_size_max.setRange(lo, hi)
+        self.spin_filter_size_max.setValue(hi)
+        size_row.addWidget(self.spin_filter_size_max)
+        fr.addLayout(size_row, 1, 1)
+        gl.addLayout(fr)
+
+        self.profile_model = ProfileListModel(self.config.library, self)
+        self.list_profiles = QListView()
+        self.list_profiles.setModel(self.profile_model)
+        self.list_profiles.setUniformItemSizes(True)  # Only visible rows are measured/painted
+        self.list_profiles.setMinimumHeight(180)
+        self.list_profiles.doubleClicked.connect(lambda index: self._load_profile())
+        gl.addWidget(self.list_profiles)
+        self.lbl_profile_count = QLabel()
+        self.lbl_profile_count.setObjectName("sectionHelper")
+        gl.addWidget(self.lbl_profile_count)
+
+        self.edit_profile_search.textChanged.connect(self._refresh_profiles)
+        for combo in (self.combo_filter_style, self.combo_filter_color, self.combo_filter_anim):
+            combo.currentIndexChanged.connect(self._refresh_profiles)
+        for spin in (self.spin_filter_size_min, self.spin_filter_size_max):
+            spin.valueChanged.connect(self._refresh_profiles)
 
         bg = QGridLayout()
         bg.setSpacing(5)
-        bl = QPushButton(t("prof.load"))
+        bl = tr(QPushButton(), "prof.load")
         bl.clicked.connect(self._load_profile)
         bg.addWidget(bl, 0, 0)
-        bs = QPushButton(t("prof.save"))
+        bs = tr(QPushButton(), "prof.save")
         bs.clicked.connect(self._save_profile)
         bg.addWidget(bs, 0, 1)
-        bd = QPushButton(t("prof.delete"))
+        bd = tr(QPushButton(), "prof.delete")
         bd.setObjectName("dangerBtn")
         bd.clicked.connect(self._delete_profile)
         bg.addWidget(bd, 1, 0)
-        br = QPushButton(t("prof.refresh"))
-        br.clicked.connect(self._refresh_profiles)
+        br = tr(QPushButton(), "prof.refresh")
+        br.clicked.connect(self._rescan_profiles)
         bg.addWidget(br, 1, 1)
+        btn_tags = tr(QPushButton(), "prof.tags")
+        btn_tags.clicked.connect(self._edit_profile_tags)
+        bg.addWidget(btn_tags, 2, 0, 1, 2)
         gl.addLayout(bg)
         lay.addWidget(grp)
 
+        # Library import/export (zip)
+        lg = tr(QGroupBox(), "prof.library", setter="setTitle")
+        ll = QGridLayout(lg)
+        ll.setSpacing(5)
+        self._btn_lib_import = tr(QPushButton(), "prof.lib_import")
+        self._btn_lib_import.clicked.connect(self._import_library)
+        ll.addWidget(self._btn_lib_import, 0, 0)
+        self._btn_lib_export = tr(QPushButton(), "prof.lib_export")
+        self._btn_lib_export.clicked.connect(self._export_library)
+        ll.addWidget(self._btn_lib_export, 0, 1)
+        ll.addWidget(tr(QLabel(), "prof.lib_conflict"), 1, 0)
+        self.combo_conflict = QComboBox()
+        for policy in bulk.CONFLICT_POLICIES:
+            _add_item(self.combo_conflict, f"prof.conflict_{policy}")
+        ll.addWidget(self.combo_conflict, 1, 1)
+        self._lib_progress = QProgressBar()
+        self._lib_progress.setVisible(False)
+        ll.addWidget(self._lib_progress, 2, 0, 1, 2)
+        self._bulk_task = None
+        lay.addWidget(lg)
+
         # Import from AI
-        ig = QGroupBox(t("prof.import_title"))
+        ig = tr(QGroupBox(), "prof.import_title", setter="setTitle")
         il = QVBoxLayout(ig)
         il.setSpacing(4)
-        import_hint = QLabel(t("prof.import_hint"))
+        import_hint = tr(QLabel(), "prof.import_hint")
         import_hint.setObjectName("sectionHelper")
         import_hint.setWordWrap(True)
         il.addWidget(import_hint)
-        btn_import = QPushButton(t("prof.import_btn"))
+        btn_import = tr(QPushButton(), "prof.import_btn")
         btn_import.setObjectName("accentBtn")
         btn_import.clicked.connect(self._open_import_dialog)
         il.addWidget(btn_import)
+        share_hint = tr(QLabel(), "prof.share_hint")
+        share_hint.setObjectName("sectionHelper")
+        share_hint.setWordWrap(True)
+        il.addWidget(share_hint)
+        btn_share = tr(QPushButton(), "prof.share_btn")
+        btn_share.clicked.connect(self._copy_share_code)
+        il.addWidget(btn_share)
         lay.addWidget(ig)
 
         # Presets
-        pg = QGroupBox(t("prof.presets"))
+        pg = tr(QGroupBox(), "prof.presets", setter="setTitle")
         pl = QVBoxLayout(pg)
         pl.setSpacing(3)
-        hint = QLabel(t("prof.presets_hint"))
+        hint = tr(QLabel(), "prof.presets_hint")
         hint.setObjectName("sectionHelper")
         hint.setWordWrap(True)
         pl.addWidget(hint)
@@ -1557,58 +1879,103 @@ class SettingsPanel(QWidget):
                 SettingsPanel._clear_layout(item.layout())
 
     def _update_theme_buttons(self):
-        _theme_colors = {
-            "midnight": "#0a1432",
-            "purple":   "#1c0828",
-            "ocean":    "#061840",
-            "sakura":   "#28081c",
-        }
         for key, btn in self.theme_buttons.items():
-            active = key == self._theme
-            btn.setObjectName("themeBtnActive" if active else "themeBtn")
-            if not active:
-                btn.setStyleSheet(
-                    f"QPushButton {{ background: {_theme_colors[key]};"
-                    f"border: 1px solid rgba(80,100,180,40); border-radius: 8px;"
-                    f"color: #a0a8c0; font-size: 13px; padding: 6px 10px; }}"
-                    f"QPushButton:hover {{ border-color: #00d4ff; color: #d0d8f0; }}"
-                )
-            else:
-                btn.setStyleSheet(
-                    f"QPushButton {{ background: rgba(0,160,220,30);"
-                    f"border: 2px solid rgba(0,212,255,200); border-radius: 8px;"
-                    f"color: #00d4ff; font-weight: 700; font-size: 13px; padding: 6px 10px; }}"
-                )
+            _set_state(btn, "active", key == self._theme)  # Only the two that flip re-polish
+
+    def _rebuild_monitor_checks(self, removed=None):
+        """One checkbox per connected screen: name, resolution and scale."""
+        self._clear_layout(self._monitor_lay)
+        self.monitor_checks = []
+        screens = [s for s in QApplication.instance().screens() if s is not removed]
+        for i, screen in enumerate(screens):
+            geo = screen.geometry()
+            chk = QCheckBox(
+                f"{i + 1}: {screen.name()}  {geo.width()}x{geo.height()}"
+                f"  @{screen.devicePixelRatio() * 100:.0f}%"
+            )
+            self._monitor_lay.addWidget(chk)
+            self.monitor_checks.append((screen.name(), chk))
+
+    def _checked_monitors(self) -> list:
+        return [name for name, chk in self.monitor_checks if chk.isChecked()]
+
+    def _load_monitor_checks(self):
+        monitors = self.config.get("display.monitors", [])
+        if not monitors and self.monitor_checks:
+            idx = self.config.get("display.monitor", 0)
+            if idx >= len(self.monitor_checks):
+                idx = 0
+            monitors = [self.monitor_checks[idx][0]]
+        for name, chk in self.monitor_checks:
+            chk.setChecked(name in monitors)
+
+    def _on_screens_changed(self, screen=None):
+        if "display" not in self._built:
+            return
+        checked = self._checked_monitors()
+        self._rebuild_monitor_checks(removed=screen if screen not in
+                                     QApplication.instance().screens() else None)
+        for name, chk in self.monitor_checks:
+            chk.setChecked(name in checked)
 
     def _set_theme(self, theme_key):
         self._theme = theme_key
         self.config.set("general.theme", theme_key)
         self.config.save()
         self._load_wallpaper()
-        self._update_theme_buttons()
-        self.update()
+        if "display" in self._built:
+            self._update_theme_buttons()
 
     # ================================================================
     #                      EVENT HANDLERS
     # ================================================================
 
     def _on_lang_changed(self, _=None):
+        """Retranslate in place: bound widgets get new text, nothing is rebuilt."""
         lang = self.combo_lang.currentData()
         set_language(lang)
         self.config.set("general.language", lang)
         self.config.save()
-        self._build_ui()
-        self._load_from_config()
+        if "games" in self._built:
+            self._show_games()
+        if "profiles" in self._built:
+            self.list_profiles.viewport().update()  # Row details are translated in data()
 
     def _on_param_changed(self, _=None):
-        self.lbl_size.setText(str(self.slider_size.value()))
-        self.lbl_thickness.setText(str(self.slider_thickness.value()))
-        self.lbl_gap.setText(str(self.slider_gap.value()))
-        self.lbl_anim_speed.setText(f"{self.slider_anim_speed.value() / 10:.1f}")
-        self.lbl_anim_intensity.setText(f"{self.slider_anim_intensity.value()}%")
-        self.lbl_opacity.setText(f"{self.slider_opacity.value()}%")
-
-        preview_config = {
+        if "animation" in self._built:
+            self.lbl_anim_speed.setText(f"{self.slider_anim_speed.value() / 10:.1f}")
+            self.lbl_anim_intensity.setText(f"{self.slider_anim_intensity.value()}%")
+        if "display" in self._built:
+            self.lbl_opacity.setText(f"{self.slider_opacity.value()}%")
+        if "crosshair" in self._built:
+            self.lbl_size.setText(str(self.slider_size.value()))
+            self.lbl_thickness.setText(str(self.slider_thickness.value()))
+            self.lbl_gap.setText(str(self.slider_gap.value()))
+        if not self._preview_timer.isActive():
+            self._preview_timer.start()  # Coalesce: one update per display frame
+
+    def _flush_params(self):
+        """Once per frame of edits: refresh the preview and, in live mode, the overlay."""
+        self._update_preview()
+        if self.config.get("general.live_apply", False):
+            before = self.config.snapshot
+            self._push_settings()
+            if self.config.snapshot != before:
+                self.config.save()  # Debounced: written once the edits settle
+
+    def _toggle_live_apply(self, live: bool):
+        if live == self.config.get("general.live_apply", False):
+            return
+        self.config.set("general.live_apply", live)
+        self.config.save()
+        if live:
+            self._flush_params()
+
+    def _update_preview(self):
+        """Show the (unapplied) crosshair and animation widgets in the preview."""
+        if "crosshair" not in self._built:
+            return
+        crosshair = {
             "style": self.combo_style.currentData(),
             "size": self.slider_size.value(),
             "thickness": self.slider_thickness.value(),
@@ -1623,7 +1990,14 @@ class SettingsPanel(QWidget):
             "dot_size": self.spin_dot_size.value(),
             "t_style": self.chk_t_style.isChecked(),
         }
-        self.preview.set_config(preview_config)
+        if "animation" in self._built:
+            animation = AnimationSnapshot(
+                enabled=self.chk_anim.isChecked(), type=self.combo_anim.currentData(),
+                speed=self.slider_anim_speed.value() / 10.0,
+                intensity=self.slider_anim_intensity.value() / 100.0)
+        else:
+            animation = self.config.snapshot.animation
+        self.preview.set_setup(snapshot_of(CrosshairSnapshot, crosshair), animation)
 
     def _pick_color(self):
         color = QColorDialog.getColor(
@@ -1635,11 +2009,7 @@ class SettingsPanel(QWidget):
             self._on_param_changed()
 
     def _update_color_button(self):
-        self.btn_color.setStyleSheet(
-            f"QPushButton#colorBtn {{ background-color: {self._color.name()}; "
-            f"border: 2px solid #00d4ff; border-radius: 14px; "
-            f"min-width: 28px; min-height: 28px; }}"
-        )
+        self.btn_color.set_color(self._color)
 
     def _toggle_descriptions(self):
         """Smooth collapsible toggle for effect descriptions."""
@@ -1654,7 +2024,7 @@ class SettingsPanel(QWidget):
             anim.setStartValue(0)
             anim.setEndValue(target_h)
             anim.start(QPropertyAnimation.DeleteWhenStopped)
-            self._desc_toggle.setText(t("anim.hide_desc"))
+            bind(self._desc_toggle.setText, "anim.hide_desc")
             self._desc_expanded = True
         else:
             anim = QPropertyAnimation(self._desc_container, b"maximumHeight", self)
@@ -1663,7 +2033,7 @@ class SettingsPanel(QWidget):
             anim.setStartValue(self._desc_container.height())
             anim.setEndValue(0)
             anim.start(QPropertyAnimation.DeleteWhenStopped)
-            self._desc_toggle.setText(t("anim.show_desc"))
+            bind(self._desc_toggle.setText, "anim.show_desc")
             self._desc_expanded = False
 
     def _toggle_monitor_auto(self, state):
@@ -1686,6 +2056,7 @@ class SettingsPanel(QWidget):
 
     def _refresh_games(self):
         """Scan running processes for known games and update Games tab."""
+        from .games import KNOWN_GAMES
         try:
             import psutil
             game_list = []
@@ -1699,15 +2070,18 @@ class SettingsPanel(QWidget):
             self._detected_games = sorted(set(game_list))
         except ImportError:
             self._detected_games = []
+        self._show_games()
 
+    def _show_games(self):
+        """Games tab content for the last scan (plain t(): rebuilt on language change)."""
+        from .games import GAME_PRESETS, GAME_TIPS
         # Update games label
         if self._detected_games:
             display = "\n".join(f"  {g}" for g in self._detected_games)
             self._games_label.setText(display)
-            self._games_label.setStyleSheet("color: #80e0a0; font-size: 14px; padding: 4px;")
         else:
             self._games_label.setText(t("games.no_games"))
-            self._games_label.setStyleSheet("color: #a0a8c0; font-size: 13px; padding: 4px;")
+        _set_state(self._games_label, "found", bool(self._detected_games))
 
         # Update presets
         self._clear_layout(self._preset_lay)
@@ -1740,7 +2114,7 @@ class SettingsPanel(QWidget):
                 for tip_text in tips:
                     lbl = QLabel(f"  {tip_text}")
                     lbl.setWordWrap(True)
-                    lbl.setStyleSheet("color: #b0b8d0; font-size: 13px; padding: 2px 4px;")
+                    lbl.setObjectName("gameTip")
                     self._tips_lay.addWidget(lbl)
         if not has_tips:
             lbl = QLabel(t("games.no_tips"))
@@ -1750,28 +2124,20 @@ class SettingsPanel(QWidget):
 
     def _apply_game_preset(self, game_name: str):
         """Apply recommended crosshair preset for a specific game."""
+        from .games import GAME_PRESETS
         preset = GAME_PRESETS.get(game_name)
         if not preset:
             return
-        c = self.config
-        c.set("crosshair.style", preset.get("style", "cross"))
-        c.set("crosshair.size", preset.get("size", 20))
-        c.set("crosshair.thickness", preset.get("thickness", 2))
-        c.set("crosshair.gap", preset.get("gap", 4))
-        c.set("crosshair.color", preset.get("color", [0, 255, 0, 255]))
-        c.set("crosshair.dot", preset.get("dot", True))
-        c.set("crosshair.dot_size", preset.get("dot_size", 2))
-        c.set("crosshair.outline", preset.get("outline", True))
-        c.set("crosshair.outline_thickness", preset.get("outline_thickness", 1))
-        c.set("crosshair.t_style", preset.get("t_style", False))
-        c.save()
-        self._load_from_config()
-        self.overlay.refresh_config()
+        self._set_crosshair(preset)
         self.overlay.set_visible(True)
-        self.btn_hide.setText(t("btn.hide"))
+        bind(self.btn_hide.setText, "btn.hide")
 
     def _refresh_monitor(self):
         """Update system resource bars, extra stats, and detected games."""
+        # Last profile switch / apply: input -> crosshair painted
+        latency = self.overlay.last_apply_ms
+        self._latency_lbl.setText(f"{latency:.1f} ms" if latency else "—")
+
         try:
             import psutil
             import time as _time
@@ -1850,6 +2216,7 @@ class SettingsPanel(QWidget):
 
         # GPU via nvidia-smi (utilization + temperature)
         try:
+            import subprocess
             result = subprocess.run(
                 ["nvidia-smi",
                  "--query-gpu=utilization.gpu,temperature.gpu",
@@ -1889,93 +2256,148 @@ class SettingsPanel(QWidget):
     #                    APPLY / RESET / CONFIG
     # ================================================================
 
-    def _apply_settings(self):
+    def _push_settings(self):
+        """Write the widget values to the config in one batch (unchanged keys notify nobody)."""
         c = self.config
-        c.set("crosshair.style", self.combo_style.currentData())
-        c.set("crosshair.size", self.slider_size.value())
-        c.set("crosshair.thickness", self.slider_thickness.value())
-        c.set("crosshair.gap", self.slider_gap.value())
-        c.set("crosshair.color", [self._color.red(), self._color.green(),
-                                   self._color.blue(), self._color.alpha()])
-        c.set("crosshair.outline", self.chk_outline.isChecked())
-        c.set("crosshair.outline_thickness", self.spin_outline.value())
-        c.set("crosshair.dot", self.chk_dot.isChecked())
-        c.set("crosshair.dot_size", self.spin_dot_size.value())
-        c.set("crosshair.t_style", self.chk_t_style.isChecked())
-        c.set("animation.enabled", self.chk_anim.isChecked())
-        c.set("animation.type", self.combo_anim.currentData())
-        c.set("animation.speed", self.slider_anim_speed.value() / 10.0)
-        c.set("animation.intensity", self.slider_anim_intensity.value() / 100.0)
-        c.set("display.monitor", self.spin_monitor.value())
-        c.set("display.offset_x", self.spin_offset_x.value())
-        c.set("display.offset_y", self.spin_offset_y.value())
-        c.set("display.opacity", self.slider_opacity.value() / 100.0)
-        c.set("display.fps", self.spin_fps.value())
-        c.save()
-
-        self.overlay.set_visible(False)
-        self.overlay.refresh_config()
+        built = self._built  # Tabs never opened still show the config: nothing to apply
+        with c.batch():
+            if "crosshair" in built:
+                c.set("crosshair.style", self.combo_style.currentData())
+                c.set("crosshair.size", self.slider_size.value())
+                c.set("crosshair.thickness", self.slider_thickness.value())
+                c.set("crosshair.gap", self.slider_gap.value())
+                c.set("crosshair.color", [self._color.red(), self._color.green(),
+                                           self._color.blue(), self._color.alpha()])
+                c.set("crosshair.outline", self.chk_outline.isChecked())
+                c.set("crosshair.outline_thickness", self.spin_outline.value())
+                c.set("crosshair.dot", self.chk_dot.isChecked())
+                c.set("crosshair.dot_size", self.spin_dot_size.value())
+                c.set("crosshair.t_style", self.chk_t_style.isChecked())
+            if "animation" in built:
+                c.set("animation.enabled", self.chk_anim.isChecked())
+                c.set("animation.type", self.combo_anim.currentData())
+                c.set("animation.speed", self.slider_anim_speed.value() / 10.0)
+                c.set("animation.intensity", self.slider_anim_intensity.value() / 100.0)
+            if "display" in built:
+                monitors = self._checked_monitors()
+                c.set("display.monitors", monitors)
+                if monitors:
+                    names = [name for name, _ in self.monitor_checks]
+                    c.set("display.monitor", names.index(monitors[0]))
+                c.set("display.offset_x", self.spin_offset_x.value())
+                c.set("display.offset_y", self.spin_offset_y.value())
+                c.set("display.opacity", self.slider_opacity.value() / 100.0)
+                c.set("display.fps", self.spin_fps.value())
+
+    def _apply_settings(self):
+        self._push_settings()
+        self.config.save()
+
         self.overlay.set_visible(True)
-        self.btn_hide.setText(t("btn.hide"))
+        bind(self.btn_hide.setText, "btn.hide")
         self.config_changed.emit()
 
     def _reset_defaults(self):
         from .config import DEFAULT_CONFIG
-        for key, section in DEFAULT_CONFIG.items():
-            if isinstance(section, dict):
-                for k, v in section.items():
-                    self.config.set(f"{key}.{k}", v)
+        with self.config.batch():
+            for key, section in DEFAULT_CONFIG.items():
+                if isinstance(section, dict):
+                    for k, v in section.items():
+                        self.config.set(f"{key}.{k}", v)
         self.config.save()
-        self._load_from_config()
-        self.overlay.refresh_config()
+
+    def _undo(self):
+        self.history.undo()
+
+    def _redo(self):
+        self.history.redo()
+
+    def _update_history_buttons(self):
+        self.btn_undo.setEnabled(self.history.can_undo())
+        self.btn_redo.setEnabled(self.history.can_redo())
 
     def _toggle_overlay(self):
         visible = self.overlay.toggle_visibility()
-        self.btn_hide.setText(t("btn.hide") if visible else t("btn.show"))
+        bind(self.btn_hide.setText, "btn.hide" if visible else "btn.show")
 
     def _quit_app(self):
-        self.config.save()
+        self.config.flush()
         self.close_app.emit()
         os._exit(0)
 
-    def _load_from_config(self):
+    def _config_loaders(self) -> dict:
+        """Config key -> callable that shows the key's current value in the UI."""
         c = self.config
+        return {
+            "crosshair.style": lambda: self._select_data(
+                self.combo_style, c.get("crosshair.style", "cross")),
+            "crosshair.size": lambda: self.slider_size.setValue(c.get("crosshair.size", 20)),
+            "crosshair.thickness": lambda: self.slider_thickness.setValue(
+                c.get("crosshair.thickness", 2)),
+            "crosshair.gap": lambda: self.slider_gap.setValue(c.get("crosshair.gap", 4)),
+            "crosshair.color": self._load_color,
+            "crosshair.outline": lambda: self.chk_outline.setChecked(
+                c.get("crosshair.outline", True)),
+            "crosshair.outline_thickness": lambda: self.spin_outline.setValue(
+                c.get("crosshair.outline_thickness", 1)),
+            "crosshair.dot": lambda: self.chk_dot.setChecked(c.get("crosshair.dot", True)),
+            "crosshair.dot_size": lambda: self.spin_dot_size.setValue(
+                c.get("crosshair.dot_size", 2)),
+            "crosshair.t_style": lambda: self.chk_t_style.setChecked(
+                c.get("crosshair.t_style", False)),
+            "animation.enabled": lambda: self.chk_anim.setChecked(
+                c.get("animation.enabled", True)),
+            "animation.type": lambda: self._select_data(
+                self.combo_anim, c.get("animation.type", "none")),
+            "animation.speed": lambda: self.slider_anim_speed.setValue(
+                int(c.get("animation.speed", 1.0) * 10)),
+            "animation.intensity": lambda: self.slider_anim_intensity.setValue(
+                int(c.get("animation.intensity", 0.3) * 100)),
+            "display.monitors": self._load_monitor_checks,
+            "display.monitor": self._load_monitor_checks,
+            "display.offset_x": lambda: self.spin_offset_x.setValue(c.get("display.offset_x", 0)),
+            "display.offset_y": lambda: self.spin_offset_y.setValue(c.get("display.offset_y", 0)),
+            "display.opacity": lambda: self.slider_opacity.setValue(
+                int(c.get("display.opacity", 1.0) * 100)),
+            "display.fps": lambda: self.spin_fps.setValue(c.get("display.fps", 60)),
+            "general.theme": self._load_theme,
+            "general.live_apply": lambda: self.chk_live.setChecked(
+                c.get("general.live_apply", False)),
+        }
 
-        style = c.get("crosshair.style", "cross")
-        idx = self.combo_style.findData(style)
+    @staticmethod
+    def _select_data(combo, data):
+        idx = combo.findData(data)
         if idx >= 0:
-            self.combo_style.setCurrentIndex(idx)
-
-        self.slider_size.setValue(c.get("crosshair.size", 20))
-        self.slider_thickness.setValue(c.get("crosshair.thickness", 2))
-        self.slider_gap.setValue(c.get("crosshair.gap", 4))
+            combo.setCurrentIndex(idx)
 
-        color = c.get("crosshair.color", [0, 255, 0, 255])
+    def _load_color(self):
+        color = self.config.get("crosshair.color", [0, 255, 0, 255])
         self._color = QColor(color[0], color[1], color[2], color[3])
         self._update_color_button()
 
-        self.chk_outline.setChecked(c.get("crosshair.outline", True))
-        self.spin_outline.setValue(c.get("crosshair.outline_thickness", 1))
-        self.chk_dot.setChecked(c.get("crosshair.dot", True))
-        self.spin_dot_size.setValue(c.get("crosshair.dot_size", 2))
-        self.chk_t_style.setChecked(c.get("crosshair.t_style", False))
-
-        self.chk_anim.setChecked(c.get("animation.enabled", True))
-        anim_type = c.get("animation.type", "none")
-        idx = self.combo_anim.findData(anim_type)
-        if idx >= 0:
-            self.combo_anim.setCurrentIndex(idx)
-        self.slider_anim_speed.setValue(int(c.get("animation.speed", 1.0) * 10))
-        self.slider_anim_intensity.setValue(int(c.get("animation.intensity", 0.3) * 100))
-
-        self.spin_monitor.setValue(c.get("display.monitor", 0))
-        self.spin_offset_x.setValue(c.get("display.offset_x", 0))
-        self.spin_offset_y.setValue(c.get("display.offset_y", 0))
-        self.slider_opacity.setValue(int(c.get("display.opacity", 1.0) * 100))
-        self.spin_fps.setValue(c.get("display.fps", 60))
-
-        self._theme = c.get("general.theme", "midnight")
-        self._load_wallpaper()
+    def _load_theme(self):
+        theme = self.config.get("general.theme", "midnight")
+        if theme != self._theme:
+            self._theme = theme
+            self._load_wallpaper()
+
+    def _load_from_config(self, change=None, tab: str = None):
+        """
+        Show config values in the built tabs: all of them, only the keys a
+        ConfigChange touched, or only the keys shown on ``tab``.
+        """
+        loaders = []
+        for key, load in self._config_loaders().items():
+            section = key.split(".")[0]
+            if section in self.TABS and section not in self._built:
+                continue  # Loaded when the tab is built
+            if tab is not None and section != tab:
+                continue
+            if (change is None or change.touches(key)) and load not in loaders:
+                loaders.append(load)
+        for load in loaders:
+            load()
         self._on_param_changed()
 
     # ================================================================
@@ -1983,19 +2405,51 @@ class SettingsPanel(QWidget):
     # ================================================================
 
     def _refresh_profiles(self):
-        self.combo_profile.clear()
-        for name in self.config.list_profiles():
-            self.combo_profile.addItem(name)
-        current = self.config.get("general.current_profile", "default")
-        idx = self.combo_profile.findText(current)
-        if idx >= 0:
-            self.combo_profile.setCurrentIndex(idx)
+        """Re-run the library query for the current filters and keep the selection."""
+        if "profiles" not in self._built:
+            return
+        selected = self._selected_profile() or self.config.get("general.current_profile", "default")
+        size = (self.spin_filter_size_min.value(), self.spin_filter_size_max.value())
+        names = self.config.library.query(
+            self.edit_profile_search.text(),
+            style=self.combo_filter_style.currentData(),
+            color=self.combo_filter_color.currentData(),
+            animation=self.combo_filter_anim.currentData(),
+            size=(min(size), max(size)),
+        )
+        self.profile_model.set_names(names)
+        bind(self.lbl_profile_count.setText, "prof.count",
+             shown=len(names), total=len(self.config.profiles))
+        row = self.profile_model.row_of(selected)
+        if row >= 0:
+            index = self.profile_model.index(row)
+            self.list_profiles.setCurrentIndex(index)
+            self.list_profiles.scrollTo(index)
+
+    def _selected_profile(self) -> str:
+        if "profiles" not in self._built:
+            return ""
+        index = self.list_profiles.currentIndex()
+        return self.profile_model.name_at(index.row()) if index.isValid() else ""
+
+    def _edit_profile_tags(self):
+        name = self._selected_profile()
+        if not name:
+            return
+        profile = self.config.profiles.get(name) or {}
+        text, ok = QInputDialog.getText(self, t("prof.tags"), t("prof.tags_prompt", name=name),
+                                        text=", ".join(profile.get("tags", [])))
+        if ok:
+            self.config.set_profile_tags(name, text)
+            self._refresh_profiles()
+
+    def _rescan_profiles(self):
+        self.config.profiles.rescan()
+        self._refresh_profiles()
 
     def _load_profile(self):
-        name = self.combo_profile.currentText()
+        name = self._selected_profile()
         if name and self.config.load_profile(name):
-            self._load_from_config()
-            self.overlay.refresh_config()
             self.profile_changed.emit(name)
 
     def _save_profile(self):
@@ -2006,7 +2460,7 @@ class SettingsPanel(QWidget):
             self._refresh_profiles()
 
     def _delete_profile(self):
-        name = self.combo_profile.currentText()
+        name = self._selected_profile()
         if name:
             reply = QMessageBox.question(
                 self, t("prof.del_title"),
@@ -2017,10 +2471,52 @@ class SettingsPanel(QWidget):
                 self.config.delete_profile(name)
                 self._refresh_profiles()
 
+    def _start_bulk(self, fn, *args, **kwargs):
+        self._btn_lib_import.setEnabled(False)
+        self._btn_lib_export.setEnabled(False)
+        self._lib_progress.setValue(0)
+        self._lib_progress.setVisible(True)
+        self._bulk_task = BulkTask(fn, *args, parent=self, **kwargs)
+        self._bulk_task.progress.connect(self._on_bulk_progress)
+        self._bulk_task.finished.connect(self._on_bulk_finished)
+        self._bulk_task.start()
+
+    def _import_library(self):
+        from . import bulk
+        path, _ = QFileDialog.getOpenFileName(self, t("prof.lib_import"), "", "Zip (*.zip)")
+        if path:
+            policy = bulk.CONFLICT_POLICIES[self.combo_conflict.currentIndex()]
+            self._start_bulk(bulk.import_profiles, path, self.config.profiles, policy)
+
+    def _export_library(self):
+        from . import bulk
+        path, _ = QFileDialog.getSaveFileName(
+            self, t("prof.lib_export"), "crosshairx-profiles.zip", "Zip (*.zip)")
+        if path:
+            self._start_bulk(bulk.export_profiles, self.config.profiles, path)
+
+    def _on_bulk_progress(self, done: int, total: int):
+        self._lib_progress.setMaximum(max(1, total))
+        self._lib_progress.setValue(done)
+
+    def _on_bulk_finished(self, result):
+        self._bulk_task = None
+        self._btn_lib_import.setEnabled(True)
+        self._btn_lib_export.setEnabled(True)
+        self._lib_progress.setVisible(False)
+        if isinstance(result, Exception):
+            QMessageBox.warning(self, "CrosshairX", f"{t('prof.lib_error')}\n\n{result}")
+            return
+        self._refresh_profiles()
+        text = t("prof.lib_done", written=len(result.written),
+                 skipped=result.skipped, failed=len(result.failed))
+        if result.failed:
+            text += "\n\n" + "\n".join(
+                f"{entry}: {reason}" for entry, reason in result.failed[:10])
+        QMessageBox.information(self, "CrosshairX", text)
+
     def _apply_preset(self, preset_name: str):
         if self.config.load_profile(preset_name):
-            self._load_from_config()
-            self.overlay.refresh_config()
             self.profile_changed.emit(preset_name)
 
     # ================================================================
@@ -2029,6 +2525,10 @@ class SettingsPanel(QWidget):
 
     def showEvent(self, event):
         super().showEvent(event)
+        if self._mon_auto:
+            self._mon_timer.start(5000)  # Paused by hideEvent
+        if self._games_auto:
+            self._games_timer.start(5000)
         if sys.platform == "win32":
             try:
                 hwnd = int(self.winId())
@@ -2079,12 +2579,44 @@ class SettingsPanel(QWidget):
         self.hide()
         self.hide_to_tray.emit()
 
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        # Nobody sees the Monitor/Games tabs while hidden or minimized
+        self._mon_timer.stop()
+        self._games_timer.stop()
+
+    # -- Lifetime --
+
+    def busy(self) -> bool:
+        """True while a bulk import/export still reports back to the panel."""
+        return getattr(self, "_bulk_task", None) is not None
+
+    def dispose(self):
+        """
+        Detach from everything that outlives the panel (config, overlay
+        clock, screens, translations) so it can be deleted. The history
+        is left running for the next panel; the config holds every
+        setting, so a new panel shows the same state.
+        """
+        self._preview_timer.stop()
+        self._mon_timer.stop()
+        self._games_timer.stop()
+        self.config.unsubscribe(self._load_from_config)
+        self.history.on_change = None
+        if "crosshair" in self._built:
+            self.overlay.remove_clock_client(self.preview.update)
+        app = QApplication.instance()
+        app.screenAdded.disconnect(self._on_screens_changed)
+        app.screenRemoved.disconnect(self._on_screens_changed)
+        unbind_widgets([self, *self.findChildren(QObject)])
+
     # ================================================================
     #                       PREMIUM SYSTEM
     # ================================================================
 
     def _get_device_id(self):
         """Generate unique device identifier (hash of machine info)."""
+        import hashlib
         import platform
         try:
             user = os.getlogin()
@@ -2095,6 +2627,7 @@ class SettingsPanel(QWidget):
 
     def _is_premium(self):
         """Check if premium is activated (local verification with hash)."""
+        import hashlib
         if not self.config.get("premium.activated", False):
             return False
         stored_hash = self.config.get("premium.hash", "")
@@ -2104,6 +2637,7 @@ class SettingsPanel(QWidget):
 
     def _activate_premium(self):
         """Activate premium and store verification hash."""
+        import hashlib
         dev_id = self._get_device_id()
         verification = hashlib.sha256(f"CXP-{dev_id}-ACTIVE".encode()).hexdigest()[:16]
         self.config.set("premium.activated", True)
@@ -2113,15 +2647,9 @@ class SettingsPanel(QWidget):
     def _update_premium_status(self):
         """Refresh premium status label in Premium tab."""
         is_prem = self._is_premium()
-        if hasattr(self, '_prem_status_lbl'):
-            self._prem_status_lbl.setText(
-                t("prem.active") if is_prem else t("prem.free")
-            )
-            self._prem_status_lbl.setStyleSheet(
-                "color: #00e070; font-size: 16px; font-weight: bold; padding: 8px;"
-                if is_prem
-                else "color: #a0a8c0; font-size: 16px; font-weight: bold; padding: 8px;"
-            )
+        if "premium" in self._built:
+            bind(self._prem_status_lbl.setText, "prem.active" if is_prem else "prem.free")
+            _set_state(self._prem_status_lbl, "premium", is_prem)
 
     def _try_promo(self):
         """Validate and activate promo code."""
@@ -2142,6 +2670,9 @@ class SettingsPanel(QWidget):
         """Background: call Stripe API to create checkout session."""
         try:
             import base64
+            import urllib.parse
+            import urllib.request
+            import webbrowser
             # Stripe secret key (assembled at runtime)
             _k = base64.b64decode(
                 "c2tfbGl2ZV81MVJOMWlvSnVtRHhrQ3NXNTlvb2RpcnVqMjBQUGR0M1hZZTJwV3dleDg2ZGlx"
@@ -2193,8 +2724,8 @@ class SettingsPanel(QWidget):
         username = self._roblox_input.text().strip()
         if not username:
             return
-        self._roblox_status.setText(t("roblox.searching"))
-        self._roblox_status.setStyleSheet("color: #80a0d0; font-size: 13px;")
+        bind(self._roblox_status.setText, "roblox.searching")
+        _set_state(self._roblox_status, "tone", "info")
         self._clear_layout(self._roblox_results_lay)
         threading.Thread(
             target=self._do_roblox_search, args=(username,), daemon=True
@@ -2203,6 +2734,7 @@ class SettingsPanel(QWidget):
     @staticmethod
     def _ssl_ctx():
         """Create SSL context that works inside PyInstaller bundle."""
+        import ssl
         # Try certifi CA bundle first (bundled by PyInstaller)
         try:
             import certifi
@@ -2218,6 +2750,8 @@ class SettingsPanel(QWidget):
 
     def _do_roblox_search(self, username):
         """Background: query Roblox APIs and post result to main thread."""
+        import urllib.parse
+        import urllib.request
         _hdrs = {
             "Accept": "application/json",
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
@@ -2301,6 +2835,7 @@ class SettingsPanel(QWidget):
     def _show_roblox_result(self, result):
         """Display Roblox user info in the results area."""
         self._clear_layout(self._roblox_results_lay)
+        unbind(self._roblox_status.setText)
         self._roblox_status.setText("")
         lay = self._roblox_results_lay
 
@@ -2311,9 +2846,7 @@ class SettingsPanel(QWidget):
         # Avatar placeholder
         self._roblox_avatar = QLabel()
         self._roblox_avatar.setFixedSize(80, 80)
-        self._roblox_avatar.setStyleSheet(
-            "background: rgba(30,40,80,120); border-radius: 10px;"
-        )
+        self._roblox_avatar.setObjectName("robloxAvatar")
         self._roblox_avatar.setAlignment(Qt.AlignCenter)
         self._roblox_avatar.setText("...")
         card.addWidget(self._roblox_avatar)
@@ -2333,11 +2866,11 @@ class SettingsPanel(QWidget):
         name_lbl = QLabel(
             f"<b>{result['displayName']}</b>  (@{result['name']})"
         )
-        name_lbl.setStyleSheet("color: #e0e8ff; font-size: 14px;")
+        name_lbl.setObjectName("robloxName")
         info.addWidget(name_lbl)
 
         created_lbl = QLabel(f"{t('roblox.created')} {result['created']}")
-        created_lbl.setStyleSheet("color: #8090b0; font-size: 12px;")
+        created_lbl.setObjectName("robloxMeta")
         info.addWidget(created_lbl)
 
         if result.get("description"):
@@ -2346,14 +2879,12 @@ class SettingsPanel(QWidget):
                 bio += "..."
             bio_lbl = QLabel(f"{t('roblox.bio')} {bio}")
             bio_lbl.setWordWrap(True)
-            bio_lbl.setStyleSheet("color: #a0a8c0; font-size: 12px;")
+            bio_lbl.setObjectName("robloxBio")
             info.addWidget(bio_lbl)
 
         if result.get("isBanned"):
             ban_lbl = QLabel(f"\u26d4 {t('roblox.banned')}")
-            ban_lbl.setStyleSheet(
-                "color: #ff5060; font-size: 12px; font-weight: bold;"
-            )
+            ban_lbl.setObjectName("robloxBanned")
             info.addWidget(ban_lbl)
 
         # Presence
@@ -2361,25 +2892,19 @@ class SettingsPanel(QWidget):
         pres_type = pres.get("userPresenceType", 0)
         if pres_type == 0:
             status_text = t("roblox.offline")
-            status_color = "#606880"
         elif pres_type == 1:
             status_text = t("roblox.online")
-            status_color = "#00e070"
         elif pres_type == 2:
             loc = pres.get("lastLocation", "")
             status_text = f"{t('roblox.in_game')} {loc}"
-            status_color = "#00c0ff"
         elif pres_type == 3:
             status_text = t("roblox.in_studio")
-            status_color = "#ffb020"
         else:
             status_text = t("roblox.offline")
-            status_color = "#606880"
 
         st_lbl = QLabel(f"{t('roblox.status')} {status_text}")
-        st_lbl.setStyleSheet(
-            f"color: {status_color}; font-size: 13px; font-weight: bold;"
-        )
+        st_lbl.setObjectName("robloxPresence")
+        st_lbl.setProperty("presence", str(pres_type))
         info.addWidget(st_lbl)
 
         card.addLayout(info, 1)
@@ -2400,16 +2925,17 @@ class SettingsPanel(QWidget):
             lay.addWidget(btn_join)
 
     def _show_roblox_not_found(self):
-        self._roblox_status.setText(t("roblox.not_found"))
-        self._roblox_status.setStyleSheet("color: #ff8060; font-size: 13px;")
+        bind(self._roblox_status.setText, "roblox.not_found")
+        _set_state(self._roblox_status, "tone", "warn")
 
     def _show_roblox_error(self, msg):
-        self._roblox_status.setText(f"{t('roblox.error')}: {msg[:80]}")
-        self._roblox_status.setStyleSheet("color: #ff5060; font-size: 12px;")
+        bind(self._roblox_status.setText, lambda: f"{t('roblox.error')}: {msg[:80]}")
+        _set_state(self._roblox_status, "tone", "error")
 
     def _load_avatar_async(self, url):
         """Download avatar image in background thread."""
         try:
+            import urllib.request
             _ctx = self._ssl_ctx()
             req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
             with urllib.request.urlopen(req, timeout=8, context=_ctx) as resp:
@@ -2430,6 +2956,7 @@ class SettingsPanel(QWidget):
 
     def _join_roblox_game(self, place_id, game_id=""):
         """Open Roblox protocol to join a game."""
+        import webbrowser
         url = f"roblox://experiences/start?placeId={place_id}"
         if game_id:
             url += f"&gameInstanceId={game_id}"
@@ -2439,32 +2966,30 @@ class SettingsPanel(QWidget):
     #                   IMPORT CROSSHAIR FROM AI
     # ================================================================
 
+    def _set_crosshair(self, crosshair: dict, animation: dict = None):
+        """Replace the whole crosshair section (missing/invalid fields -> defaults),
+        and the animation section too if given."""
+        sections = {"crosshair": crosshair}
+        if animation:
+            sections["animation"] = animation
+        with self.config.batch():
+            for section, values in sections.items():
+                clean = normalize_section(section, values, fill=True)
+                for key in SCHEMA[section]:
+                    self.config.set(f"{section}.{key}", clean[key])
+        self.config.save()
+
+    def _copy_share_code(self):
+        QApplication.clipboard().setText(sharecode.encode(self.config.data))
+        btn = self.sender()
+        if btn:
+            btn.setText("OK!")
+            QTimer.singleShot(1500, lambda: bind(btn.setText, "prof.share_btn"))
+
     def _open_import_dialog(self):
         dlg = ImportCrosshairDialog(self)
         if dlg.exec_() == QDialog.Accepted and dlg.result_config:
-            cfg = dlg.result_config
-            valid_styles = self.STYLE_KEYS
-            style = cfg.get("style", "cross")
-            if style not in valid_styles:
-                style = "cross"
-            self.config.set("crosshair.style", style)
-            self.config.set("crosshair.size", max(4, min(100, int(cfg.get("size", 20)))))
-            self.config.set("crosshair.thickness", max(1, min(10, int(cfg.get("thickness", 2)))))
-            self.config.set("crosshair.gap", max(0, min(30, int(cfg.get("gap", 4)))))
-            color = cfg.get("color", [0, 255, 0, 255])
-            if isinstance(color, list) and len(color) >= 3:
-                color = [max(0, min(255, int(c))) for c in color[:4]]
-                if len(color) == 3:
-                    color.append(255)
-                self.config.set("crosshair.color", color)
-            self.config.set("crosshair.dot", bool(cfg.get("dot", True)))
-            self.config.set("crosshair.dot_size", max(1, min(10, int(cfg.get("dot_size", 2)))))
-            self.config.set("crosshair.outline", bool(cfg.get("outline", True)))
-            self.config.set("crosshair.outline_thickness", max(1, min(5, int(cfg.get("outline_thickness", 1)))))
-            self.config.set("crosshair.t_style", bool(cfg.get("t_style", False)))
-            self.config.save()
-            self._load_from_config()
-            self.overlay.refresh_config()
+            self._set_crosshair(dlg.result_config, dlg.result_animation)
             self.overlay.set_visible(True)
-            self.btn_hide.setText(t("btn.hide"))
+            bind(self.btn_hide.setText, "btn.hide")
             QMessageBox.information(self, "CrosshairX", t("prof.import_success"))
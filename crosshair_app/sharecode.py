@@ -0,0 +1,137 @@
+"""
+Share codes for CrosshairX.
+A share code is the whole crosshair + animation setup bit-packed into a
+short, copy-paste friendly string such as ``CX0K9V3...`` (29 characters).
+Values are quantized to the resolution of the settings sliders, so a code
+round-trips exactly whatever the UI can produce.
+
+Layout (version 1, most significant bits first):
+    4 version | crosshair fields | animation fields | 16 CRC-16 of the payload
+encoded as base32 (Crockford alphabet, case-insensitive) behind "CX".
+"""
+
+import binascii
+
+from .schema import ANIM_KEYS, SCHEMA, STYLE_KEYS, normalize_section
+
+
+PREFIX = "CX"
+VERSION = 1
+
+_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+_DECODE = {c: i for i, c in enumerate(_ALPHABET)}
+_DECODE.update({c.lower(): i for c, i in list(_DECODE.items())})
+_DECODE.update({"O": 0, "o": 0, "I": 1, "i": 1, "L": 1, "l": 1})  # Common misreads
+
+
+class ShareCodeError(ValueError):
+    """The text is not a valid share code."""
+
+
+def _int_field(section: str, key: str):
+    """(bits, to_int, from_int) for an integer slider: stored as value - lo."""
+    field = SCHEMA[section][key]
+    lo, hi = int(field.lo), int(field.hi)
+    return ((hi - lo).bit_length(), lambda v: v - lo, lambda n: n + lo)
+
+
+def _scaled_field(section: str, key: str, scale: int):
+    """Float slider with ``scale`` steps per unit (speed 0.1, intensity 1%)."""
+    field = SCHEMA[section][key]
+    lo, hi = round(field.lo * scale), round(field.hi * scale)
+    return ((hi - lo).bit_length(),
+            lambda v: round(v * scale) - lo,
+            lambda n: (n + lo) / scale)
+
+
+def _choice_field(choices):
+    return ((len(choices) - 1).bit_length(), choices.index, lambda n: choices[n])
+
+
+_BOOL = (1, int, bool)
+_COLOR = (32,
+          lambda c: (c[0] << 24) | (c[1] << 16) | (c[2] << 8) | c[3],
+          lambda n: [(n >> 24) & 255, (n >> 16) & 255, (n >> 8) & 255, n & 255])
+
+# Field order is the wire format: append only, bump VERSION on any other change
+_FIELDS = (
+    ("crosshair", "style", _choice_field(STYLE_KEYS)),
+    ("crosshair", "size", _int_field("crosshair", "size")),
+    ("crosshair", "thickness", _int_field("crosshair", "thickness")),
+    ("crosshair", "gap", _int_field("crosshair", "gap")),
+    ("crosshair", "color", _COLOR),
+    ("crosshair", "outline", _BOOL),
+    ("crosshair", "outline_color", _COLOR),
+    ("crosshair", "outline_thickness", _int_field("crosshair", "outline_thickness")),
+    ("crosshair", "dot", _BOOL),
+    ("crosshair", "dot_size", _int_field("crosshair", "dot_size")),
+    ("crosshair", "t_style", _BOOL),
+    ("animation", "enabled", _BOOL),
+    ("animation", "type", _choice_field(ANIM_KEYS)),
+    ("animation", "speed", _scaled_field("animation", "speed", 10)),
+    ("animation", "intensity", _scaled_field("animation", "intensity", 100)),
+)
+
+_VERSION_BITS = 4
+_CRC_BITS = 16
+_PAYLOAD_BITS = _VERSION_BITS + sum(bits for _, _, (bits, _, _) in _FIELDS)
+_CHARS = -(-(_PAYLOAD_BITS + _CRC_BITS) // 5)  # 5 bits per base32 character
+_PAYLOAD_BYTES = -(-_PAYLOAD_BITS // 8)
+
+
+def encode(setup: dict) -> str:
+    """Share code for a config/profile dict with ``crosshair`` and ``animation`` sections."""
+    sections = {section: normalize_section(section, setup.get(section) or {}, fill=True)
+                for section in ("crosshair", "animation")}
+    payload = VERSION
+    for section, key, (bits, to_int, _) in _FIELDS:
+        payload = (payload << bits) | to_int(sections[section][key])
+    crc = binascii.crc_hqx(payload.to_bytes(_PAYLOAD_BYTES, "big"), 0)
+    value = (payload << _CRC_BITS) | crc
+
+    chars = []
+    for _ in range(_CHARS):
+        chars.append(_ALPHABET[value & 31])
+        value >>= 5
+    return PREFIX + "".join(reversed(chars))
+
+
+def decode(code: str) -> dict:
+    """``{"crosshair": {...}, "animation": {...}}`` from a share code (complete sections)."""
+    text = "".join(code.split()).replace("-", "")
+    if text[:len(PREFIX)].upper() != PREFIX:
+        raise ShareCodeError(f"a share code starts with {PREFIX}")
+    text = text[len(PREFIX):]
+    if len(text) != _CHARS:
+        raise ShareCodeError(f"a share code has {len(PREFIX) + _CHARS} characters")
+    value = 0
+    try:
+        for c in text:
+            value = (value << 5) | _DECODE[c]
+    except KeyError as e:
+        raise ShareCodeError(f"invalid character {e.args[0]!r}") from None
+
+    payload, crc = value >> _CRC_BITS, value & 0xFFFF
+    if payload >> _PAYLOAD_BITS or binascii.crc_hqx(payload.to_bytes(_PAYLOAD_BYTES, "big"), 0) != crc:
+        raise ShareCodeError("checksum mismatch (typo in the code?)")
+
+    numbers = []
+    for _, _, (bits, _, _) in reversed(_FIELDS):
+        numbers.append(payload & ((1 << bits) - 1))
+        payload >>= bits
+    if payload != VERSION:
+        raise ShareCodeError(f"unsupported share code version {payload}")
+
+    result = {"crosshair": {}, "animation": {}}
+    for (section, key, (_, _, from_int)), n in zip(_FIELDS, reversed(numbers)):
+        try:
+            result[section][key] = from_int(n)
+        except IndexError:
+            raise ShareCodeError(f"unknown {key} #{n} (code from a newer version?)") from None
+    return {section: normalize_section(section, values) for section, values in result.items()}
+
+
+def is_share_code(text: str) -> bool:
+    """Cheap check to route pasted text: share code vs JSON."""
+    text = text.strip()
+    return text[:len(PREFIX)].upper() == PREFIX and not text.startswith("{")
@@ -0,0 +1,38 @@
+"""
+Startup phase timing for CrosshairX.
+main imports this module before anything heavy, so its clock starts
+with the app's own imports. Each phase is the time since the previous
+mark; ``--profile-startup`` prints them once the first event loop pass
+(first paint) is done.
+"""
+
+import time
+
+_start = time.perf_counter()
+_last = _start
+_phases: list[tuple[str, float]] = []   # (phase, seconds)
+
+
+def mark(phase: str):
+    """End ``phase`` now (it started at the previous mark)."""
+    global _last
+    now = time.perf_counter()
+    _phases.append((phase, now - _last))
+    _last = now
+
+
+def phases() -> list[tuple[str, float]]:
+    """Recorded (phase, seconds) pairs, in order."""
+    return list(_phases)
+
+
+def total() -> float:
+    """Seconds from this module's import to the last mark."""
+    return _last - _start
+
+
+def report() -> str:
+    """Phase table in milliseconds, e.g. for --profile-startup."""
+    lines = [f"[Startup] {phase:<16s} {seconds * 1000:7.1f} ms" for phase, seconds in _phases]
+    lines.append(f"[Startup] {'total':<16s} {total() * 1000:7.1f} ms")
+    return "\n".join(lines)
@@ -0,0 +1,937 @@
+"""
+Micro-benchmarks for CrosshairX hot paths.
+Runs headless (Qt offscreen platform), no window is shown.
+Run: python scripts/bench.py            — all benchmarks
+     python scripts/bench.py render     — only the named ones
+"""
+
+import itertools
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+os.environ["APPDATA"] = tempfile.mkdtemp(prefix="cx-bench-")  # Never touch the real config
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+BENCHES = {}
+
+
+def bench(fn):
+    """Register a benchmark under its name without the ``bench_`` prefix."""
+    BENCHES[fn.__name__[len("bench_"):]] = fn
+    return fn
+
+
+def timeit(fn, number: int = 2000, repeat: int = 5) -> float:
+    """Best-of-``repeat`` time per call, in microseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min(best, time.perf_counter() - start)
+    return best / number * 1e6
+
+
+_APP = None
+
+
+def qapp():
+    global _APP
+    from PyQt5.QtWidgets import QApplication
+    _APP = QApplication.instance() or QApplication([])  # Keep it alive between benches
+    return _APP
+
+
+def fresh_appdata(profiles: int = 0) -> dict:
+    """Environment for a child process with its own APPDATA (not the one earlier benches filled)."""
+    import json
+    app_data = tempfile.mkdtemp(prefix="cx-bench-")
+    profiles_dir = os.path.join(app_data, "CrosshairX", "profiles")
+    os.makedirs(profiles_dir)
+    for i in range(profiles):
+        with open(os.path.join(profiles_dir, f"lib{i:05d}.json"), "w", encoding="utf-8") as f:
+            json.dump({"name": f"lib{i:05d}", "crosshair": {"size": 10 + i % 40}}, f)
+    return dict(os.environ, APPDATA=app_data)
+
+
+# ===================== BENCHMARKS =====================
+
+@bench
+def bench_render():
+    """Per-frame cost of drawing a crosshair: pixel-snapped vs antialiased."""
+    qapp()
+    from PyQt5.QtCore import Qt
+    from PyQt5.QtGui import QImage, QPainter
+    from crosshair_app.crosshair import CrosshairRenderer, SNAP_MIN_SIZE
+
+    image = QImage(200, 200, QImage.Format_ARGB32_Premultiplied)
+    image.fill(Qt.transparent)
+    cases = {
+        "cross t1 s12": {"style": "cross", "size": 12, "thickness": 1, "gap": 3,
+                         "outline": True, "dot": False},
+        "cross t2 s16": {"style": "cross", "size": 16, "thickness": 2, "gap": 4,
+                         "outline": True, "dot": False},
+        "cross t1 s64": {"style": "cross", "size": 64, "thickness": 1, "gap": 4,
+                         "outline": True, "dot": False},
+        "cross t2 s64": {"style": "cross", "size": 64, "thickness": 2, "gap": 4,
+                         "outline": True, "dot": False},
+        "cross t4 s80": {"style": "cross", "size": 80, "thickness": 4, "gap": 6,
+                         "outline": True, "dot": False},
+    }
+    for label, config in cases.items():
+        config = CrosshairRenderer.snapshot(config)
+        results = []
+        for snap in (True, False):
+            renderer = CrosshairRenderer(pixel_snap=snap)
+            painter = QPainter(image)
+            painter.setRenderHint(QPainter.Antialiasing, True)
+            results.append(timeit(lambda: renderer.draw(painter, 100, 100, config)))
+            painter.end()
+        note = "" if config.size >= SNAP_MIN_SIZE else "   (below SNAP_MIN_SIZE: both antialiased)"
+        print(f"  {label:<14} snapped {results[0]:7.1f} us   "
+              f"antialiased {results[1]:7.1f} us   ({results[1] / results[0]:.2f}x){note}")
+
+
+@bench
+def bench_outline():
+    """Cost of an outlined crosshair vs the same crosshair without outline."""
+    qapp()
+    from PyQt5.QtCore import Qt
+    from PyQt5.QtGui import QImage, QPainter
+    from crosshair_app.crosshair import CrosshairRenderer, SNAP_MIN_SIZE
+
+    image = QImage(200, 200, QImage.Format_ARGB32_Premultiplied)
+    image.fill(Qt.transparent)
+    renderer = CrosshairRenderer(pixel_snap=False)
+    for style in ("cross", "dot", "circle", "arrows"):
+        results = []
+        for outline in (False, True):
+            config = CrosshairRenderer.snapshot({
+                "style": style, "size": 24, "thickness": 2, "gap": 4,
+                "outline": outline, "outline_thickness": 1, "dot": True})
+            painter = QPainter(image)
+            results.append(timeit(lambda: renderer.draw(painter, 100, 100, config)))
+            painter.end()
+        print(f"  {style:<8} plain {results[0]:7.1f} us   "
+              f"outlined {results[1]:7.1f} us   ({results[1] / results[0]:.2f}x)")
+
+
+@bench
+def bench_config_access():
+    """Per-frame config reads: dict lookups (old overlay/renderer) vs snapshot."""
+    from crosshair_app.config import Config
+    config = Config()
+    keys = ("style", "size", "thickness", "gap", "color", "outline", "outline_color",
+            "outline_thickness", "dot", "dot_size", "t_style")
+
+    def dict_access():
+        dict(config.data.get("animation", {}))
+        config.get("display.opacity", 1.0)
+        crosshair = config.data.get("crosshair", {})
+        for key in keys:
+            crosshair.get(key)
+
+    def snapshot_access():
+        snapshot = config.snapshot
+        snapshot.animation
+        snapshot.display.opacity
+        c = snapshot.crosshair
+        (c.style, c.size, c.thickness, c.gap, c.color, c.outline, c.outline_color,
+         c.outline_thickness, c.dot, c.dot_size, c.t_style)
+
+    old = timeit(dict_access, number=20000)
+    new = timeit(snapshot_access, number=20000)
+    sizes = itertools.cycle((21, 22))  # A repeated value is a no-op set: alternate
+    rebuild = timeit(lambda: (config.set("crosshair.size", next(sizes)), config.snapshot),
+                     number=2000)
+    print(f"  dict lookups {old:6.2f} us   snapshot {new:6.2f} us   ({old / new:.1f}x)")
+    print(f"  set() + snapshot rebuild {rebuild:6.2f} us (once per change, not per frame)")
+
+
+@bench
+def bench_normalize():
+    """Schema normalization: whole config (load) and a single clean value (set)."""
+    import copy
+    from crosshair_app.config import DEFAULT_CONFIG
+    from crosshair_app.schema import normalize, normalize_config
+    data = copy.deepcopy(DEFAULT_CONFIG)
+    full = timeit(lambda: normalize_config(data), number=5000)
+    one = timeit(lambda: normalize("crosshair.size", 20), number=50000)
+    color = timeit(lambda: normalize("crosshair.color", [0, 255, 0, 255]), number=50000)
+    print(f"  full config {full:6.2f} us   size {one:5.2f} us   color {color:5.2f} us")
+
+
+@bench
+def bench_save():
+    """Caller-side cost of Config.save(): synchronous write vs debounced writer."""
+    import json
+    from crosshair_app.config import Config, CONFIG_FILE
+    config = Config()
+
+    def sync_save():
+        with open(CONFIG_FILE, "w", encoding="utf-8") as f:
+            json.dump(config.data, f, indent=2, ensure_ascii=False)
+
+    old = timeit(sync_save, number=200)
+    new = timeit(config.save, number=200)
+    config.flush()
+    print(f"  synchronous {old:8.1f} us   debounced {new:6.1f} us   ({old / new:.0f}x)")
+
+
+@bench
+def bench_profile_switch():
+    """F7 cost vs library size: glob + parse per press (old) vs in-memory index."""
+    import json
+    from crosshair_app.config import Config, PROFILES_DIR
+    config = Config()
+    config.save = lambda: None  # Measure the switch, not the debounced writer
+    created = 0
+    for count in (10, 1000, 5000):
+        for i in range(created, count):
+            profile = {"name": f"p{i:05d}", "crosshair": {"size": 10 + i % 40, "gap": i % 8},
+                       "animation": {"type": "none"}}
+            with open(PROFILES_DIR / f"p{i:05d}.json", "w", encoding="utf-8") as f:
+                json.dump(profile, f)
+        created = count
+        config.profiles.rescan()
+
+        def glob_switch():
+            names = sorted(p.stem for p in PROFILES_DIR.glob("*.json"))
+            current = config.get("general.current_profile", "default")
+            name = names[(names.index(current) + 1) % len(names)] if current in names else names[0]
+            with open(PROFILES_DIR / f"{name}.json", "r", encoding="utf-8") as f:
+                json.load(f)
+            config.set("general.current_profile", name)
+
+        number = 20 if count > 100 else 500
+        old = timeit(glob_switch, number=number, repeat=3)
+        for _ in range(len(config.profiles)):
+            config.next_profile()  # Warm the parsed-profile cache once around the ring
+        new = timeit(config.next_profile, number=2000)
+        print(f"  {len(config.profiles):5d} profiles   glob+parse {old:9.1f} us   "
+              f"index {new:6.1f} us   ({old / new:.0f}x)")
+
+
+@bench
+def bench_hotkey_switch():
+    """F7 until the new sprite is ready: cold caches vs neighbors prefetched."""
+    qapp()
+    from crosshair_app.config import Config
+    from crosshair_app.overlay import OverlayManager
+    from crosshair_app.prefetch import ProfilePrefetcher
+    config = Config()
+    config.save = lambda: None
+    overlay = OverlayManager(config)
+    prefetcher = ProfilePrefetcher(config, overlay)
+    dpr = max(overlay.active_dprs())
+
+    def switch() -> float:
+        start = time.perf_counter()
+        config.next_profile()
+        overlay.sprites.sprite(config.snapshot.crosshair, dpr)
+        return (time.perf_counter() - start) * 1e6
+
+    rounds = 3 * len(config.profiles)
+    cold = []
+    for _ in range(rounds):
+        overlay.sprites.clear()
+        config.profiles.rescan()
+        config.profiles._parsed.clear()
+        cold.append(switch())
+    warm = []
+    for _ in range(rounds):
+        prefetcher.warm_now()
+        warm.append(switch())
+    cold.sort()
+    warm.sort()
+    # The single worst press is dominated by scheduler noise (a fixed 200 us pure-Python
+    # loop shows multi-ms maxima over as many runs here); p99 is the tail to track
+    for label, at in (("median", len(cold) // 2), ("p99", len(cold) * 99 // 100), ("worst", -1)):
+        print(f"  {label:6s}  cold {cold[at]:7.1f} us   prefetched {warm[at]:7.1f} us")
+    overlay.shutdown()
+
+
+@bench
+def bench_pack_load():
+    """Opening a profile library and reading 50 profiles: directory vs mmap pack."""
+    import json
+    import shutil
+    from crosshair_app.packs import ProfilePack, export_pack
+    from crosshair_app.profiles import ProfileIndex
+    root = tempfile.mkdtemp(prefix="cx-pack-")
+    loose = os.path.join(root, "loose")
+    os.mkdir(loose)
+    for i in range(500):
+        profile = {"name": f"p{i:04d}", "crosshair": {"size": 10 + i % 40, "gap": i % 8},
+                   "animation": {"type": "none"}}
+        with open(os.path.join(loose, f"p{i:04d}.json"), "w", encoding="utf-8") as f:
+            json.dump(profile, f, indent=2)
+    pack_path = os.path.join(root, "library.cxpack")
+    export_pack(loose, pack_path)
+    picks = [f"p{i:04d}" for i in range(0, 500, 10)]
+
+    def from_directory():
+        index = ProfileIndex(loose)
+        for name in picks:
+            index.get(name)
+
+    def from_pack():
+        with ProfilePack(pack_path) as pack:
+            for name in picks:
+                pack.get(name)
+
+    old = timeit(from_directory, number=20, repeat=3)
+    new = timeit(from_pack, number=20, repeat=3)
+    print(f"  500 profiles   directory {old / 1000:7.2f} ms   pack {new / 1000:6.2f} ms   "
+          f"({old / new:.1f}x)")
+    shutil.rmtree(root, ignore_errors=True)
+
+
+@bench
+def bench_sharecode():
+    """Share codes: encode/decode vs JSON dumps/loads + normalize; round-trip check."""
+    import json
+    import random
+    from crosshair_app.config import PRESET_PROFILES
+    from crosshair_app.schema import ANIM_KEYS, STYLE_KEYS, normalize_section
+    from crosshair_app import sharecode
+
+    rng = random.Random(1)
+    setups = [dict(p) for p in PRESET_PROFILES.values()]
+    for _ in range(2000):  # Every value the UI can produce
+        setups.append({
+            "crosshair": {
+                "style": rng.choice(STYLE_KEYS), "size": rng.randint(4, 100),
+                "thickness": rng.randint(1, 10), "gap": rng.randint(0, 30),
+                "color": [rng.randint(0, 255) for _ in range(4)],
+                "outline": rng.random() < 0.5,
+                "outline_color": [rng.randint(0, 255) for _ in range(4)],
+                "outline_thickness": rng.randint(1, 5), "dot": rng.random() < 0.5,
+                "dot_size": rng.randint(0, 10), "t_style": rng.random() < 0.5},
+            "animation": {
+                "enabled": rng.random() < 0.5, "type": rng.choice(ANIM_KEYS),
+                "speed": rng.randint(1, 50) / 10, "intensity": rng.randint(0, 100) / 100},
+        })
+    for setup in setups:
+        expected = {s: normalize_section(s, setup[s], fill=True) for s in ("crosshair", "animation")}
+        code = sharecode.encode(setup)
+        assert sharecode.decode(code) == expected, code
+        assert json.loads(json.dumps(expected)) == expected
+    lengths = {len(sharecode.encode(setup)) for setup in setups}
+
+    setup = setups[-1]
+    code = sharecode.encode(setup)
+    text = json.dumps(setup)
+
+    def json_decode():
+        data = json.loads(text)
+        {s: normalize_section(s, data[s], fill=True) for s in ("crosshair", "animation")}
+
+    enc = timeit(lambda: sharecode.encode(setup), number=20000)
+    dec = timeit(lambda: sharecode.decode(code), number=20000)
+    jenc = timeit(lambda: json.dumps(setup), number=20000)
+    jdec = timeit(json_decode, number=20000)
+    print(f"  {len(setups)} setups round-trip OK, code length {sorted(lengths)} "
+          f"vs JSON {len(text)} chars")
+    print(f"  encode {enc:5.1f} us   decode {dec:5.1f} us   "
+          f"(JSON dumps {jenc:5.1f} us, loads+normalize {jdec:5.1f} us)")
+
+
+@bench
+def bench_bulk_import():
+    """Importing a 10,000-profile zip on a worker thread while the GUI thread ticks."""
+    import json
+    import shutil
+    import threading
+    import zipfile
+    from crosshair_app import bulk
+    from crosshair_app.profiles import ProfileIndex
+    root = tempfile.mkdtemp(prefix="cx-bulk-")
+    archive = os.path.join(root, "library.zip")
+    with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zf:
+        for i in range(10000):
+            zf.writestr(f"library/p{i:05d}.json", json.dumps(
+                {"name": f"p{i:05d}", "crosshair": {"size": 10 + i % 40, "gap": i % 8},
+                 "animation": {"type": "none"}}))
+    target = os.path.join(root, "profiles")
+    os.mkdir(target)
+    index = ProfileIndex(target)
+
+    # The GUI thread keeps a 60 Hz tick; record how late each tick runs during the import
+    result = []
+    worker = threading.Thread(target=lambda: result.append(bulk.import_profiles(archive, index)))
+    start = time.perf_counter()
+    worker.start()
+    late, tick = [], time.perf_counter()
+    while worker.is_alive():
+        time.sleep(1 / 60)
+        now = time.perf_counter()
+        late.append((now - tick - 1 / 60) * 1000)
+        tick = now
+    elapsed = time.perf_counter() - start
+    late.sort()
+    print(f"  {len(result[0].written)} profiles in {elapsed:5.2f} s "
+          f"({len(result[0].written) / elapsed:6.0f}/s), index {len(index)} entries")
+    print(f"  GUI tick lateness: median {late[len(late) // 2]:5.2f} ms   worst {late[-1]:5.2f} ms")
+    shutil.rmtree(root, ignore_errors=True)
+
+
+@bench
+def bench_library_query():
+    """Profile library over 50,000 profiles: index build and filtered queries."""
+    import json
+    import random
+    import shutil
+    from crosshair_app.library import ProfileLibrary
+    from crosshair_app.profiles import ProfileIndex
+    from crosshair_app.schema import ANIM_KEYS, STYLE_KEYS
+    root = tempfile.mkdtemp(prefix="cx-library-")
+    directory = os.path.join(root, "profiles")
+    os.mkdir(directory)
+    rng = random.Random(1)
+    for i in range(50000):
+        profile = {"crosshair": {"style": rng.choice(STYLE_KEYS), "size": rng.randint(4, 100),
+                                 "color": [rng.randint(0, 255) for _ in range(3)] + [255]},
+                   "animation": {"type": rng.choice(ANIM_KEYS)}}
+        if i % 10 == 0:
+            profile["tags"] = ["sniper"]
+        with open(os.path.join(directory, f"p{i:05d}.json"), "w", encoding="utf-8") as f:
+            json.dump(profile, f)
+    index = ProfileIndex(directory)
+    cache = os.path.join(root, "library.json")
+
+    start = time.perf_counter()
+    library = ProfileLibrary(index, cache)
+    cold = time.perf_counter() - start
+    library.flush()
+    start = time.perf_counter()
+    library = ProfileLibrary(index, cache)
+    warm = time.perf_counter() - start
+    print(f"  build: cold (parse all) {cold:5.2f} s   from attribute cache {warm:5.2f} s")
+
+    queries = {
+        "style": {"style": "cross"},
+        "style+color": {"style": "cross", "color": "red"},
+        "size+animation": {"size": (20, 30), "animation": "pulse"},
+        "#tag": {"text": "#sniper"},
+        "name text": {"text": "p0123"},
+        "everything": {},
+    }
+    for label, query in queries.items():
+        us = timeit(lambda: library.query(**query), number=20, repeat=3)
+        print(f"  {label:<15} {len(library.query(**query)):6d} hits  {us / 1000:6.2f} ms")
+    shutil.rmtree(root, ignore_errors=True)
+
+
+def deep_size(roots) -> int:
+    """Bytes held by ``roots``, counting objects shared between them once."""
+    seen, total, stack = set(), 0, list(roots)
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, (tuple, list)):
+            stack.extend(obj)
+        elif isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+    return total
+
+
+@bench
+def bench_history():
+    """Undo history: memory for 5000 edits (shared snapshots vs deep copies), undo cost."""
+    import copy
+    from crosshair_app.config import Config
+    from crosshair_app.history import EditHistory
+    config = Config()
+    config.save = lambda: None
+    history = EditHistory(config)
+    history.MERGE_WINDOW = 0  # Every edit is its own step
+    keys = ("crosshair.size", "crosshair.gap", "animation.speed", "display.offset_x")
+    values = (lambda i: 4 + i % 90, lambda i: i % 30, lambda i: 0.1 + (i % 40) / 10,
+              lambda i: i % 400 - 200)
+
+    copies = []
+    for i in range(5000):
+        config.set(keys[i % 4], values[i % 4](i))
+        copies.append({s: copy.deepcopy(config.data[s]) for s in EditHistory.SECTIONS})
+    shared = deep_size(history._states)
+    deep = deep_size(copies)
+    del copies
+
+    undo = timeit(lambda: (history.undo(), history.redo()), number=500) / 2
+    print(f"  {len(history)} steps   snapshots {shared / 1024:5.0f} KiB "
+          f"({shared / len(history):3.0f} B/step)   deep copies {deep / 1024:5.0f} KiB "
+          f"({deep / shared:.0f}x)")
+    print(f"  undo/redo step {undo:6.1f} us")
+
+
+_STARTUP_CHILD = """
+import os, sys, time
+start = time.perf_counter()
+from crosshair_app.main import CrosshairXApp
+mode = sys.argv[1]
+app = CrosshairXApp(start_minimized=mode == "tray")
+if mode == "eager":  # Every tab built up front, as before lazy tabs
+    for i in range(app.settings.tabs.count()):
+        app.settings._ensure_tab(i)
+app.app.processEvents()
+elapsed = time.perf_counter() - start
+import psutil
+widgets = len(app.app.allWidgets())
+print(elapsed, psutil.Process().memory_info().rss, widgets)
+os._exit(0)
+"""
+
+
+@bench
+def bench_startup():
+    """App start to first event loop pass: tray only, panel (lazy tabs), panel with every tab."""
+    import subprocess
+    for mode in ("tray", "panel", "eager"):
+        runs = []
+        for _ in range(3):  # Fresh interpreter each time: imports are part of startup
+            out = subprocess.run([sys.executable, "-c", _STARTUP_CHILD, mode], cwd=ROOT,
+                                 capture_output=True, text=True, env=fresh_appdata()).stdout
+            elapsed, rss, widgets = out.split()[-3:]
+            runs.append((float(elapsed), int(rss), int(widgets)))
+        elapsed, rss, widgets = min(runs)
+        print(f"  {mode:6s} {elapsed * 1000:6.0f} ms   RSS {rss / 2 ** 20:5.1f} MiB   "
+              f"{widgets:4d} widgets")
+
+
+# Per-release cold-start budgets (ms), about twice what a mid-range machine takes.
+# case -> (extra command-line flags, profiles in the library, budgets per phase)
+STARTUP_CASES = {
+    "tray": (["--tray"], 0,
+             {"imports": 150, "qapplication": 40, "config": 25, "overlay": 40, "tray": 25,
+              "first paint": 20, "total": 250}),
+    "panel": ([], 0,
+              {"imports": 150, "qapplication": 40, "config": 25, "overlay": 40, "tray": 25,
+               "panel": 200, "first paint": 80, "total": 450}),
+    "tray, 5000 profiles": (["--tray"], 5000,
+                            {"imports": 150, "qapplication": 40, "config": 60, "overlay": 40,
+                             "tray": 25, "first paint": 20, "total": 300}),
+}
+# Only the settings panel, its tabs or CLI commands need these; a tray start must not import them
+LAZY_MODULES = ("crosshair_app.settings", "crosshair_app.games", "crosshair_app.bulk",
+                "crosshair_app.library", "urllib.request", "ssl", "hashlib", "webbrowser",
+                "zipfile", "subprocess")
+
+_LAZY_CHILD = """
+import os, sys
+from crosshair_app.main import CrosshairXApp
+app = CrosshairXApp(start_minimized=True)
+app.app.processEvents()
+print(" ".join(m for m in sys.argv[1:] if m in sys.modules) or "-")
+os._exit(0)
+"""
+
+
+@bench
+def bench_startup_budget():
+    """--profile-startup phases (best of 5) against STARTUP_CASES; lazy imports on a tray start."""
+    import subprocess
+    ok = True
+    for case, (flags, profiles, budgets) in STARTUP_CASES.items():
+        env = fresh_appdata(profiles)
+        best = {}
+        for _ in range(5):
+            out = subprocess.run([sys.executable, "-m", "crosshair_app", "--profile-startup", *flags],
+                                 cwd=ROOT, capture_output=True, text=True, env=env).stdout
+            for line in out.splitlines():
+                if line.startswith("[Startup] "):
+                    phase, ms = line[len("[Startup] "):].rsplit(None, 2)[:2]
+                    best[phase.strip()] = min(best.get(phase.strip(), float("inf")), float(ms))
+        print(f"  {case}:")
+        for phase, budget in budgets.items():
+            ms = best.get(phase)
+            over = ms is None or ms > budget
+            ok &= not over
+            shown = "missing" if ms is None else f"{ms:6.1f} ms"
+            print(f"    {phase:14s} {shown:>10s} / {budget:4d} ms{'   [!] over budget' if over else ''}")
+    out = subprocess.run([sys.executable, "-c", _LAZY_CHILD, *LAZY_MODULES], cwd=ROOT,
+                         capture_output=True, text=True, env=fresh_appdata()).stdout
+    eager = [m for m in out.splitlines()[-1].split() if m != "-"]
+    ok &= not eager
+    print(f"  tray start imports: {', '.join(eager) if eager else 'none of the lazy modules'}"
+          f"{'   [!] should be lazy' if eager else ''}")
+    return ok
+
+
+_TRIM_CHILD = """
+import os, sys, time
+from PyQt5.QtCore import QTimer
+from crosshair_app.main import CrosshairXApp, process_rss_mib, release_free_memory
+app = CrosshairXApp(start_minimized=True)
+qt = app.app
+marks = []
+
+def mark():
+    release_free_memory()
+    marks.append(process_rss_mib())
+
+def steps():
+    yield mark()                                  # Tray only
+    app._show_settings()
+    for i in range(app.settings.tabs.count()):  # Every tab opened once
+        app.settings.tabs.setCurrentIndex(i)
+        yield
+    yield mark()                                  # Panel open
+    app.settings.close()
+    yield mark()                                  # Hidden to tray (old behavior: kept)
+    app._trim_settings()
+    for _ in range(120):                          # ~1.2 s: deferred deletes, release report
+        yield time.sleep(0.01)
+    marks.append(process_rss_mib())               # Trimmed (after _settings_released)
+    start = time.perf_counter()
+    app._show_settings()
+    qt.processEvents()
+    marks.append((time.perf_counter() - start) * 1000)
+    print(*marks)
+    os._exit(0)
+
+it = steps()
+timer = QTimer()
+timer.timeout.connect(lambda: next(it))
+timer.start(0)
+qt.exec_()
+"""
+
+
+@bench
+def bench_trim():
+    """RSS while gaming with the panel hidden: kept alive (old) vs released after trim_after; reopen cost."""
+    import subprocess
+    out = subprocess.run([sys.executable, "-c", _TRIM_CHILD], cwd=ROOT,
+                         capture_output=True, text=True, env=fresh_appdata()).stdout
+    tray, shown, hidden, trimmed, reopen = map(float, out.split()[-5:])
+    print(f"  RSS: tray only {tray:5.1f} MiB   panel open {shown:5.1f} MiB")
+    print(f"       hidden, kept {hidden:5.1f} MiB   hidden, released {trimmed:5.1f} MiB")
+    print(f"  reopen after release: {reopen:5.0f} ms (lazy tabs, undo history kept)")
+
+@bench
+def bench_wallpaper():
+    """Theme wallpaper: GUI-thread time for sync decode + scale vs threaded scaled decode, LRU hit."""
+    app = qapp()
+    from PyQt5.QtCore import Qt
+    from PyQt5.QtGui import QPixmap, QPixmapCache
+    from crosshair_app.settings import SettingsPanel, WallpaperCache
+    w, h = SettingsPanel.W, SettingsPanel.H
+    path = WallpaperCache.path("midnight")
+
+    def sync():
+        QPixmapCache.clear()  # QPixmap(path) would otherwise hit Qt's own cache
+        QPixmap(path).scaled(w, h, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+
+    old = timeit(sync, number=5, repeat=3)
+
+    # GUI thread only pays for get() (starts the worker) and _store()
+    gui, total = [], []
+    for _ in range(5):
+        cache = WallpaperCache()
+        store, spent = cache._store, []
+
+        def timed_store(key, image, store=store, spent=spent):
+            start = time.perf_counter()
+            store(key, image)
+            spent.append(time.perf_counter() - start)
+
+        cache._decoded.disconnect()
+        cache._decoded.connect(timed_store)
+        start = time.perf_counter()
+        cache.get("midnight", w, h)
+        spent.append(time.perf_counter() - start)
+        while cache.get("midnight", w, h) is None:
+            app.processEvents()
+            time.sleep(0.001)  # An idle event loop, not a busy one
+        total.append(time.perf_counter() - start)
+        gui.append(sum(spent))
+    hit = timeit(lambda: cache.get("midnight", w, h), number=10000)
+    print(f"  sync load+scale {old / 1000:6.1f} ms on the GUI thread")
+    print(f"  threaded        {min(gui) * 1000:6.1f} ms on the GUI thread "
+          f"({min(total) * 1000:5.1f} ms until shown)   cache hit {hit:5.2f} us")
+
+
+@bench
+def bench_panel_repaint():
+    """Settings window repaint (drag/hover): background painted per repaint vs cached blit."""
+    app = qapp()
+    from PyQt5.QtGui import QImage, QPainter
+    from crosshair_app.config import Config
+    from crosshair_app.overlay import OverlayManager
+    from crosshair_app.settings import SettingsPanel
+    config = Config()
+    panel = SettingsPanel(config, OverlayManager(config))
+    panel.show()
+    while panel._bg_image is None:  # Wallpaper decodes on a worker thread
+        app.processEvents()
+        time.sleep(0.001)
+    app.processEvents()
+
+    def uncached(event):  # The old paintEvent: clip, wallpaper, overlay on every repaint
+        p = QPainter(panel)
+        panel._paint_background(p)
+        p.end()
+
+    target = QImage(panel.size(), QImage.Format_ARGB32_Premultiplied)
+
+    def background_only(paint):
+        p = QPainter(target)
+        paint(p)
+        p.end()
+
+    bg_old = timeit(lambda: background_only(panel._paint_background), number=200)
+    def blit(p):  # What paintEvent does now
+        p.setCompositionMode(QPainter.CompositionMode_Source)
+        p.drawPixmap(0, 0, panel._background())
+
+    bg_new = timeit(lambda: background_only(blit), number=200)
+    cached = panel.paintEvent
+    panel.paintEvent = uncached
+    window_old = timeit(panel.repaint, number=100)
+    panel.paintEvent = cached
+    window_new = timeit(panel.repaint, number=100)
+    panel.hide()
+    print(f"  background   per repaint {bg_old:7.1f} us   cached blit {bg_new:7.1f} us "
+          f"({bg_old / bg_new:.1f}x)")
+    print(f"  whole window per repaint {window_old:7.1f} us   cached      {window_new:7.1f} us")
+
+
+@bench
+def bench_preview():
+    """Settings preview: paint cost (grid + vector crosshair vs cached grid + sprite), slider coalescing."""
+    app = qapp()
+    from PyQt5.QtCore import Qt
+    from PyQt5.QtGui import QColor, QImage, QPainter, QPen
+    from crosshair_app.config import Config, CrosshairSnapshot
+    from crosshair_app.crosshair import CrosshairRenderer
+    from crosshair_app.overlay import OverlayManager
+    from crosshair_app.settings import CrosshairPreview, SettingsPanel
+    config = Config()
+    overlay = OverlayManager(config)
+    crosshair = CrosshairSnapshot(style="crosscircle", size=40, gap=6)
+    image = QImage(150, 150, QImage.Format_ARGB32_Premultiplied)
+    renderer = CrosshairRenderer()
+
+    def old_paint():  # The previous paintEvent, verbatim
+        image.fill(Qt.transparent)
+        p = QPainter(image)
+        p.setRenderHint(QPainter.Antialiasing)
+        p.setBrush(QColor(8, 8, 22))
+        p.setPen(QPen(QColor(50, 60, 100, 60), 1))
+        p.drawRoundedRect(0, 0, 149, 149, 10, 10)
+        p.setPen(QPen(QColor(25, 25, 45), 1))
+        for i in range(0, 150, 20):
+            p.drawLine(i, 0, i, 150)
+            p.drawLine(0, i, 150, i)
+        renderer.draw(p, 75, 75, crosshair._asdict())
+        p.end()
+
+    preview = CrosshairPreview(overlay)
+    preview.set_setup(crosshair)
+
+    def new_paint():
+        image.fill(Qt.transparent)
+        preview.render(image)
+
+    old = timeit(old_paint, number=500)
+    new = timeit(new_paint, number=500)
+    print(f"  paint: grid + vector {old:6.1f} us   cached grid + sprite {new:6.1f} us "
+          f"({old / new:.1f}x)")
+
+    # A fast slider drag: 96 value changes inside ~one event loop burst
+    panel = SettingsPanel(config, overlay)
+    updates = []
+    panel._preview_timer.timeout.connect(lambda: updates.append(1))
+    for value in range(4, 100):
+        panel.slider_size.setValue(value)
+        app.processEvents()
+    while panel._preview_timer.isActive():
+        app.processEvents()
+    print(f"  slider drag: 96 value changes -> {len(updates)} preview updates "
+          f"(frame {panel._preview_timer.interval()} ms)")
+
+
+@bench
+def bench_language():
+    """Language switch with every tab built: in-place retranslation vs rebuilding the panel."""
+    import itertools
+    import tracemalloc
+    qapp()
+    from crosshair_app.config import Config
+    from crosshair_app.overlay import OverlayManager
+    from crosshair_app.settings import SettingsPanel
+    config = Config()
+    config.save = lambda: None
+    overlay = OverlayManager(config)
+
+    def full_panel():
+        panel = SettingsPanel(config, overlay)
+        for i in range(panel.tabs.count()):
+            panel._ensure_tab(i)
+        return panel
+
+    panel = full_panel()
+    langs = itertools.cycle((1, 0))  # EN, RU, ...
+    switch = timeit(lambda: panel.combo_lang.setCurrentIndex(next(langs)), number=20, repeat=3)
+    tracemalloc.start()
+    panel.combo_lang.setCurrentIndex(next(langs))
+    switch_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    rebuild = timeit(lambda: full_panel().deleteLater(), number=3, repeat=3)
+    print(f"  retranslate {switch / 1000:6.2f} ms (peak {switch_peak / 1024:5.0f} KiB)   "
+          f"rebuild all tabs {rebuild / 1000:6.1f} ms")
+
+
+@bench
+def bench_panel_style():
+    """Panel styling: construction with every tab, theme switch and status label flips (setStyleSheet vs properties)."""
+    import itertools
+    app = qapp()
+    from crosshair_app.config import Config
+    from crosshair_app.overlay import OverlayManager
+    from crosshair_app.settings import THEME_SWATCHES, SettingsPanel, _set_state
+    config = Config()
+    config.save = lambda: None
+    overlay = OverlayManager(config)
+
+    def full_panel():
+        panel = SettingsPanel(config, overlay)
+        for i in range(panel.tabs.count()):
+            panel._ensure_tab(i)
+        panel.show()
+        app.processEvents()  # Polish happens on show
+        return panel
+
+    build = timeit(lambda: full_panel().deleteLater(), number=3, repeat=3)
+    print(f"  construct + polish, all tabs: {build / 1000:6.1f} ms")
+
+    panel = full_panel()
+    themes = itertools.cycle(THEME_SWATCHES)
+
+    def old_theme_buttons():  # The previous _update_theme_buttons, verbatim
+        theme = next(themes)
+        for key, btn in panel.theme_buttons.items():
+            active = key == theme
+            btn.setObjectName("themeBtnActive" if active else "themeBtn")
+            if not active:
+                btn.setStyleSheet(
+                    f"QPushButton {{ background: {THEME_SWATCHES[key]};"
+                    f"border: 1px solid rgba(80,100,180,40); border-radius: 8px;"
+                    f"color: #a0a8c0; font-size: 13px; padding: 6px 10px; }}"
+                    f"QPushButton:hover {{ border-color: #00d4ff; color: #d0d8f0; }}"
+                )
+            else:
+                btn.setStyleSheet(
+                    f"QPushButton {{ background: rgba(0,160,220,30);"
+                    f"border: 2px solid rgba(0,212,255,200); border-radius: 8px;"
+                    f"color: #00d4ff; font-weight: 700; font-size: 13px; padding: 6px 10px; }}"
+                )
+
+    old = timeit(lambda: (old_theme_buttons(), app.processEvents()), number=50, repeat=3)
+    for btn in panel.theme_buttons.values():
+        btn.setStyleSheet("")
+        btn.setObjectName("themeBtn")
+
+    def new_theme_buttons():
+        panel._theme = next(themes)
+        panel._update_theme_buttons()
+
+    new = timeit(lambda: (new_theme_buttons(), app.processEvents()), number=50, repeat=3)
+    print(f"  theme buttons: setStyleSheet {old:7.1f} us   properties {new:6.1f} us "
+          f"({old / new:.0f}x)")
+
+    label = panel._games_label
+    found = itertools.cycle((True, False))
+    sheets = {True: "color: #80e0a0; font-size: 14px; padding: 4px;",
+              False: "color: #a0a8c0; font-size: 13px; padding: 4px;"}
+    old = timeit(lambda: (label.setStyleSheet(sheets[next(found)]), app.processEvents()),
+                 number=200, repeat=3)
+    label.setStyleSheet("")
+    new = timeit(lambda: (_set_state(label, "found", next(found)), app.processEvents()),
+                 number=200, repeat=3)
+    print(f"  games label flip: setStyleSheet {old:7.1f} us   property {new:6.1f} us "
+          f"({old / new:.0f}x)")
+    panel.close()
+    overlay.shutdown()
+
+@bench
+def bench_live_apply():
+    """Live apply during a 1 s slider drag: GUI cost per frame, edit-to-overlay latency, disk writes."""
+    app = qapp()
+    from crosshair_app.config import Config
+    from crosshair_app.overlay import OverlayManager
+    from crosshair_app.settings import SettingsPanel
+    config = Config()
+    overlay = OverlayManager(config)
+    panel = SettingsPanel(config, overlay)
+    panel.chk_live.setChecked(True)
+    config.flush()
+
+    writes = []
+    write = config._write
+    config._write = lambda: (writes.append(1), write())
+    flushes = []
+    flush = panel._flush_params
+
+    def timed_flush():
+        start = time.perf_counter()
+        flush()
+        flushes.append(time.perf_counter() - start)
+
+    panel._preview_timer.timeout.disconnect()
+    panel._preview_timer.timeout.connect(timed_flush)
+    reconfigured = []
+    config.subscribe(lambda change: reconfigured.append(time.perf_counter()), "crosshair")
+
+    edits, latencies = 0, []
+    start = time.perf_counter()
+    while time.perf_counter() - start < 1.0:  # 4 value changes per frame, like a fast drag
+        edited = time.perf_counter()
+        seen = len(reconfigured)
+        for _ in range(4):
+            panel.slider_size.setValue(4 + edits % 96)
+            edits += 1
+        while len(reconfigured) == seen:
+            app.processEvents()
+        latencies.append(reconfigured[-1] - edited)
+    drag_writes = len(writes)
+    time.sleep(config.SAVE_DELAY + 0.2)
+    config._write = write
+    latencies.sort()
+    print(f"  {edits} value changes -> {len(reconfigured)} overlay updates, "
+          f"push {sum(flushes) / len(flushes) * 1e6:5.0f} us/frame")
+    print(f"  edit -> overlay: median {latencies[len(latencies) // 2] * 1000:5.1f} ms   "
+          f"max {latencies[-1] * 1000:5.1f} ms (frame {panel._preview_timer.interval()} ms)")
+    print(f"  disk writes: {drag_writes} during the drag, {len(writes)} after it settled")
+
+
+def main():
+    names = sys.argv[1:] or list(BENCHES)
+    failed = []
+    for name in names:
+        fn = BENCHES.get(name)
+        if fn is None:
+            print(f"[!] Unknown benchmark: {name} (available: {', '.join(BENCHES)})")
+            sys.exit(1)
+        print(f"[*] {name} — {fn.__doc__}")
+        if fn() is False:  # Benches with budgets return False when one is exceeded
+            failed.append(name)
+        print()
+    if failed:
+        print(f"[!] Over budget: {', '.join(failed)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
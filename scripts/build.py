@@ -41,9 +41,19 @@ def build():
         "--hidden-import", "crosshair_app.overlay",
         "--hidden-import", "crosshair_app.settings",
         "--hidden-import", "crosshair_app.config",
+        "--hidden-import", "crosshair_app.profiles",
+        "--hidden-import", "crosshair_app.packs",
+        "--hidden-import", "crosshair_app.sharecode",
+        "--hidden-import", "crosshair_app.bulk",
+        "--hidden-import", "crosshair_app.library",
+        "--hidden-import", "crosshair_app.history",
+        "--hidden-import", "crosshair_app.schema",
+        "--hidden-import", "crosshair_app.prefetch",
         "--hidden-import", "crosshair_app.crosshair",
         "--hidden-import", "crosshair_app.animations",
         "--hidden-import", "crosshair_app.i18n",
+        "--hidden-import", "crosshair_app.games",
+        "--hidden-import", "crosshair_app.startup",
         # Optimize: strip debug, exclude heavy unused modules
         "--exclude-module", "matplotlib",
         "--exclude-module", "numpy",